@@ -4,7 +4,7 @@ Apache HTTP Server Module
 Service management module for Apache web server.
 """
 
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, Iterator, List, Optional, Any, Tuple
 from services.base_service import BaseService, ServiceType
 import logging
 
@@ -88,7 +88,11 @@ class ApacheService(BaseService):
             return json.loads(output)
         except:
             return []
-    
+
+    def iter_vhosts(self) -> Iterator[Dict[str, Any]]:
+        """Vhost kayıtlarını tek tek üret - UI satırları geldikçe ekler"""
+        yield from self.list_vhosts()
+
     def create_vhost(self, server_name: str, document_root: str, 
                      ssl: bool = False, ssl_cert: Optional[str] = None, 
                      ssl_key: Optional[str] = None, php_version: Optional[str] = None) -> Tuple[bool, str]:
@@ -7,10 +7,19 @@ Service management module for MySQL database server.
 from typing import Dict, List, Optional, Any, Tuple
 from services.base_service import BaseService, ServiceType
 import subprocess
+import threading
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Opsiyonel bağımlılık: mysql-connector-python
+# Varsa kalıcı client bağlantısı kullanılır, yoksa script tabanlı yol çalışır
+try:
+    import mysql.connector
+    MYSQL_CONNECTOR_AVAILABLE = True
+except ImportError:
+    MYSQL_CONNECTOR_AVAILABLE = False
+
 # Simple translation function - using English for now
 def _(text):
     """Simple translation function"""
@@ -21,7 +30,15 @@ class MySQLService(BaseService):
     """MySQL Database Server service management"""
     
     SCRIPT_NAME = 'mysql.sh'
-    
+
+    def __init__(self, platform_manager):
+        super().__init__(platform_manager)
+        # Kalıcı mysql.connector bağlantısı - her sorgu için fork+exec+auth
+        # handshake ödememek için açık tutulur. Bağlantı thread-safe
+        # değildir; UI iki ayrı havuzdan çağırdığı için kilit şart
+        self._conn = None
+        self._conn_lock = threading.Lock()
+
     @property
     def name(self) -> str:
         return "mysql"
@@ -118,14 +135,72 @@ class MySQLService(BaseService):
     def disable(self) -> Tuple[bool, str]:
         return self._execute_script(self.SCRIPT_NAME, 'disable', timeout=30)
 
+    # ==================== PERSISTENT CONNECTION ====================
+
+    def _get_connection(self):
+        """Kalıcı mysql.connector bağlantısını döndür (kullanılamıyorsa None)
+
+        Bağlantı kopmuşsa ping(reconnect=True) ile tazelenir. Connector
+        kurulu değilse veya kayıtlı root şifresi yoksa None döner ve
+        çağıranlar script tabanlı yola düşer. Çağıran _conn_lock'u
+        tutmalı ve cursor işini kilit altında bitirmelidir.
+        """
+        if not MYSQL_CONNECTOR_AVAILABLE:
+            return None
+
+        password = self._get_saved_root_password()
+        if not password:
+            return None
+
+        try:
+            if self._conn is None:
+                self._conn = mysql.connector.connect(
+                    user='root',
+                    password=password,
+                    unix_socket='/var/run/mysqld/mysqld.sock'
+                )
+            else:
+                self._conn.ping(reconnect=True, attempts=2)
+            return self._conn
+        except Exception as e:
+            logger.warning(f"MySQL bağlantısı kurulamadı: {e}")
+            self._conn = None
+            return None
+
+    def _close_connection(self) -> None:
+        """Kalıcı bağlantıyı kapat (şifre değişince eski auth geçersiz)"""
+        with self._conn_lock:
+            if self._conn is not None:
+                try:
+                    self._conn.close()
+                except Exception:
+                    pass
+                self._conn = None
+
     # ==================== DATABASE MANAGEMENT METHODS ====================
-    
+
     def get_databases(self, root_password: str = "") -> Tuple[bool, List[str]]:
         """Get list of databases"""
+        # Kalıcı bağlantı varsa tek sorgu yeter
+        with self._conn_lock:
+            conn = self._get_connection()
+            if conn is not None:
+                try:
+                    cursor = conn.cursor()
+                    cursor.execute("SHOW DATABASES")
+                    # Sistem şemaları script'in database-list çıktısında da yok
+                    system_schemas = ('mysql', 'sys', 'information_schema', 'performance_schema')
+                    databases = [row[0] for row in cursor.fetchall()
+                                 if row[0] not in system_schemas]
+                    cursor.close()
+                    return True, databases
+                except Exception as e:
+                    logger.warning(f"SHOW DATABASES başarısız, script'e düşülüyor: {e}")
+
         # Use saved password if not provided
         if not root_password:
             root_password = self._get_saved_root_password()
-            
+
         args = ['database-list', '--json']
         if root_password:
             args.extend(['--root-password', root_password])
@@ -141,21 +216,46 @@ class MySQLService(BaseService):
     
     def create_database(self, database_name: str, root_password: str = "", sudo_password: str = "") -> Tuple[bool, str]:
         """Create a new database"""
+        # Kalıcı bağlantı varsa subprocess'e hiç gitme
+        if not sudo_password:
+            with self._conn_lock:
+                conn = self._get_connection()
+                if conn is not None:
+                    try:
+                        cursor = conn.cursor()
+                        cursor.execute("CREATE DATABASE `{}`".format(database_name.replace('`', '``')))
+                        cursor.close()
+                        return True, _("Database created successfully")
+                    except Exception as e:
+                        return False, str(e)
+
         # Use saved password if not provided
         if not root_password:
             root_password = self._get_saved_root_password()
-            
+
         args = ['database-create', database_name]
         if root_password:
             args.append(root_password)
         return self._execute_script_with_sudo(self.SCRIPT_NAME, args, sudo_password, timeout=30)
-    
+
     def drop_database(self, database_name: str, root_password: str = "", sudo_password: str = "") -> Tuple[bool, str]:
         """Drop a database"""
+        if not sudo_password:
+            with self._conn_lock:
+                conn = self._get_connection()
+                if conn is not None:
+                    try:
+                        cursor = conn.cursor()
+                        cursor.execute("DROP DATABASE `{}`".format(database_name.replace('`', '``')))
+                        cursor.close()
+                        return True, _("Database dropped successfully")
+                    except Exception as e:
+                        return False, str(e)
+
         # Use saved password if not provided
         if not root_password:
             root_password = self._get_saved_root_password()
-            
+
         args = ['database-drop', database_name]
         if root_password:
             args.append(root_password)
@@ -165,10 +265,23 @@ class MySQLService(BaseService):
     
     def create_user(self, username: str, password: str, host: str = 'localhost', root_password: str = "", sudo_password: str = "") -> Tuple[bool, str]:
         """Create a new MySQL user"""
+        # Kalıcı bağlantı varsa parametre bağlama ile tek sorgu
+        if not sudo_password:
+            with self._conn_lock:
+                conn = self._get_connection()
+                if conn is not None:
+                    try:
+                        cursor = conn.cursor()
+                        cursor.execute("CREATE USER %s@%s IDENTIFIED BY %s", (username, host, password))
+                        cursor.close()
+                        return True, _("User created successfully")
+                    except Exception as e:
+                        return False, str(e)
+
         # Use saved password if not provided
         if not root_password:
             root_password = self._get_saved_root_password()
-            
+
         args = ['user-create', username, password, host]
         if root_password:
             args.append(root_password)
@@ -178,7 +291,27 @@ class MySQLService(BaseService):
         """Get list of MySQL users"""
         if not self.is_running():
             return False, []
-            
+
+        # Kalıcı bağlantı varsa subprocess yerine direkt sorgu
+        with self._conn_lock:
+            conn = self._get_connection()
+            if conn is not None:
+                try:
+                    cursor = conn.cursor()
+                    cursor.execute(
+                        "SELECT User, Host FROM mysql.user "
+                        "WHERE User != '' AND User != 'mysql.session' AND User != 'mysql.sys' "
+                        "ORDER BY User"
+                    )
+                    users = [
+                        {'username': row[0], 'host': row[1], 'full_name': f"{row[0]}@{row[1]}"}
+                        for row in cursor.fetchall()
+                    ]
+                    cursor.close()
+                    return True, users
+                except Exception as e:
+                    logger.warning(f"Kullanıcı sorgusu başarısız, script'e düşülüyor: {e}")
+
         saved_password = self._get_saved_root_password()
         if not saved_password:
             return False, []
@@ -227,15 +360,18 @@ class MySQLService(BaseService):
         success, output = self._execute_script(self.SCRIPT_NAME, *args, timeout=30)
         if success:
             self._save_root_password(new_password)
-        
+            # Eski auth ile açılmış bağlantı artık geçersiz
+            self._close_connection()
+
         return success, output
-    
+
     def reset_root_password(self, new_password: str) -> Tuple[bool, str]:
         """Reset root password without knowing current password"""
         success, output = self._execute_script(self.SCRIPT_NAME, 'reset-root-password', new_password, timeout=60)
         if success:
             self._save_root_password(new_password)
-        
+            self._close_connection()
+
         return success, output
     
     def run_mysql_secure_installation(self) -> Tuple[bool, str]:
@@ -320,6 +456,70 @@ class MySQLService(BaseService):
         except:
             return {'installed': self.is_installed(), 'running': self.is_running(), 'databases_count': 0}
     
+    def get_mysql_status_bundle(self) -> Dict[str, Any]:
+        """Get MySQL status info with a single mysql session
+
+        get_mysql_status_info() versiyon, database listesi ve kullanıcı
+        listesi için ayrı ayrı mysql/script çağrıları yapar; her çağrı
+        fork + auth handshake öder. Kayıtlı root şifresi varsa hepsini
+        tek `mysql --batch` oturumunda toplar. Şifre yoksa (Unix socket
+        auth) veya sorgu başarısız olursa eski yola düşer.
+        """
+        saved_password = self._get_saved_root_password()
+        if not saved_password or not self.is_running():
+            return self.get_mysql_status_info()
+
+        query = (
+            "SELECT CONCAT('##VERSION##', VERSION());"
+            "SELECT CONCAT('##DB##', schema_name) FROM information_schema.schemata "
+            "WHERE schema_name NOT IN ('mysql', 'sys', 'information_schema', 'performance_schema');"
+            "SELECT CONCAT('##USER##', User, '@', Host) FROM mysql.user "
+            "WHERE User != '' AND User != 'mysql.session' AND User != 'mysql.sys' ORDER BY User;"
+        )
+        socket_path = "/var/run/mysqld/mysqld.sock"
+        cmd = [
+            'mysql', '-u', 'root', f'-p{saved_password}',
+            f'--socket={socket_path}', '-N', '-B', '-e', query
+        ]
+
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+        except Exception as e:
+            logger.error(f"MySQL bundle query error: {e}")
+            return self.get_mysql_status_info()
+
+        if result.returncode != 0:
+            logger.error(f"MySQL bundle query failed: {result.stderr}")
+            return self.get_mysql_status_info()
+
+        version = 'Unknown'
+        databases: List[str] = []
+        users: List[Dict[str, Any]] = []
+        for line in result.stdout.splitlines():
+            line = line.strip()
+            if line.startswith('##VERSION##'):
+                version = line[len('##VERSION##'):]
+            elif line.startswith('##DB##'):
+                databases.append(line[len('##DB##'):])
+            elif line.startswith('##USER##'):
+                full_name = line[len('##USER##'):]
+                username, _sep, host = full_name.partition('@')
+                users.append({'username': username, 'host': host, 'full_name': full_name})
+
+        return {
+            'installed': True,
+            'running': True,
+            'version': version,
+            'root_password': saved_password,
+            'auth_method': 'Password Auth',
+            # Sorgu başarılıysa root erişimi kanıtlanmış demektir
+            'root_access': True,
+            'databases_count': len(databases),
+            'databases': databases,
+            'users_count': len(users),
+            'users': users,
+        }
+
     def _get_saved_root_password(self) -> str:
         """Get saved root password from local storage"""
         try:
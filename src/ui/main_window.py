@@ -7,17 +7,445 @@ GTK4/Libadwaita tabanlı ana uygulama penceresi.
 import gi
 gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
-from gi.repository import Gtk, Adw, GLib, Gio
+from gi.repository import Gtk, Adw, GLib, Gio, GObject, Gdk
+import functools
 import logging
-import os
+import shutil
+import socket
 import subprocess
+import sys
+import traceback
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from src.utils.i18n import get_i18n
 
 logger = logging.getLogger(__name__)
 
+# Script klasörü - import sırasında bir kez çözülür
+SCRIPTS_DIR = Path(__file__).resolve().parents[2] / 'scripts'
+
 # Çeviri fonksiyonu
 _ = get_i18n().get_translator()
 
+# Servis listesi için hazır durum markup'ları - her row'da string kurmamak için
+_STATUS_MARKUP = {
+    "running": "<span foreground='#26a269'>● Running</span>",
+    "stopped": "<span foreground='#c01c28'>● Stopped</span>",
+    "not_installed": "<span foreground='#9a9996'>● Not Installed</span>",
+}
+_STATUS_MARKUP_DEFAULT = "<span foreground='#9a9996'>● Unknown</span>"
+
+# Bellekte tutulacak maksimum detay sayfası sayısı (LRU)
+_DETAIL_CACHE_MAX = 8
+
+# Servis durumu -> (etiket, css sınıfı); her yenilemede string
+# karşılaştırma zinciri yerine tek dict lookup
+_STATUS_PRESENTATION = {
+    'running': ("🟢 Running", "success"),
+    'stopped': ("🔴 Stopped", "warning"),
+    'not_installed': ("❌ Not Installed", "error"),
+}
+_STATUS_PRESENTATION_DEFAULT = ("⚪ Unknown", None)
+
+# MySQL root erişim sunumu: anahtar -> (sembolik ikon, etiket,
+# emoji'li etiket, css). İki ayrı cascade tek tablodan beslenir ve
+# birbirinden sapamaz.
+_MYSQL_AUTH_MAP = {
+    'sudo': ("channel-secure-symbolic", _("Unix Socket (sudo)"),
+             "🔓 Unix Socket (sudo)", "success"),
+    'password': ("dialog-password-symbolic", _("Password Auth"),
+                 "🔐 Password Auth", "success"),
+    'denied': ("changes-prevent-symbolic", _("Access Denied"),
+               "🔒 Access Denied", "error"),
+}
+
+
+def _mysql_auth_key(mysql_info):
+    """_MYSQL_AUTH_MAP anahtarını bundle'dan türet"""
+    if not mysql_info.get('root_access', False):
+        return 'denied'
+    if mysql_info.get('auth_method') == 'Unix Socket (sudo mysql)':
+        return 'sudo'
+    return 'password'
+
+
+# Terminal emülatörü başına argv kalıbı - kabuk satırı tek parametre
+# olarak geçer, tırnak kaçırma derdi yok
+_TERMINAL_CMDS = {
+    'gnome-terminal': lambda line: ['gnome-terminal', '--', 'bash', '-c', line],
+    'konsole': lambda line: ['konsole', '-e', 'bash', '-c', line],
+    'xfce4-terminal': lambda line: ['xfce4-terminal', '-x', 'bash', '-c', line],
+    'xterm': lambda line: ['xterm', '-e', 'bash', '-c', line],
+}
+
+# Sabit markup parçaları - satır başına f-string kurmak yerine önceden
+# hazırlanmış açılış/kapanış etiketleriyle ucuz birleştirme
+_SMALL_OPEN = "<span size='9000'>"
+_SMALL_BOLD_OPEN = "<span size='9000' weight='700'>"
+_TITLE_OPEN = "<span size='11000' weight='bold'>"
+_SPAN_CLOSE = "</span>"
+
+# a2ensite/a2dissite akışını destekleyen Debian tabanlı dağıtımlar
+_DEB_OSES = frozenset(('ubuntu', 'debian'))
+
+
+def _os_type_for(service):
+    """service.platform_manager.os_type.value - servis başına bir kez çözülür"""
+    value = getattr(service, '_cached_os_type', None)
+    if value is None:
+        value = service.platform_manager.os_type.value
+        service._cached_os_type = value
+    return value
+
+
+@functools.lru_cache(maxsize=64)
+def _icon_paintable(name):
+    """İkon adını temadan bir kez çöz, paintable'ı cache'le"""
+    theme = Gtk.IconTheme.get_for_display(Gdk.Display.get_default())
+    return theme.lookup_icon(name, None, 16, 1, Gtk.TextDirection.NONE, 0)
+
+
+def _icon(name):
+    """Cache'lenmiş paintable'dan ucuz Gtk.Image üret
+
+    Gtk.Image.new_from_icon_name her çağrıda tema araması yapar;
+    burada arama maliyeti rebuild'ler arasında amortize edilir.
+    """
+    img = Gtk.Image()
+    img.set_from_paintable(_icon_paintable(name))
+    return img
+
+
+class _S:
+    """Detay sayfası kurulumunda kullanılan statik çeviriler
+
+    `_()` çağrısı her rebuild'de gettext sözlüğüne gider; bu sınıf
+    import sırasında bir kez çözer, builder'lar attribute okur.
+    """
+    CANCEL = _("Cancel")
+    DELETE = _("Delete")
+    CREATE = _("Create")
+    OK = _("OK")
+    STATUS = _("Status")
+    PORT = _("Port")
+    TYPE = _("Type")
+    ACTIONS = _("Actions")
+    STOP_SERVICE = _("Stop Service")
+    STOP_SUBTITLE = _("Stop the running service")
+    RESTART_SERVICE = _("Restart Service")
+    RESTART_SUBTITLE = _("Restart the service")
+    START_SERVICE = _("Start Service")
+    START_SUBTITLE = _("Start the service")
+    UNINSTALL = _("Uninstall")
+    UNINSTALL_SUBTITLE = _("Remove this service from your system")
+    INSTALL = _("Install")
+    INSTALL_SUBTITLE = _("Install this service and its dependencies")
+    CONFIGURATION = _("Configuration")
+    CONFIGURATION_SOON = _("Configuration options coming soon")
+    LOGS = _("Logs")
+    LOGS_SOON = _("Log viewer coming soon")
+    ERROR = _("Error")
+    ENABLED = _("Enabled")
+    DISABLED = _("Disabled")
+    NONE = _("None")
+    # MySQL
+    MYSQL_MANAGEMENT = _("MySQL Management")
+    CHANGE_ROOT_PASSWORD = _("Change Root Password")
+    CHANGE_ROOT_PASSWORD_SUBTITLE = _("Set or change MySQL root password")
+    # PHP
+    PHP_VERSION_MANAGEMENT = _("PHP Version Management")
+    ACTIVE_VERSION = _("Active Version")
+    INSTALLED_VERSIONS = _("Installed Versions")
+    AVAILABLE_VERSIONS = _("Available Versions")
+    VERSION_ACTIONS = _("Version Actions")
+    INSTALL_NEW_VERSION = _("Install New Version")
+    INSTALL_NEW_VERSION_SUBTITLE = _("Install additional PHP version")
+    SWITCH_VERSION = _("Switch Version")
+    SWITCH_VERSION_SUBTITLE = _("Change active PHP version")
+    UNINSTALL_VERSION = _("Uninstall Version")
+    UNINSTALL_VERSION_SUBTITLE = _("Remove a PHP version")
+    EXTENSIONS = _("Extensions")
+    INSTALLED_EXTENSIONS = _("Installed Extensions")
+    INSTALL_EXTENSION = _("Install Extension")
+    INSTALL_EXTENSION_SUBTITLE = _("Install a PHP extension")
+    MANAGE_EXTENSIONS = _("Manage Extensions")
+    MANAGE_EXTENSIONS_SUBTITLE = _("View and uninstall extensions")
+    CONFIGURATION_FILE = _("Configuration File")
+    MEMORY_LIMIT = _("Memory Limit")
+    UPLOAD_MAX_SIZE = _("Upload Max Size")
+    PHP_INFORMATION = _("PHP Information")
+    # Apache
+    APACHE_MODULES = _("Apache Modules")
+    APACHE_MODULES_SUBTITLE = _("Manage Apache modules (enable/disable)")
+    MANAGE_MODULES = _("Manage Modules")
+    MANAGE_MODULES_SUBTITLE = _("Enable or disable Apache modules")
+    TOTAL_MODULES = _("Total Modules")
+    SWITCH = _("Switch")
+    ENABLED_LOWER = _("enabled")
+    PHP_MODULES = _("PHP Modules")
+    PHP_MODULES_SUBTITLE = _("Manage PHP Apache modules (install/switch/remove)")
+    ACTIVE_PHP_MODULE = _("Active PHP Apache Module")
+    INSTALLED_PHP_MODULES = _("Installed PHP Modules")
+    SWITCH_PHP_MODULE = _("Switch PHP Module")
+    SWITCH_PHP_MODULE_SUBTITLE = _("Change active PHP Apache module")
+    INSTALL_PHP_MODULE = _("Install PHP Module")
+    INSTALL_PHP_MODULE_VERSION_SUBTITLE = _("Install PHP Apache module for a specific version")
+    INSTALL_PHP_MODULE_SUBTITLE = _("Install PHP Apache module")
+    UNINSTALL_PHP_MODULE = _("Uninstall PHP Module")
+    UNINSTALL_PHP_MODULE_SUBTITLE = _("Remove a PHP Apache module")
+    SSL_CERTIFICATES = _("SSL Certificates")
+    CREATE_CERTIFICATE = _("Create Self-Signed Certificate")
+    CREATE_CERTIFICATE_SUBTITLE = _("Generate SSL certificate for a domain")
+    VIRTUAL_HOSTS = _("Virtual Hosts")
+    CREATE_VHOST = _("Create Virtual Host")
+    CREATE_VHOST_SUBTITLE = _("Add a new website configuration")
+    EXISTING_VHOSTS = _("Existing Virtual Hosts")
+    SERVICE_DETAILS = _("Service Details")
+    LOADING = _("Loading...")
+    CLOSE = _("Close")
+
+
+class VersionItem(GObject.Object):
+    """Sürüm seçici modelinin bir kaydı (Gio.ListStore elemanı)
+
+    badge: None, '(Active)' etiketi için 'active' ya da yeşil onay
+    ikonu için 'check'.
+    """
+
+    def __init__(self, version, badge=None):
+        super().__init__()
+        self.version = version
+        self.badge = badge
+
+
+class VhostItem(GObject.Object):
+    """Vhost listesi modelinin bir kaydı (Gio.ListStore elemanı)
+
+    Başlık ve alt başlık bir kez burada hesaplanır; ListView'in bind
+    aşaması sadece hazır string'leri widget'a yazar.
+    """
+
+    filename = GObject.Property(type=str, default='')
+    server_name = GObject.Property(type=str, default='')
+    enabled = GObject.Property(type=bool, default=False)
+
+    # Rozet string'leri her kayıt için yeniden kurulmasın diye sabit
+    ENABLED_BADGE = "✅ Enabled"
+    DISABLED_BADGE = "❌ Disabled"
+    SSL_BADGE = "🔒 SSL"
+
+    @staticmethod
+    def _vhost_title(vhost):
+        """Başlığı seç ve .conf uzantısını at"""
+        title = vhost.get('server_name') or vhost.get('filename') or 'Unknown'
+        if title.endswith('.conf'):
+            title = title[:-5]
+        return title
+
+    def __init__(self, vhost):
+        super().__init__()
+        # Ham dict - vhost detay diyaloğu bunu kullanır
+        self.vhost = vhost
+        self.filename = vhost.get('filename', '') or ''
+        self.server_name = vhost.get('server_name', '') or ''
+        self.enabled = bool(vhost.get('enabled'))
+
+        title = self._vhost_title(vhost)
+        self.title = title
+
+        php_version = vhost.get('php_version', '')
+        parts = (
+            self.ENABLED_BADGE if self.enabled else self.DISABLED_BADGE,
+            self.SSL_BADGE if vhost.get('ssl') else None,
+            f"🐘 PHP {php_version}" if php_version else None,
+            self.filename if (self.filename and self.filename != title
+                              and not title.endswith('.conf')) else None,
+        )
+        self.subtitle = ' • '.join(p for p in parts if p)
+
+class ServiceItem(GObject.Object):
+    """Servis listesi modelinin bir kaydı (Gio.ListStore elemanı)
+
+    Widget'lar yerine hafif veri nesneleri saklanır; ListView fabrikası
+    görünür satır kadar widget kurar ve kaydırmada geri dönüştürür.
+    """
+
+    display_name = GObject.Property(type=str, default='')
+    status = GObject.Property(type=str, default='unknown')
+
+    def __init__(self, service, status):
+        super().__init__()
+        self.service = service
+        self.props.display_name = service.display_name
+        self.props.status = status
+        self.icon_name = service.icon_name
+        self.default_port = service.default_port
+        self.type_name = service.service_type.value.replace('_', ' ').title()
+        self.title_markup = (
+            _TITLE_OPEN + service.display_name + _SPAN_CLOSE
+        )
+        # Alt başlığın değişmeyen kuyruğu bir kez kurulur; durum
+        # değişince yalnızca baştaki durum parçası değişir
+        tail = ''
+        if self.default_port:
+            tail += f" • Port {self.default_port}"
+        self._subtitle_tail = tail + " • " + self.type_name + _SPAN_CLOSE
+        self._refresh_subtitle()
+        self.connect("notify::status", self._on_status_changed)
+
+    def _on_status_changed(self, obj, pspec):
+        self._refresh_subtitle()
+
+    def _refresh_subtitle(self):
+        self.subtitle_markup = (
+            _SMALL_OPEN
+            + _STATUS_MARKUP.get(self.props.status, _STATUS_MARKUP_DEFAULT)
+            + self._subtitle_tail
+        )
+
+
+# MySQL durum grubunun statik iskeleti - widget'ları Python'da tek tek
+# kurmak yerine GtkBuilder XML'i tek geçişte parse eder. Değişken
+# label'lar id ile alınıp sonradan doldurulur.
+_MYSQL_SECTION_UI = f"""\
+<?xml version="1.0" encoding="UTF-8"?>
+<interface>
+  <object class="AdwPreferencesGroup" id="mysql_info_group">
+    <property name="title">{_('MySQL Status')}</property>
+    <child>
+      <object class="AdwActionRow" id="root_access_row">
+        <property name="title">{_('Root Access')}</property>
+        <child>
+          <object class="GtkImage" id="root_status_icon"/>
+        </child>
+        <child>
+          <object class="GtkLabel" id="root_status_label">
+            <property name="label">…</property>
+          </object>
+        </child>
+      </object>
+    </child>
+    <child>
+      <object class="AdwActionRow" id="auth_row">
+        <property name="title">{_('Authentication Method')}</property>
+        <child>
+          <object class="GtkLabel" id="auth_label">
+            <property name="label">…</property>
+            <style><class name="monospace"/></style>
+          </object>
+        </child>
+      </object>
+    </child>
+    <child>
+      <object class="AdwActionRow" id="version_row">
+        <property name="title">{_('MySQL Version')}</property>
+        <child>
+          <object class="GtkLabel" id="version_label">
+            <property name="label">…</property>
+            <style><class name="monospace"/></style>
+          </object>
+        </child>
+      </object>
+    </child>
+    <child>
+      <object class="AdwActionRow" id="db_count_row">
+        <property name="title">{_('Databases')}</property>
+        <property name="subtitle">{_('Click to view database list')}</property>
+        <property name="activatable">True</property>
+        <child>
+          <object class="GtkLabel" id="db_count_label">
+            <property name="label">…</property>
+            <style><class name="monospace"/></style>
+          </object>
+        </child>
+      </object>
+    </child>
+    <child>
+      <object class="AdwActionRow" id="users_count_row">
+        <property name="title">{_('Users')}</property>
+        <property name="subtitle">{_('Click to view user list')}</property>
+        <property name="activatable">True</property>
+        <child>
+          <object class="GtkLabel" id="users_count_label">
+            <property name="label">…</property>
+            <style><class name="monospace"/></style>
+          </object>
+        </child>
+      </object>
+    </child>
+  </object>
+</interface>
+"""
+
+# Vhost detay diyaloğunun statik iskeleti - her açılışta ~15 widget'ı
+# setter setter kurmak yerine tek Builder parse'ı; yalnızca dinamik
+# subtitle'lar id üzerinden doldurulur.
+_VHOST_DETAIL_UI = f"""\
+<?xml version="1.0" encoding="UTF-8"?>
+<interface>
+  <object class="AdwDialog" id="dialog">
+    <property name="child">
+      <object class="AdwToolbarView">
+        <child type="top">
+          <object class="AdwHeaderBar">
+            <property name="show-title">True</property>
+          </object>
+        </child>
+        <property name="content">
+          <object class="GtkScrolledWindow">
+            <property name="vexpand">True</property>
+            <property name="hexpand">True</property>
+            <property name="min-content-width">500</property>
+            <property name="min-content-height">600</property>
+            <property name="child">
+              <object class="GtkBox" id="content_box">
+                <property name="orientation">vertical</property>
+                <property name="spacing">24</property>
+                <property name="margin-top">24</property>
+                <property name="margin-bottom">24</property>
+                <property name="margin-start">24</property>
+                <property name="margin-end">24</property>
+                <child>
+                  <object class="AdwPreferencesGroup" id="info_group">
+                    <property name="title">{_('Site Information')}</property>
+                    <child>
+                      <object class="AdwActionRow" id="name_row">
+                        <property name="title">{_('Server Name')}</property>
+                        <property name="subtitle">{_('Loading...')}</property>
+                      </object>
+                    </child>
+                    <child>
+                      <object class="AdwActionRow" id="docroot_row">
+                        <property name="title">{_('Document Root')}</property>
+                        <property name="subtitle">{_('Loading...')}</property>
+                      </object>
+                    </child>
+                    <child>
+                      <object class="AdwActionRow" id="ssl_row">
+                        <property name="title">{_('SSL/HTTPS')}</property>
+                        <property name="subtitle">{_('Loading...')}</property>
+                      </object>
+                    </child>
+                    <child>
+                      <object class="AdwActionRow" id="php_row">
+                        <property name="title">{_('PHP Version')}</property>
+                        <property name="subtitle">{_('Loading...')}</property>
+                      </object>
+                    </child>
+                  </object>
+                </child>
+              </object>
+            </property>
+          </object>
+        </property>
+      </object>
+    </property>
+  </object>
+</interface>
+"""
+
 
 class MainWindow(Adw.ApplicationWindow):
     """Ana uygulama penceresi"""
@@ -32,12 +460,98 @@ class MainWindow(Adw.ApplicationWindow):
         self.progress_dialog = None
         self.progress_bar = None
         self.progress_label = None
-        self.progress_timeout_id = None
+        self.progress_tick_id = None
         
         # Navigation state
         self.current_service = None
         self.main_stack = None
-        
+
+        # Detay sayfası cache'i (service.name -> widget, LRU sıralı)
+        self._detail_pages = OrderedDict()
+
+        # Servis introspeksiyon cache'i (service.name -> {key: (ts, value)})
+        # Detay sayfası her yeniden kurulduğunda aynı subprocess'leri
+        # tekrar tekrar çalıştırmamak için kısa TTL ile saklanır
+        self._info_cache = {}
+
+        # Bloklayan introspeksiyon çağrıları için worker havuzu;
+        # sonuçlar GLib.idle_add ile UI thread'ine döner
+        self._io_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='orkesta-io')
+
+        # Mutasyon yapan servis çağrıları (install/uninstall/switch...)
+        # ayrı dar bir havuzda koşar: kuyruk peş peşe tıklamaları
+        # sıraya dizer, apt/dpkg kilidi için yarışmazlar ve okuma
+        # worker'larını bloklamazlar
+        self._service_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='svc')
+
+        # Detay sayfası nesil sayacı - sayfa yeniden kurulduğunda eski
+        # worker sonuçlarının bayat widget'lara yazmasını engeller
+        self._detail_generation = 0
+
+        # Art arda gelen mutasyonların tek rebuild'de toplanması için
+        self._refresh_timeout_id = 0
+        self._reload_pending = False
+
+        # Create-vhost diyaloğu ilk kullanımda kurulup saklanır
+        self._create_vhost_dialog = None
+
+        # Apache modül diyaloglarının iskeletleri de açılışlar arasında saklanır;
+        # her açılışta sadece dinamik içerik tazelenir
+        self._modules_dialog = None
+        self._modules_toolbar_view = None
+        self._install_php_module_dialog = None
+        self._uninstall_php_module_dialog = None
+
+        # MySQL detayı görünürken auth kaymasını yakalayan poller
+        self._mysql_poll_id = None
+        self._mysql_poll_snapshot = None
+
+        # Sabit placeholder grupları tüm detay sayfalarınca paylaşılır
+        self._placeholder_groups = None
+
+        # Sayfa başına (row, handler, service) güçlü referansları:
+        # GC'nin bağlı handler'ları/GObject'leri erken toplamasına karşı
+        self._detail_refs = {}
+
+        # Son yerinde yenilemenin gözlemlenebilir imzası (servis başına)
+        self._detail_signatures = {}
+
+        # Sidebar sistem bilgisi ilk kurulumda bir kez toplanır
+        self._system_info_cache = None
+
+        # Yenilemeler arasında yeniden kullanılan liste kayıtları
+        # (service.name -> ServiceItem)
+        self._service_items = {}
+
+        # Sidebar henüz kurulmadan gelen istatistik güncellemeleri
+        # sessizce düşer; label'lar _create_sidebar'da bağlanır
+        self._stat_labels = {}
+
+        # Yerinde yenileme için detay sayfası widget referansları
+        # (service.name -> {status_label, stop_row, ...})
+        self._detail_widgets = {}
+
+        # Terminal emülatörü bir kez çözülür - handler'da başarısız
+        # exec denemeleri ve bare except zinciri yerine tek PATH taraması;
+        # komut kalıbı _TERMINAL_CMDS tablosundan gelir
+        self._terminal = next(
+            (t for t in _TERMINAL_CMDS if shutil.which(t)),
+            None
+        )
+
+        # Detay sayfalarının sık kullandığı ikonları şimdiden çözüp
+        # _icon_paintable cache'ine al - ilk sayfa kurulumunda ikon
+        # teması lookup maliyeti ödenmez
+        for icon_name in (
+            "media-playback-stop-symbolic", "media-playback-start-symbolic",
+            "view-refresh-symbolic", "user-trash-symbolic",
+            "document-save-symbolic", "dialog-password-symbolic",
+            "list-add-symbolic", "emblem-synchronizing-symbolic",
+            "go-next-symbolic",
+        ):
+            _icon_paintable(icon_name)
+
+
         # Pencere ayarları
         self.set_title("Orkesta")
         self.set_default_size(1000, 700)
@@ -51,10 +565,18 @@ class MainWindow(Adw.ApplicationWindow):
         # Servisleri yükle
         self._load_services()
     
+    # Display başına bir kez yüklenir; her pencere ayrı provider
+    # ekleyip CSS kaskadını şişirmesin
+    _css_loaded = False
+
     def _load_css(self):
-        """Custom CSS yükle"""
+        """Custom CSS yükle (display başına bir kez)"""
+        if MainWindow._css_loaded:
+            return
+        MainWindow._css_loaded = True
+
         css_provider = Gtk.CssProvider()
-        
+
         # CSS'i ekle
         Gtk.StyleContext.add_provider_for_display(
             self.get_display(),
@@ -95,9 +617,11 @@ class MainWindow(Adw.ApplicationWindow):
         split_view.set_max_sidebar_width(400)
         split_view.set_min_sidebar_width(320)
         
-        # Sidebar
-        sidebar = self._create_sidebar()
-        split_view.set_sidebar(sidebar)
+        # Sidebar: içerik ilk kareden sonra düşük öncelikli idle'da
+        # kurulur - pencere, sistem bilgisi toplanmadan önce çizilsin
+        self._split_view = split_view
+        split_view.set_sidebar(Gtk.Box())
+        GLib.idle_add(self._populate_sidebar, priority=GLib.PRIORITY_LOW)
         
         # Content Area (Service List)
         self.service_list_page = self._create_service_list_page()
@@ -112,6 +636,17 @@ class MainWindow(Adw.ApplicationWindow):
         # Ana box'ı window'a ekle
         self.set_content(main_box)
     
+    def _populate_sidebar(self):
+        """Asıl sidebar içeriğini ilk boyamadan sonra kur"""
+        self._split_view.set_sidebar(self._create_sidebar())
+        # İstatistikler son _load_services taramasından doldurulur
+        if self._service_items:
+            statuses = [item.props.status for item in self._service_items.values()]
+            running = statuses.count("running")
+            installed = running + statuses.count("stopped")
+            self._update_stats(len(statuses), installed, running)
+        return GLib.SOURCE_REMOVE
+
     def _create_sidebar(self):
         """Sidebar oluştur"""
         sidebar_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
@@ -122,8 +657,19 @@ class MainWindow(Adw.ApplicationWindow):
         sidebar_box.set_margin_end(12)
         sidebar_box.set_spacing(20)
         
-        system_info = self.platform_manager.get_system_info_dict()
-        
+        # Sistem bilgisi pencere ömrü boyunca değişmez; her sidebar
+        # kurulumunda platform sorgusu + socket açmak yerine bir kez
+        # toplanır (invalidate_system_info ile elle tazelenebilir).
+        # IP probe'u route lookup'ta takılabildiğinden UI thread'inde
+        # koşmaz: satır "…" ile açılır, worker sonucu idle'da yazar.
+        if self._system_info_cache is None:
+            self._system_info_cache = {
+                **self.platform_manager.get_system_info_dict(),
+                'ip': None,
+                'hostname': self._get_hostname(),
+            }
+        system_info = self._system_info_cache
+
         # Sistem bilgileri başlık
         system_title = Gtk.Label()
         system_title.set_markup(f"<span size='10500' weight='bold'>{_('SYSTEM INFORMATION')}</span>")
@@ -131,51 +677,35 @@ class MainWindow(Adw.ApplicationWindow):
         system_title.set_margin_bottom(8)
         sidebar_box.append(system_title)
         
-        # Sistem bilgileri listesi
-        system_list = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
-        system_list.set_spacing(2)
-        
-        # OS bilgisi
-        os_box = self._create_info_row(_("💻 Operating System"), system_info['os_name'])
-        system_list.append(os_box)
-        
-        # Versiyon
-        version_box = self._create_info_row(_("📦 Version"), system_info['os_version'])
-        system_list.append(version_box)
-        
-        # Dağıtım
-        distro_box = self._create_info_row(_("🐧 Distribution"), system_info['os_type'].title())
-        system_list.append(distro_box)
-        
-        # Kernel
-        kernel_box = self._create_info_row(_("⚙️ Kernel"), system_info['kernel_version'])
-        system_list.append(kernel_box)
-        
-        # Mimari
-        arch_box = self._create_info_row(_("🔧 Architecture"), system_info['architecture'])
-        system_list.append(arch_box)
-        
-        # Paket yöneticisi
-        pm_box = self._create_info_row(_("📥 Package Manager"), system_info['package_manager'].upper())
-        system_list.append(pm_box)
-        
-        # IP adresi
-        ip_address = self._get_local_ip()
-        ip_box = self._create_info_row(_("🌐 IP Address"), ip_address)
-        system_list.append(ip_box)
-        
-        # Hostname
-        hostname = self._get_hostname()
-        hostname_box = self._create_info_row(_("🖥️ Hostname"), hostname)
-        system_list.append(hostname_box)
-        
-        # Python version
-        import sys
+        # Sistem bilgileri - tek Grid, satır başına ayrı Box kurmaktan
+        # çok daha az widget ve tek ölçüm geçişi
         python_ver = f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
-        python_box = self._create_info_row(_("🐍 Python"), python_ver)
-        system_list.append(python_box)
-        
-        sidebar_box.append(system_list)
+
+        ip_title = _("🌐 IP Address")
+        system_rows = [
+            (_("💻 Operating System"), system_info['os_name']),
+            (_("📦 Version"), system_info['os_version']),
+            (_("🐧 Distribution"), system_info['os_type'].title()),
+            (_("⚙️ Kernel"), system_info['kernel_version']),
+            (_("🔧 Architecture"), system_info['architecture']),
+            (_("📥 Package Manager"), system_info['package_manager'].upper()),
+            (ip_title, system_info['ip'] or "…"),
+            (_("🖥️ Hostname"), system_info['hostname']),
+            (_("🐍 Python"), python_ver),
+        ]
+
+        system_grid = Gtk.Grid()
+        system_grid.set_column_spacing(12)
+        system_grid.set_row_spacing(8)
+        for row_idx, (label_text, value_text) in enumerate(system_rows):
+            value_label = self._attach_info_row(system_grid, row_idx, label_text, value_text)
+            if label_text is ip_title:
+                self._ip_value_label = value_label
+
+        sidebar_box.append(system_grid)
+
+        if system_info['ip'] is None:
+            self._io_pool.submit(self._probe_ip)
         
         # Separator
         separator = Gtk.Separator(orientation=Gtk.Orientation.HORIZONTAL)
@@ -190,43 +720,41 @@ class MainWindow(Adw.ApplicationWindow):
         stats_title.set_margin_bottom(8)
         sidebar_box.append(stats_title)
         
-        # İstatistikler listesi
-        stats = self.service_loader.get_service_count()
-        stats_list = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
-        stats_list.set_spacing(2)
-        
-        # Toplam servis
-        total_box = self._create_info_row(_("📊 Total Services"), str(stats['total']))
-        stats_list.append(total_box)
-        
-        # Kurulu servis
-        installed_box = self._create_info_row(_("✅ Installed"), str(stats['installed']))
-        stats_list.append(installed_box)
-        
-        # Çalışan servis
-        running_box = self._create_info_row(_("🟢 Running"), str(stats['running']))
-        stats_list.append(running_box)
-        
-        sidebar_box.append(stats_list)
-        
+        # İstatistikler - yine tek Grid. Değerler _load_services'in zaten
+        # yaptığı durum taramasından beslenir; burada ayrıca
+        # get_service_count() ile her servisi ikinci kez yoklamayız.
+        stats_grid = Gtk.Grid()
+        stats_grid.set_column_spacing(12)
+        stats_grid.set_row_spacing(8)
+        self._stat_labels = {
+            'total': self._attach_info_row(stats_grid, 0, _("📊 Total Services"), "…"),
+            'installed': self._attach_info_row(stats_grid, 1, _("✅ Installed"), "…"),
+            'running': self._attach_info_row(stats_grid, 2, _("🟢 Running"), "…"),
+        }
+
+        sidebar_box.append(stats_grid)
+
         return sidebar_box
-    
-    def _create_info_row(self, label_text, value_text):
-        """Bilgi satırı oluştur - tablo görünümü"""
-        row_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL)
-        row_box.set_spacing(12)
-        row_box.set_margin_top(4)
-        row_box.set_margin_bottom(4)
-        
+
+    def _update_stats(self, total, installed, running):
+        """Sidebar istatistik değerlerini güncelle"""
+        values = {'total': total, 'installed': installed, 'running': running}
+        for key, value in values.items():
+            label = self._stat_labels.get(key)
+            if label is not None:
+                label.set_markup(_SMALL_BOLD_OPEN + str(value) + _SPAN_CLOSE)
+
+    def _attach_info_row(self, grid, row_idx, label_text, value_text):
+        """Grid'e bir bilgi satırı (etiket + değer) ekle, değer label'ını döndür"""
         # Label (sol taraf, sabit genişlik)
         label = Gtk.Label()
         label.set_halign(Gtk.Align.START)
         label.set_hexpand(False)
         label.set_width_chars(18)
         label.set_xalign(0)
-        label.set_markup(f"<span size='9000'>{label_text}</span>")
-        row_box.append(label)
-        
+        label.set_markup(_SMALL_OPEN + label_text + _SPAN_CLOSE)
+        grid.attach(label, 0, row_idx, 1, 1)
+
         # Value (sağ taraf, bold)
         value = Gtk.Label()
         value.set_halign(Gtk.Align.START)
@@ -234,15 +762,28 @@ class MainWindow(Adw.ApplicationWindow):
         value.set_xalign(0)
         value.set_ellipsize(3)  # ELLIPSIZE_END
         value.set_selectable(True)  # Kopyalanabilir
-        value.set_markup(f"<span size='9000' weight='700'>{value_text}</span>")
-        row_box.append(value)
-        
-        return row_box
+        value.set_markup(_SMALL_BOLD_OPEN + str(value_text) + _SPAN_CLOSE)
+        grid.attach(value, 1, row_idx, 1, 1)
+
+        return value
     
+    def _probe_ip(self):
+        """Yerel IP'yi worker'da çöz, sonucu UI thread'inde label'a yaz"""
+        ip = self._get_local_ip()
+        if self._system_info_cache is not None:
+            self._system_info_cache['ip'] = ip
+        GLib.idle_add(
+            self._ip_value_label.set_markup,
+            _SMALL_BOLD_OPEN + ip + _SPAN_CLOSE
+        )
+
+    def invalidate_system_info(self):
+        """Sistem bilgisi cache'ini düşür (örn. ağ yapılandırması değişince)"""
+        self._system_info_cache = None
+
     def _get_local_ip(self):
         """Yerel IP adresini al"""
         try:
-            import socket
             s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
             s.connect(("8.8.8.8", 80))
             ip = s.getsockname()[0]
@@ -254,7 +795,6 @@ class MainWindow(Adw.ApplicationWindow):
     def _get_hostname(self):
         """Hostname al"""
         try:
-            import socket
             return socket.gethostname()
         except Exception:
             return "N/A"
@@ -292,248 +832,426 @@ class MainWindow(Adw.ApplicationWindow):
         scrolled = Gtk.ScrolledWindow()
         scrolled.set_vexpand(True)
         scrolled.set_hexpand(True)
-        
-        # Servis listesi (ListBox kullanarak)
-        self.service_list_box = Gtk.ListBox()
-        self.service_list_box.set_selection_mode(Gtk.SelectionMode.NONE)
-        self.service_list_box.add_css_class("boxed-list")
-        self.service_list_box.set_margin_start(12)
-        self.service_list_box.set_margin_end(12)
-        self.service_list_box.set_margin_bottom(12)
-        self.service_list_box.connect("row-activated", self._on_service_row_activated)
-        
-        scrolled.set_child(self.service_list_box)
+        self.service_scrolled = scrolled
+
+        # Servis listesi: Gio.ListStore destekli ListView - sadece
+        # görünür satırlar widget'a dönüşür, kaydırmada geri dönüşüm var
+        self.service_store = Gio.ListStore.new(ServiceItem)
+
+        factory = Gtk.SignalListItemFactory()
+        factory.connect("setup", self._service_item_setup)
+        factory.connect("bind", self._service_item_bind)
+        factory.connect("unbind", self._service_item_unbind)
+
+        self.service_list_view = Gtk.ListView.new(
+            Gtk.NoSelection.new(self.service_store), factory
+        )
+        self.service_list_view.set_single_click_activate(True)
+        self.service_list_view.add_css_class("boxed-list")
+        self.service_list_view.set_margin_start(12)
+        self.service_list_view.set_margin_end(12)
+        self.service_list_view.set_margin_bottom(12)
+        self.service_list_view.connect("activate", self._on_service_activated)
+
+        scrolled.set_child(self.service_list_view)
         content_box.append(scrolled)
-        
+
         return content_box
-    
-    def _load_services(self):
-        """Servisleri yükle ve göster"""
-        # Mevcut servisleri temizle
-        while True:
-            child = self.service_list_box.get_first_child()
-            if child is None:
-                break
-            self.service_list_box.remove(child)
-        
-        # Servisleri al
-        services = self.service_loader.get_all_services()
-        
-        if not services:
-            # Servis yoksa bilgi göster
-            status_page = Adw.StatusPage()
-            status_page.set_title(_("No Services"))
-            status_page.set_description(_("Add service modules to services/ directory"))
-            status_page.set_icon_name("folder-symbolic")
-            self.service_list_box.append(status_page)
-            return
-        
-        # Her servis için row oluştur
-        for service in services:
-            service_row = self._create_service_row(service)
-            self.service_list_box.append(service_row)
-    
-    def _create_service_row(self, service):
-        """Modern servis kartı oluştur"""
-        # Ana container
-        row = Gtk.ListBoxRow()
-        row.set_activatable(True)
-        # Service'i row'a veri olarak ekle
-        row.service = service
-        
-        # Box içeriği
+
+    def _service_item_setup(self, factory, list_item):
+        """ListView için tek servis kartı şablonu oluştur (bir kez)"""
         card_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL)
         card_box.set_spacing(16)
         card_box.set_margin_top(12)
         card_box.set_margin_bottom(12)
         card_box.set_margin_start(16)
         card_box.set_margin_end(16)
-        
-        # Sol taraf: Icon + Bilgiler
+
         left_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL)
         left_box.set_spacing(12)
         left_box.set_hexpand(True)
-        
-        # İkon (büyük)
-        icon = Gtk.Image.new_from_icon_name(service.icon_name)
+
+        icon = Gtk.Image()
         icon.set_pixel_size(40)
         left_box.append(icon)
-        
-        # Bilgi box
+
         info_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
         info_box.set_valign(Gtk.Align.CENTER)
         info_box.set_spacing(4)
-        
-        # Başlık
-        title = Gtk.Label(label=service.display_name)
+
+        title = Gtk.Label()
         title.set_halign(Gtk.Align.START)
-        title.set_markup(f"<span size='11000' weight='bold'>{service.display_name}</span>")
         info_box.append(title)
-        
-        # Alt bilgi satırı
-        status = service.get_status().value
-        subtitle_parts = []
-        
-        # Status
-        if status == "running":
-            subtitle_parts.append("<span foreground='#26a269'>● Running</span>")
-        elif status == "stopped":
-            subtitle_parts.append("<span foreground='#c01c28'>● Stopped</span>")
-        elif status == "not_installed":
-            subtitle_parts.append("<span foreground='#9a9996'>● Not Installed</span>")
-        else:
-            subtitle_parts.append("<span foreground='#9a9996'>● Unknown</span>")
-        
-        # Port
-        if service.default_port:
-            subtitle_parts.append(f"Port {service.default_port}")
-        
-        # Type
-        type_name = service.service_type.value.replace('_', ' ').title()
-        subtitle_parts.append(type_name)
-        
+
         subtitle = Gtk.Label()
         subtitle.set_halign(Gtk.Align.START)
-        subtitle.set_markup(f"<span size='9000'>{' • '.join(subtitle_parts)}</span>")
         info_box.append(subtitle)
-        
+
         left_box.append(info_box)
         card_box.append(left_box)
-        
-        # Sağ taraf: Ok ikonu
-        arrow = Gtk.Image.new_from_icon_name("go-next-symbolic")
+
+        arrow = _icon("go-next-symbolic")
         arrow.set_valign(Gtk.Align.CENTER)
         card_box.append(arrow)
-        
-        row.set_child(card_box)
-        return row
+
+        # Bind aşamasının widget aramasına gerek kalmasın
+        card_box._icon = icon
+        card_box._title = title
+        card_box._subtitle = subtitle
+        list_item.set_child(card_box)
+
+    def _service_item_bind(self, factory, list_item):
+        """Geri dönüştürülen karta modeldeki servis verisini yaz"""
+        card_box = list_item.get_child()
+        item = list_item.get_item()
+        card_box._icon.set_from_paintable(_icon_paintable(item.icon_name))
+        card_box._title.set_markup(item.title_markup)
+        self._set_service_subtitle(card_box, item)
+        # Durum değişince görünür satır yerinde güncellenir; liste
+        # yeniden kurulmaz (notify unbind'de çözülür)
+        card_box._status_handler = item.connect(
+            "notify::status",
+            lambda it, pspec: self._set_service_subtitle(card_box, it)
+        )
+
+    def _service_item_unbind(self, factory, list_item):
+        """Satır geri dönüşüme girerken durum aboneliğini çöz"""
+        card_box = list_item.get_child()
+        handler = getattr(card_box, '_status_handler', None)
+        if handler is not None:
+            list_item.get_item().disconnect(handler)
+            card_box._status_handler = None
+
+    def _set_service_subtitle(self, card_box, item):
+        """Servis kartının alt başlık markup'ını modele göre yaz"""
+        # Markup modelde hazır bekler; bind tek set_markup çağrısıdır
+        card_box._subtitle.set_markup(item.subtitle_markup)
+
+    def _on_service_activated(self, list_view, position):
+        """ListView satırı aktive edildiğinde servis detayını aç"""
+        item = list_view.get_model().get_item(position)
+        if item is not None:
+            self._show_service_detail(item.service)
+    
+    def _load_services(self):
+        """Servisleri yükle ve göster"""
+        # Liste görünmez + notify donmuşken doldur - model değişimleri
+        # tek stil geçişinde işlensin
+        self.service_list_view.set_visible(False)
+        self.service_list_view.freeze_notify()
+        try:
+            services = self.service_loader.get_all_services()
+
+            if not services:
+                # Servis yoksa bilgi göster
+                self.service_store.remove_all()
+                status_page = Adw.StatusPage()
+                status_page.set_title(_("No Services"))
+                status_page.set_description(_("Add service modules to services/ directory"))
+                status_page.set_icon_name("folder-symbolic")
+                self.service_scrolled.set_child(status_page)
+                self._update_stats(0, 0, 0)
+                return
+
+            if self.service_scrolled.get_child() is not self.service_list_view:
+                self.service_scrolled.set_child(self.service_list_view)
+
+            # Mevcut model kayıtları yeniden kullanılır: değişen sadece
+            # status property'si ise görünür satır notify ile yerinde
+            # güncellenir, widget'lar yeniden kurulmaz
+            installed_count = 0
+            running_count = 0
+            items = []
+            # Durum problarını worker havuzunda paralel koştur - N seri
+            # systemd/subprocess sorgusu yerine havuz genişliği kadar
+            # eşzamanlı sorgu
+            statuses = list(self._io_pool.map(
+                lambda s: s.get_status().value, services
+            ))
+            for service, status in zip(services, statuses):
+                if status == "running":
+                    installed_count += 1
+                    running_count += 1
+                elif status == "stopped":
+                    installed_count += 1
+                item = self._service_items.get(service.name)
+                if item is None:
+                    item = ServiceItem(service, status)
+                    self._service_items[service.name] = item
+                elif item.props.status != status:
+                    item.props.status = status
+                items.append(item)
+
+            # Kaldırılan servislerin kayıtları düşsün
+            names = {service.name for service in services}
+            for name in [n for n in self._service_items if n not in names]:
+                del self._service_items[name]
+
+            # Üyelik/sıra değiştiyse tek splice; aksi halde model sinyali yok
+            n = self.service_store.get_n_items()
+            if n != len(items) or any(
+                self.service_store.get_item(i) is not items[i] for i in range(n)
+            ):
+                self.service_store.splice(0, n, items)
+
+            self._update_stats(len(services), installed_count, running_count)
+        finally:
+            self.service_list_view.thaw_notify()
+            self.service_list_view.set_visible(True)
+    
+    def _cached_icon(self, icon_name):
+        """Cache'lenmiş paintable'dan Gtk.Image oluştur"""
+        # Modül seviyesindeki _icon() tüm pencere için tek cache sağlar
+        return _icon(icon_name)
+
+    def _cached_info(self, service, key, ttl, fn):
+        """Pahalı servis sorgusunu kısa TTL ile cache'leyerek çalıştır
+
+        Hata da cache'lenir: geçici bir arıza art arda gelen rebuild'lerde
+        mysqld/apache'yi tekrar tekrar yoklamasın.
+        """
+        entries = self._info_cache.setdefault(service.name, {})
+        entry = entries.get(key)
+        now = time.monotonic()
+        if entry is not None and now - entry[0] < ttl:
+            if isinstance(entry[1], Exception):
+                raise entry[1]
+            return entry[1]
+
+        try:
+            value = fn()
+        except Exception as e:
+            entries[key] = (now, e)
+            raise
+        entries[key] = (now, value)
+        return value
+
+    def _maybe_refresh(self, service):
+        """Açık detay sayfası bu servise aitse yenile
+
+        Handler'larda tekrarlanan current_service karşılaştırma
+        postamble'ının tek kopyası.
+        """
+        cs = self.current_service
+        if cs is not None and cs.name == service.name:
+            # Art arda gelen mutasyonlar (örn. birden çok vhost toggle)
+            # debounce penceresinde tek rebuild'e iner
+            self._request_refresh()
+
+    def _get_php_versions_cached(self, service):
+        """Kurulu PHP sürümlerini kısa TTL ile döndür
+
+        Her diyalog açılışında PHP binary taraması yapmamak için;
+        5 sn'lik pencere art arda açılışları subprocess'siz karşılar.
+        """
+        return self._cached_info(service, 'php_versions', 5,
+                                 service.get_installed_php_versions)
+
+    def _invalidate_info(self, service):
+        """Servise ait introspeksiyon cache'ini boşalt (mutasyon sonrası)"""
+        self._info_cache.pop(service.name, None)
     
+    def _info_row(self, title, value=None, subtitle=None, mono=True, css=None):
+        """Başlık + opsiyonel suffix değerli bilgi satırı üret
+
+        Tekrarlanan ActionRow/Label/monospace dizisinin tek kopyası;
+        suffix label'ı sonradan güncellenebilsin diye row._value olarak
+        erişilebilir kalır.
+        """
+        row = Adw.ActionRow()
+        row.set_title(title)
+        if subtitle is not None:
+            row.set_subtitle(subtitle)
+        if value is not None:
+            label = Gtk.Label(label=value)
+            if mono:
+                label.add_css_class("monospace")
+            if css:
+                label.add_css_class(css)
+            row.add_suffix(label)
+            row._value = label
+        return row
+
+    def _on_row_activated(self, row, action_service):
+        """Paylaşılan 'activated' dispatcher'ı
+
+        Satır başına lambda closure'ı üretmek yerine hedef metot adı ve
+        servis connect user_data olarak taşınır; PyGObject bunları
+        handler'a son argüman olarak geçirir.
+        """
+        handler_name, service = action_service
+        getattr(self, handler_name)(service)
+
+    def _action_row(self, title, subtitle, icon_name, handler_name, service):
+        """Aktive edilebilir aksiyon satırını tek çağrıda kur
+
+        Detay builder'larındaki 6 satırlık row kurulum bloklarının
+        yerini alır; ikon cache'ten, sinyal paylaşılan handler'dan.
+        """
+        row = Adw.ActionRow()
+        row.set_title(title)
+        row.set_subtitle(subtitle)
+        row.set_activatable(True)
+        row.add_prefix(_icon(icon_name))
+        row.connect("activated", self._on_row_activated, (handler_name, service))
+        # Sayfa düşene kadar satır ve servis canlı kalsın
+        self._detail_refs.setdefault(service.name, []).append(
+            (row, handler_name, service))
+        return row
+
+    def _make_dialog(self, heading, body, confirm_label=None,
+                     confirm_style=Adw.ResponseAppearance.SUGGESTED):
+        """Cancel/onay kablolu hazır MessageDialog üret
+
+        Her handler'da tekrarlanan add_response kurulumunun yerine
+        geçer; onay cevabı tüm kullanıcılarda "ok" olarak okunur.
+        """
+        dialog = Adw.MessageDialog.new(self, heading, body)
+        dialog.add_response("cancel", _S.CANCEL)
+        if confirm_label:
+            dialog.add_response("ok", confirm_label)
+            dialog.set_response_appearance("ok", confirm_style)
+        return dialog
+
     def _on_service_install(self, service):
         """Install service"""
-        # Onay dialog'u göster
-        dialog = Adw.MessageDialog.new(self)
-        dialog.set_heading(_("Install {service}?").format(service=service.display_name))
-        dialog.set_body(_("A terminal window will open. Please enter your password when prompted.").format(service=service.display_name))
-        
-        dialog.add_response("cancel", _("Cancel"))
-        dialog.add_response("install", _("Install"))
-        dialog.set_response_appearance("install", Adw.ResponseAppearance.SUGGESTED)
-        dialog.set_default_response("install")
-        dialog.set_close_response("cancel")
-        
-        def on_response(dialog, response):
-            if response == "install":
-                # Script yolunu bul
-                script_path = os.path.join(
-                    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
-                    'scripts',
-                    f'{service.name}.sh'
-                )
-                
-                # Terminal komutları
-                terminal_commands = [
-                    ['gnome-terminal', '--', 'bash', '-c', 
-                     f'echo "Installing {service.display_name}..."; echo ""; sudo bash "{script_path}" install; echo ""; echo "Press Enter to close..."; read'],
-                    ['xterm', '-e', 
-                     f'bash -c "echo \\"Installing {service.display_name}...\\"; echo \\"\\"; sudo bash \\"{script_path}\\" install; echo \\"\\"; echo \\"Press Enter to close...\\"; read"'],
-                    ['konsole', '-e', 
-                     f'bash -c "echo \\"Installing {service.display_name}...\\"; echo \\"\\"; sudo bash \\"{script_path}\\" install; echo \\"\\"; echo \\"Press Enter to close...\\"; read"'],
-                ]
-                
-                success = False
-                for cmd in terminal_commands:
-                    try:
-                        subprocess.Popen(cmd)
-                        success = True
-                        self._show_toast(_("Terminal opened. Please complete installation there."))
-                        # Servisleri yenile (3 saniye sonra)
-                        GLib.timeout_add_seconds(3, self._load_services)
-                        break
-                    except:
-                        continue
-                
-                if not success:
-                    self._show_toast(_("Could not open terminal. Install manually: sudo bash {script} install").format(script=script_path))
-        
-        dialog.connect("response", on_response)
-        dialog.present()
-    
+        self._run_service_script(service, 'install')
+
     def _on_service_uninstall(self, service):
         """Uninstall service"""
-        # Onay dialog'u göster
+        self._run_service_script(service, 'uninstall')
+
+    def _run_service_script(self, service, action):
+        """Kurulum/kaldırma onayını göster, terminalde script'i koştur
+
+        İki handler tek parametreli akışta birleşti: fark yalnızca
+        eylem adı, buton görünümü ve toast metinleri.
+        """
+        installing = action == 'install'
+        if installing:
+            heading = _("Install {service}?").format(service=service.display_name)
+            label = _S.INSTALL
+            appearance = Adw.ResponseAppearance.SUGGESTED
+            default = action
+            verb = 'Installing'
+            opened_toast = _("Terminal opened. Please complete installation there.")
+            manual_toast = _("Could not open terminal. Install manually: sudo bash {script} install")
+        else:
+            heading = _("Uninstall {service}?").format(service=service.display_name)
+            label = _S.UNINSTALL
+            appearance = Adw.ResponseAppearance.DESTRUCTIVE
+            default = "cancel"
+            verb = 'Uninstalling'
+            opened_toast = _("Terminal opened. Please complete uninstallation there.")
+            manual_toast = _("Could not open terminal. Uninstall manually: sudo bash {script} uninstall")
+
         dialog = Adw.MessageDialog.new(self)
-        dialog.set_heading(_("Uninstall {service}?").format(service=service.display_name))
-        dialog.set_body(_("A terminal window will open. Please enter your password when prompted.").format(service=service.display_name))
-        
-        dialog.add_response("cancel", _("Cancel"))
-        dialog.add_response("uninstall", _("Uninstall"))
-        dialog.set_response_appearance("uninstall", Adw.ResponseAppearance.DESTRUCTIVE)
-        dialog.set_default_response("cancel")
+        dialog.set_heading(heading)
+        dialog.set_body(_("A terminal window will open. Please enter your password when prompted."))
+
+        dialog.add_response("cancel", _S.CANCEL)
+        dialog.add_response(action, label)
+        dialog.set_response_appearance(action, appearance)
+        dialog.set_default_response(default)
         dialog.set_close_response("cancel")
-        
+
         def on_response(dialog, response):
-            if response == "uninstall":
-                # Script yolunu bul
-                script_path = os.path.join(
-                    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
-                    'scripts',
-                    f'{service.name}.sh'
+            if response == action:
+                script_path = str(SCRIPTS_DIR / f'{service.name}.sh')
+                line = (
+                    f'echo "{verb} {service.display_name}..."; echo ""; '
+                    f'sudo bash "{script_path}" {action}; echo ""; '
+                    'echo "Press Enter to close..."; read'
                 )
-                
-                # Terminal komutları
-                terminal_commands = [
-                    ['gnome-terminal', '--', 'bash', '-c', 
-                     f'echo "Uninstalling {service.display_name}..."; echo ""; sudo bash "{script_path}" uninstall; echo ""; echo "Press Enter to close..."; read'],
-                    ['xterm', '-e', 
-                     f'bash -c "echo \\"Uninstalling {service.display_name}...\\"; echo \\"\\"; sudo bash \\"{script_path}\\" uninstall; echo \\"\\"; echo \\"Press Enter to close...\\"; read"'],
-                    ['konsole', '-e', 
-                     f'bash -c "echo \\"Uninstalling {service.display_name}...\\"; echo \\"\\"; sudo bash \\"{script_path}\\" uninstall; echo \\"\\"; echo \\"Press Enter to close...\\"; read"'],
-                ]
-                
-                success = False
-                for cmd in terminal_commands:
-                    try:
-                        subprocess.Popen(cmd)
-                        success = True
-                        self._show_toast(_("Terminal opened. Please complete uninstallation there."))
-                        # Servisleri yenile (3 saniye sonra)
-                        GLib.timeout_add_seconds(3, self._load_services)
-                        break
-                    except:
-                        continue
-                
-                if not success:
-                    self._show_toast(_("Could not open terminal. Uninstall manually: sudo bash {script} uninstall").format(script=script_path))
-        
+                if not self._spawn_terminal(line, service.name):
+                    self._show_toast(manual_toast.format(script=script_path))
+                else:
+                    self._show_toast(opened_toast)
+
         dialog.connect("response", on_response)
         dialog.present()
+
+    def _spawn_terminal(self, shell_line, service_name=None):
+        """Başlangıçta çözülen terminalde kabuk satırını çalıştır
+
+        Başarıysa terminal kapanınca servis listesi yenilenir; bir
+        servis adı verilmişse o servisin cache'lenmiş detay sayfası da
+        düşürülür (kurulum/kaldırma sayfa yapısını değiştirir).
+        Terminal yoksa/başlatılamazsa False döner.
+        """
+        if self._terminal is None:
+            return False
+        cmd = _TERMINAL_CMDS[self._terminal](shell_line)
+        try:
+            proc = Gio.Subprocess.new(cmd, Gio.SubprocessFlags.NONE)
+        except GLib.Error as e:
+            logger.debug(f"Terminal {self._terminal} kullanılamadı: {e}")
+            return False
+        # Terminal kapandığında servisleri yenile - körlemesine timer
+        # yerine gerçek çıkışı bekle
+        proc.wait_async(None, self._on_terminal_closed, service_name)
+        return True
+
+    def _drop_detail_page(self, service_name):
+        """Servisin cache'lenmiş detay sayfasını ve stack slotunu at"""
+        page = self._detail_pages.pop(service_name, None)
+        self._detail_widgets.pop(service_name, None)
+        # Sayfa gerçekten yıkıldığında satır/handler referansları da
+        # bırakılır - daha erken bırakmak uçuştaki aktivasyonları
+        # toplanmış nesnelere düşürebilir
+        self._detail_refs.pop(service_name, None)
+        self._detail_signatures.pop(service_name, None)
+        if page is not None and page.get_parent() is self.main_stack:
+            # Görünen sayfa düşürülüyorsa navigasyon da sıfırlanmalı;
+            # yoksa stack sessizce ilk çocuğa düşer ama back butonu,
+            # current_service ve MySQL poller detaydaymışız gibi kalır
+            on_dropped_page = (
+                self.main_stack.get_visible_child() is page
+                or (self.current_service is not None
+                    and self.current_service.name == service_name)
+            )
+            if on_dropped_page:
+                self.main_stack.set_visible_child_name("list")
+                self.back_button.set_visible(False)
+                self.current_service = None
+                self._stop_mysql_poll()
+            self.main_stack.remove(page)
     
+    def _on_terminal_closed(self, proc, result, service_name=None):
+        """Kurulum/kaldırma terminali kapandı - servis listesini yenile"""
+        try:
+            proc.wait_finish(result)
+        except GLib.Error as e:
+            logger.debug(f"Terminal bekleme hatası: {e}")
+        if service_name is not None:
+            # Sayfa iskeleti kurulum durumuna bağlı - bayat kopya kalmasın
+            self._drop_detail_page(service_name)
+            self._info_cache.pop(service_name, None)
+        self._schedule_reload()
+
     def _on_service_start(self, service):
         """Start service"""
         success, message = service.start()
         self._show_toast(message)
-        self._load_services()
+        self._schedule_reload()
         # Detay sayfasındaysak yenile
-        if self.current_service and self.current_service.name == service.name:
-            self._refresh_detail_page()
+        self._maybe_refresh(service)
     
     def _on_service_stop(self, service):
         """Stop service"""
         success, message = service.stop()
         self._show_toast(message)
-        self._load_services()
+        self._schedule_reload()
         # Detay sayfasındaysak yenile
-        if self.current_service and self.current_service.name == service.name:
-            self._refresh_detail_page()
+        self._maybe_refresh(service)
     
     def _on_service_restart(self, service):
         """Restart service"""
         success, message = service.restart()
         self._show_toast(message)
-        self._load_services()
+        self._schedule_reload()
         # Detay sayfasındaysak yenile
-        if self.current_service and self.current_service.name == service.name:
-            self._refresh_detail_page()
+        self._maybe_refresh(service)
     
     def _show_loading_dialog(self, message):
         """Show loading dialog with progress"""
@@ -543,7 +1261,7 @@ class MainWindow(Adw.ApplicationWindow):
         self.progress_dialog.set_body(message)
         
         # Cancel butonu ekle
-        self.progress_dialog.add_response("cancel", _("Cancel"))
+        self.progress_dialog.add_response("cancel", _S.CANCEL)
         self.progress_dialog.set_response_appearance("cancel", Adw.ResponseAppearance.DESTRUCTIVE)
         
         # Cancel handler
@@ -578,15 +1296,18 @@ class MainWindow(Adw.ApplicationWindow):
         
         self.progress_dialog.set_extra_child(content_box)
         
-        # Progress animation başlat
-        self.progress_timeout_id = None
-        def pulse_progress():
-            if hasattr(self, 'progress_dialog') and self.progress_dialog and hasattr(self, 'progress_bar') and self.progress_bar:
-                self.progress_bar.pulse()
-                return True
-            return False
-        
-        self.progress_timeout_id = GLib.timeout_add(100, pulse_progress)
+        # Pulse frame clock'a bağlı tick callback ile: yalnızca widget
+        # map'liyken ve kare çizilirken koşar; ayrı bir GLib timer'ı
+        # main loop'u sürekli uyandırmaz. ~250 ms'de bir pulse yeter.
+        def pulse_tick(widget, frame_clock):
+            now = frame_clock.get_frame_time()  # µs
+            if now - widget._last_pulse >= 250_000:
+                widget.pulse()
+                widget._last_pulse = now
+            return GLib.SOURCE_CONTINUE
+
+        self.progress_bar._last_pulse = 0
+        self.progress_tick_id = self.progress_bar.add_tick_callback(pulse_tick)
         
         self.progress_dialog.present()
         logger.info(f"Loading: {message}")
@@ -595,13 +1316,13 @@ class MainWindow(Adw.ApplicationWindow):
         """Operation completed"""
         try:
             # Progress animation'ı durdur
-            if hasattr(self, 'progress_timeout_id') and self.progress_timeout_id:
+            if getattr(self, 'progress_tick_id', None) and self.progress_bar is not None:
                 try:
-                    GLib.source_remove(self.progress_timeout_id)
-                except:
-                    pass
-                self.progress_timeout_id = None
-            
+                    self.progress_bar.remove_tick_callback(self.progress_tick_id)
+                except GLib.Error as e:
+                    logger.debug(f"Progress tick kaldırılamadı: {e}")
+                self.progress_tick_id = None
+
             # Progress bar referansını temizle
             if hasattr(self, 'progress_bar'):
                 self.progress_bar = None
@@ -614,8 +1335,8 @@ class MainWindow(Adw.ApplicationWindow):
             if hasattr(self, 'progress_dialog') and self.progress_dialog:
                 try:
                     self.progress_dialog.close()
-                except:
-                    pass
+                except GLib.Error as e:
+                    logger.debug(f"Progress dialog kapatılamadı: {e}")
                 self.progress_dialog = None
             
             # Toast göster
@@ -626,22 +1347,25 @@ class MainWindow(Adw.ApplicationWindow):
                 error_dialog = Adw.MessageDialog.new(self)
                 error_dialog.set_heading(_("Operation Failed"))
                 error_dialog.set_body(message)
-                error_dialog.add_response("ok", _("OK"))
+                error_dialog.add_response("ok", _S.OK)
                 error_dialog.set_default_response("ok")
                 error_dialog.present()
             
             # Servisleri yeniden yükle
             try:
-                self._load_services()
-                # Detay sayfasındaysak yenile
+                self._schedule_reload()
+                # Detay sayfasındaysak yenile; mutasyon modül/eklenti
+                # listelerini değiştirmiş olabilir - cache düşürülür.
+                # Debounce sayesinde peş peşe biten işlemler tek
+                # rebuild'e katlanır
                 if self.current_service:
-                    self._refresh_detail_page()
+                    self._invalidate_info(self.current_service)
+                    self._request_refresh()
             except Exception as e:
                 logger.error(f"Error reloading services: {e}")
         
         except Exception as e:
             logger.error(f"Error in _on_operation_complete: {e}")
-            import traceback
             traceback.print_exc()
         
         return False
@@ -663,13 +1387,13 @@ class MainWindow(Adw.ApplicationWindow):
         password_box.set_margin_top(12)
         
         password_entry = Gtk.PasswordEntry()
-        password_entry.set_property("placeholder-text", _("Password"))
+        password_entry.props.placeholder_text = _("Password")
         password_entry.set_show_peek_icon(True)
         password_box.append(password_entry)
         
         dialog.set_extra_child(password_box)
-        dialog.add_response("cancel", _("Cancel"))
-        dialog.add_response("ok", _("OK"))
+        dialog.add_response("cancel", _S.CANCEL)
+        dialog.add_response("ok", _S.OK)
         dialog.set_response_appearance("ok", Adw.ResponseAppearance.SUGGESTED)
         
         def on_response(dialog, response):
@@ -685,18 +1409,14 @@ class MainWindow(Adw.ApplicationWindow):
     
     # ==================== NAVIGATION ====================
     
-    def _on_service_row_activated(self, listbox, row):
-        """Service row activated - show detail"""
-        if hasattr(row, 'service'):
-            self._show_service_detail(row.service)
-    
     def _on_back_clicked(self, button):
         """Back button clicked - return to service list"""
         self.main_stack.set_visible_child_name("list")
         self.back_button.set_visible(False)
         self.current_service = None
+        self._stop_mysql_poll()
         # Servisleri yenile
-        self._load_services()
+        self._schedule_reload()
     
     def _show_service_detail(self, service):
         """Show service detail page"""
@@ -710,34 +1430,15 @@ class MainWindow(Adw.ApplicationWindow):
                 if not saved_password:
                     # Sudo gerekli, şifre iste
                     def on_password_provided(password):
-                        # Şifreyi geçici olarak environment'a kaydet
-                        import os
-                        
-                        # SUDO_ASKPASS script oluştur
-                        temp_script = f"/tmp/orkesta_sudo_{os.getpid()}.sh"
-                        try:
-                            with open(temp_script, 'w') as f:
-                                f.write(f'#!/bin/bash\necho "{password}"\n')
-                            os.chmod(temp_script, 0o700)
-                            
-                            # Environment'ı geçici olarak değiştir
-                            old_askpass = os.environ.get('SUDO_ASKPASS')
-                            os.environ['SUDO_ASKPASS'] = temp_script
-                            
-                            # Normal detay sayfası akışını çağır
-                            self._create_and_show_detail_page_normal(service)
-                            
-                        finally:
-                            # Cleanup
-                            if old_askpass:
-                                os.environ['SUDO_ASKPASS'] = old_askpass
-                            elif 'SUDO_ASKPASS' in os.environ:
-                                del os.environ['SUDO_ASKPASS']
-                            try:
-                                os.remove(temp_script)
-                            except:
-                                pass
-                    
+                        # Şifre diske yazılmaz: sudo -S -v ile stdin'den
+                        # doğrulanır ve sudo'nun kendi zaman damgası
+                        # (~15 dk) sonraki açılışlarda yeniden sormayı
+                        # gereksiz kılar
+                        if not self._prime_sudo(password):
+                            self._show_toast(_("Authentication failed"))
+                            return
+                        self._create_and_show_detail_page_normal(service)
+
                     self._show_sudo_password_dialog(on_password_provided)
                     return
             except Exception as e:
@@ -746,49 +1447,230 @@ class MainWindow(Adw.ApplicationWindow):
         # Normal detay sayfası oluştur
         self._create_and_show_detail_page_normal(service)
     
-    def _create_and_show_detail_page_normal(self, service):
-        """Normal detail page creation"""
-        # Detay sayfası oluştur
-        detail_page = self._create_service_detail_page(service)
-        
-        # Eski detay sayfasını kaldır (varsa) - basit yöntem
-        try:
-            old_detail = self.main_stack.get_child_by_name("detail")
-            if old_detail:
-                self.main_stack.remove(old_detail)
-        except:
-            # GTK API farklılığında sessizce devam et
-            pass
-        
-        # Yeni detay sayfasını ekle
+    def _prime_sudo(self, password):
+        """sudo zaman damgasını stdin üzerinden şifreyle tazele
+
+        Askpass tempfile'ı yerine şifre doğrudan sudo -S -v'ye borulanır;
+        başarılıysa sonraki sudo çağrıları timeout süresince şifresizdir.
+        """
         try:
-            self.main_stack.add_named(detail_page, "detail")
-            self.main_stack.set_visible_child_name("detail")
-        except:
-            # Fallback - direkt göster
-            self.main_stack.set_visible_child(detail_page)
-        
+            proc = subprocess.Popen(
+                ['sudo', '-S', '-v'],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+            proc.communicate(input=(password + '\n').encode(), timeout=15)
+            return proc.returncode == 0
+        except (OSError, subprocess.TimeoutExpired) as e:
+            logger.error(f"sudo doğrulaması başarısız: {e}")
+            return False
+
+    def _create_and_show_detail_page_normal(self, service):
+        """Normal detail page creation"""
+        # Cache'te varsa hazır sayfayı kullan, yoksa oluştur
+        detail_page = self._detail_pages.get(service.name)
+        if detail_page is None:
+            detail_page = self._create_service_detail_page(service)
+        self._cache_detail_page(service.name, detail_page)
+
+        self._show_detail_widget(service.name, detail_page)
         self.back_button.set_visible(True)
-    
+
+        # MySQL auth yöntemi arka planda (ör. terminalde) değişebilir;
+        # sayfa görünürken seyrek bir poller kaymayı yakalar
+        if service.name == 'mysql' and service.is_installed():
+            self._start_mysql_poll(service)
+        else:
+            self._stop_mysql_poll()
+
+    def _cache_detail_page(self, service_name, detail_page):
+        """Detay sayfasını LRU cache'e koy, limit aşılırsa en eskiyi at"""
+        self._detail_pages[service_name] = detail_page
+        self._detail_pages.move_to_end(service_name)
+        while len(self._detail_pages) > _DETAIL_CACHE_MAX:
+            evicted_name, evicted = self._detail_pages.popitem(last=False)
+            self._detail_refs.pop(evicted_name, None)
+            # LRU'dan düşen sayfa stack'te de kalmasın
+            if evicted.get_parent() is self.main_stack:
+                self.main_stack.remove(evicted)
+
+    def _show_detail_widget(self, service_name, detail_page):
+        """Servisin detay sayfasını adlandırılmış stack çocuğu olarak göster
+
+        Her servis "detail-<ad>" adıyla kendi stack slotunu alır:
+        tekrar ziyaret remove/add dansı olmadan set_visible_child ile
+        O(1) geçiştir.
+        """
+        name = f"detail-{service_name}"
+        if self.main_stack.get_child_by_name(name) is not detail_page:
+            existing = self.main_stack.get_child_by_name(name)
+            if existing is not None:
+                self.main_stack.remove(existing)
+            self.main_stack.add_named(detail_page, name)
+        self.main_stack.set_visible_child_name(name)
+
+    def _start_mysql_poll(self, service):
+        """MySQL detayı görünürken durum kaymasını 10 sn'de bir yokla
+
+        Mutasyon sonrası zorlama tam yenilemelerin yerine tek periyodik
+        kaynak: bundle worker'da çekilir, son anlık görüntüyle
+        karşılaştırılır ve yalnızca fark varsa label'lar tazelenir.
+        """
+        if self._mysql_poll_id is not None:
+            return
+        self._mysql_poll_snapshot = None
+        self._mysql_poll_id = GLib.timeout_add_seconds(
+            10, self._poll_mysql, service)
+
+    def _stop_mysql_poll(self):
+        """Poller kaynağını sök - sayfa artık görünür değil"""
+        if self._mysql_poll_id is not None:
+            GLib.source_remove(self._mysql_poll_id)
+            self._mysql_poll_id = None
+            self._mysql_poll_snapshot = None
+
+    def _poll_mysql(self, service):
+        # Kullanıcı başka sayfaya geçmişse kaynak kendini söker
+        if not self.current_service or self.current_service.name != 'mysql':
+            self._mysql_poll_id = None
+            return GLib.SOURCE_REMOVE
+
+        def compare(future):
+            try:
+                bundle = future.result()
+            except Exception as e:
+                logger.error(f"MySQL poll failed: {e}")
+                return GLib.SOURCE_REMOVE
+            previous = self._mysql_poll_snapshot
+            if bundle != previous:
+                self._mysql_poll_snapshot = bundle
+                # İlk tur sadece referans anlık görüntüsünü alır
+                if previous is not None:
+                    self._update_mysql_labels(service)
+            return GLib.SOURCE_REMOVE
+
+        future = self._io_pool.submit(service.get_mysql_status_bundle)
+        future.add_done_callback(lambda f: GLib.idle_add(compare, f))
+        return GLib.SOURCE_CONTINUE
+
+    def _schedule_reload(self):
+        """Servis listesi yenilemesini aynı main-loop turunda birleştir
+
+        Art arda gelen start/stop tıklamaları tek _load_services
+        koşusuna katlanır.
+        """
+        if self._reload_pending:
+            return
+        self._reload_pending = True
+        GLib.idle_add(self._do_reload)
+
+    def _do_reload(self):
+        self._reload_pending = False
+        self._load_services()
+        return GLib.SOURCE_REMOVE
+
+    def _request_refresh(self):
+        """Detay sayfası yenilemesini debounce'la
+
+        Her çağrı 50 ms'lik pencereyi baştan başlatır; art arda gelen
+        mutasyonlar sustuktan sonra sayfa bir kez yeniden kurulur.
+        """
+        if self._refresh_timeout_id:
+            GLib.source_remove(self._refresh_timeout_id)
+        self._refresh_timeout_id = GLib.timeout_add(50, self._do_refresh)
+
+    def _do_refresh(self):
+        self._refresh_timeout_id = 0
+        self._refresh_detail_page()
+        return GLib.SOURCE_REMOVE
+
     def _refresh_detail_page(self):
         """Refresh the current detail page"""
         if self.current_service:
-            # Detay sayfasını yeniden oluştur
+            # Önce yerinde güncellemeyi dene: durum etiketi ve eylem
+            # satırları setter'larla değişir, widget ağacı yıkılmaz
+            if self._refresh_detail_in_place(self.current_service):
+                return
+
+            # Detay sayfasını yeniden oluştur ve cache'teki kopyayı tazele
             detail_page = self._create_service_detail_page(self.current_service)
-            
-            # Eski detay sayfasını kaldır
-            old_detail = self.main_stack.get_child_by_name("detail")
-            if old_detail:
-                self.main_stack.remove(old_detail)
-            
-            # Yeni detay sayfasını ekle
-            self.main_stack.add_named(detail_page, "detail")
-            
+            self._cache_detail_page(self.current_service.name, detail_page)
+
             # Detay sayfasını göster (zaten gösteriliyorsa değişmez)
-            self.main_stack.set_visible_child_name("detail")
+            self._show_detail_widget(self.current_service.name, detail_page)
+
+    def _apply_detail_status(self, widgets, status):
+        """Durum etiketini metin + css sınıfıyla yerinde güncelle"""
+        text, css = _STATUS_PRESENTATION.get(status, _STATUS_PRESENTATION_DEFAULT)
+
+        label = widgets['status_label']
+        old_css = widgets.get('status_css')
+        if old_css and old_css != css:
+            label.remove_css_class(old_css)
+        if css and css != old_css:
+            label.add_css_class(css)
+        widgets['status_css'] = css
+        label.set_label(text)
+
+    def _apply_action_visibility(self, widgets, status):
+        """Eylem satırlarının görünürlüğünü servis durumuna göre seç"""
+        installed = status in ("running", "stopped")
+        running = status == "running"
+        widgets['stop_row'].set_visible(running)
+        widgets['restart_row'].set_visible(running)
+        widgets['start_row'].set_visible(installed and not running)
+        widgets['uninstall_row'].set_visible(installed)
+        widgets['install_row'].set_visible(not installed)
+
+    def _refresh_detail_in_place(self, service):
+        """Detay sayfasını yıkmadan güncellemeyi dene
+
+        Sayfa cache'te ve servis bölüm verileri geçersiz kılınmamışsa
+        durum + eylem görünürlüğü setter'larla tazelenir. Bölüm içeriği
+        değişmişse (info cache düşürülmüş) tam rebuild'e düşülür.
+        """
+        if self._detail_pages.get(service.name) is None:
+            return False
+        widgets = self._detail_widgets.get(service.name)
+        if not widgets:
+            return False
+        if service.name in ('apache', 'mysql', 'php') and not self._info_cache.get(service.name):
+            # Mutasyon sonrası _invalidate_info bölümleri bayatlattı
+            return False
+
+        status = service.get_status().value
+
+        # Gözlemlenebilir hiçbir şey değişmediyse setter'lara bile
+        # gidilmez: durum + (varsa) cache'teki MySQL bundle alanlarından
+        # ucuz bir imza tutulur ve eşleşince erken dönülür
+        sig = (status,)
+        entry = self._info_cache.get(service.name, {}).get('mysql_status')
+        if entry is not None and not isinstance(entry[1], Exception):
+            bundle = entry[1]
+            sig = (status, bundle.get('root_access'),
+                   bundle.get('auth_method'), bundle.get('version'),
+                   bundle.get('databases_count'), bundle.get('users_count'))
+        if self._detail_signatures.get(service.name) == sig:
+            return True
+        self._detail_signatures[service.name] = sig
+
+        self._apply_detail_status(widgets, status)
+        self._apply_action_visibility(widgets, status)
+        return True
     
     def _create_service_detail_page(self, service):
         """Create service detail page"""
+        # Yeni nesil: önceki sayfa için havada kalan worker sonuçları
+        # idle callback'te bu sayaçla elenip çöpe gider
+        self._detail_generation += 1
+
+        # Rebuild eski sayfanın satır referanslarını biriktirmesin;
+        # imza da sıfırlanır ki sonraki yerinde yenileme kısa devre
+        # yapmadan etiketleri yeniden uygulasın
+        self._detail_refs[service.name] = []
+        self._detail_signatures.pop(service.name, None)
+
         scrolled = Gtk.ScrolledWindow()
         scrolled.set_vexpand(True)
         scrolled.set_hexpand(True)
@@ -799,258 +1681,313 @@ class MainWindow(Adw.ApplicationWindow):
         main_box.set_margin_bottom(24)
         main_box.set_margin_start(24)
         main_box.set_margin_end(24)
-        
+
+        # Gruplar eklenirken stil geçersiz kılmaları tek geçişte
+        # toplansın diye kutu kurulum boyunca gizli tutulur; notify
+        # sinyalleri de dondurulur ki her append ayrı yayın yapmasın
+        main_box.set_visible(False)
+        main_box.freeze_notify()
+
         # Header section
         header_group = Adw.PreferencesGroup()
         header_group.set_title(service.display_name)
         header_group.set_description(service.description)
         
-        # Status row
+        # Status row - label referansı saklanır ki yenileme sayfayı
+        # yıkmadan set_label ile yapılabilsin
         status = service.get_status().value
         status_row = Adw.ActionRow()
-        status_row.set_title(_("Status"))
-        
-        if status == "running":
-            status_label = Gtk.Label(label="🟢 Running")
-            status_label.add_css_class("success")
-        elif status == "stopped":
-            status_label = Gtk.Label(label="🔴 Stopped")
-            status_label.add_css_class("warning")
-        elif status == "not_installed":
-            status_label = Gtk.Label(label="❌ Not Installed")
-            status_label.add_css_class("error")
-        else:
-            status_label = Gtk.Label(label="⚪ Unknown")
-        
+        status_row.set_title(_S.STATUS)
+
+        status_label = Gtk.Label()
+        widgets = {'status_label': status_label, 'status_css': None}
+        self._detail_widgets[service.name] = widgets
+        self._apply_detail_status(widgets, status)
+
         status_row.add_suffix(status_label)
         header_group.add(status_row)
         
         # Port row
         if service.default_port:
-            port_row = Adw.ActionRow()
-            port_row.set_title(_("Port"))
-            port_label = Gtk.Label(label=str(service.default_port))
-            port_label.add_css_class("monospace")
-            port_row.add_suffix(port_label)
-            header_group.add(port_row)
-        
+            header_group.add(self._info_row(_S.PORT, str(service.default_port)))
+
         # Type row
-        type_row = Adw.ActionRow()
-        type_row.set_title(_("Type"))
-        type_label = Gtk.Label(label=service.service_type.value.replace('_', ' ').title())
-        type_row.add_suffix(type_label)
-        header_group.add(type_row)
+        header_group.add(self._info_row(
+            _S.TYPE, service.service_type.value.replace('_', ' ').title(),
+            mono=False))
         
         main_box.append(header_group)
         
         # Actions section
         actions_group = Adw.PreferencesGroup()
-        actions_group.set_title(_("Actions"))
-        
-        if service.is_installed():
-            # Service control buttons
-            if service.is_running():
-                # Stop button
-                stop_row = Adw.ActionRow()
-                stop_row.set_title(_("Stop Service"))
-                stop_row.set_subtitle(_("Stop the running service"))
-                stop_row.set_activatable(True)
-                stop_row.connect("activated", lambda r: self._on_service_stop(service))
-                stop_icon = Gtk.Image.new_from_icon_name("media-playback-stop-symbolic")
-                stop_row.add_prefix(stop_icon)
-                actions_group.add(stop_row)
-                
-                # Restart button
-                restart_row = Adw.ActionRow()
-                restart_row.set_title(_("Restart Service"))
-                restart_row.set_subtitle(_("Restart the service"))
-                restart_row.set_activatable(True)
-                restart_row.connect("activated", lambda r: self._on_service_restart(service))
-                restart_icon = Gtk.Image.new_from_icon_name("view-refresh-symbolic")
-                restart_row.add_prefix(restart_icon)
-                actions_group.add(restart_row)
-            else:
-                # Start button
-                start_row = Adw.ActionRow()
-                start_row.set_title(_("Start Service"))
-                start_row.set_subtitle(_("Start the service"))
-                start_row.set_activatable(True)
-                start_row.connect("activated", lambda r: self._on_service_start(service))
-                start_icon = Gtk.Image.new_from_icon_name("media-playback-start-symbolic")
-                start_row.add_prefix(start_icon)
-                actions_group.add(start_row)
-            
-            # Uninstall button
-            uninstall_row = Adw.ActionRow()
-            uninstall_row.set_title(_("Uninstall"))
-            uninstall_row.set_subtitle(_("Remove this service from your system"))
-            uninstall_row.set_activatable(True)
-            uninstall_row.connect("activated", lambda r: self._on_service_uninstall(service))
-            uninstall_icon = Gtk.Image.new_from_icon_name("user-trash-symbolic")
-            uninstall_row.add_prefix(uninstall_icon)
-            actions_group.add(uninstall_row)
-        else:
-            # Install button
-            install_row = Adw.ActionRow()
-            install_row.set_title(_("Install"))
-            install_row.set_subtitle(_("Install this service and its dependencies"))
-            install_row.set_activatable(True)
-            install_row.connect("activated", lambda r: self._on_service_install(service))
-            install_icon = Gtk.Image.new_from_icon_name("document-save-symbolic")
-            install_row.add_prefix(install_icon)
-            actions_group.add(install_row)
-        
+        actions_group.set_title(_S.ACTIONS)
+        
+        # Tüm eylem satırları bir kez kurulur; hangilerinin görüneceği
+        # duruma göre set_visible ile seçilir - yenileme satır
+        # yaratmadan sadece görünürlük çevirir
+        widgets['stop_row'] = self._action_row(
+            _S.STOP_SERVICE, _S.STOP_SUBTITLE,
+            "media-playback-stop-symbolic", '_on_service_stop', service)
+        widgets['restart_row'] = self._action_row(
+            _S.RESTART_SERVICE, _S.RESTART_SUBTITLE,
+            "view-refresh-symbolic", '_on_service_restart', service)
+        widgets['start_row'] = self._action_row(
+            _S.START_SERVICE, _S.START_SUBTITLE,
+            "media-playback-start-symbolic", '_on_service_start', service)
+        widgets['uninstall_row'] = self._action_row(
+            _S.UNINSTALL, _S.UNINSTALL_SUBTITLE,
+            "user-trash-symbolic", '_on_service_uninstall', service)
+        widgets['install_row'] = self._action_row(
+            _S.INSTALL, _S.INSTALL_SUBTITLE,
+            "document-save-symbolic", '_on_service_install', service)
+        for key in ('stop_row', 'restart_row', 'start_row',
+                    'uninstall_row', 'install_row'):
+            actions_group.add(widgets[key])
+        self._apply_action_visibility(widgets, status)
+
         main_box.append(actions_group)
         
-        # Apache specific sections
+        # Servise özel bölümler subprocess çağrıları yapar; sayfayı
+        # sadece Start/Stop için açan kullanıcı bu maliyeti hiç ödemesin
+        # diye bölümler expander ilk açıldığında kurulur
         if service.name == "apache" and service.is_installed():
-            self._add_apache_sections(main_box, service)
-        
-        # MySQL specific sections
+            self._lazy_service_sections(main_box, service, self._add_apache_sections)
+
         if service.name == "mysql" and service.is_installed():
-            self._add_mysql_sections(main_box, service)
-        
-        # PHP specific sections
+            self._lazy_service_sections(main_box, service, self._add_mysql_sections)
+
         if service.name == "php" and service.is_installed():
-            self._add_php_sections(main_box, service)
-        
-        # Configuration section (placeholder)
-        config_group = Adw.PreferencesGroup()
-        config_group.set_title(_("Configuration"))
-        config_group.set_description(_("Configuration options coming soon"))
-        main_box.append(config_group)
-        
-        # Logs section (placeholder)
-        logs_group = Adw.PreferencesGroup()
-        logs_group.set_title(_("Logs"))
-        logs_group.set_description(_("Log viewer coming soon"))
-        main_box.append(logs_group)
-        
+            self._lazy_service_sections(main_box, service, self._add_php_sections)
+        
+        # Configuration / Logs placeholder bölümleri çoğu oturumda hiç
+        # görünmez - ilk scroll'a kadar eklenmez; widget'lar sabit
+        # olduğundan pencere başına tek çift kurulur ve scroll eden
+        # sayfaya re-parent edilir
+        def add_placeholders(*_args):
+            config_group, logs_group = self._get_placeholder_groups()
+            if config_group.get_parent() is main_box:
+                return
+            for group in (config_group, logs_group):
+                parent = group.get_parent()
+                if parent is not None:
+                    parent.remove(group)
+                main_box.append(group)
+
+        vadjustment = scrolled.get_vadjustment()
+        vadjustment.connect("value-changed", add_placeholders)
+
+        # Kaydırılamayacak kadar kısa sayfalarda value-changed hiç
+        # gelmez; sayfa her görünür olduğunda layout oturduktan sonra
+        # kontrol edilir ve sığıyorsa gruplar hemen eklenir
+        def add_if_unscrollable(widget):
+            def check():
+                if (scrolled.get_mapped()
+                        and vadjustment.get_upper() <= vadjustment.get_page_size()):
+                    add_placeholders()
+                return GLib.SOURCE_REMOVE
+            GLib.idle_add(check)
+
+        scrolled.connect("map", add_if_unscrollable)
+
+        main_box.thaw_notify()
+        main_box.set_visible(True)
         scrolled.set_child(main_box)
         return scrolled
     
+    def _get_placeholder_groups(self):
+        """Sabit Configuration/Logs gruplarını bir kez kur ve paylaş
+
+        İçerikleri servise bağlı değil; aynı iki widget o an scroll
+        edilen sayfanın kutusuna taşınır, her sayfa kurulumunda yeniden
+        üretilmez.
+        """
+        if self._placeholder_groups is None:
+            config_group = Adw.PreferencesGroup()
+            config_group.set_title(_S.CONFIGURATION)
+            config_group.set_description(_S.CONFIGURATION_SOON)
+
+            logs_group = Adw.PreferencesGroup()
+            logs_group.set_title(_S.LOGS)
+            logs_group.set_description(_S.LOGS_SOON)
+
+            self._placeholder_groups = (config_group, logs_group)
+        return self._placeholder_groups
+
+    def _lazy_service_sections(self, main_box, service, builder_fn):
+        """Servise özel bölümleri ilk açılışa kadar erteleyen expander
+
+        builder_fn ancak kullanıcı expander'ı açtığında çağrılır; ilk
+        boyamada Apache/MySQL/PHP alt sistemlerinin hiçbirine subprocess
+        gitmez.
+        """
+        expander = Gtk.Expander()
+        expander.set_label(_S.SERVICE_DETAILS)
+        expander.set_margin_top(6)
+
+        inner = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
+        inner.set_spacing(24)
+        inner.set_margin_top(12)
+        expander.set_child(inner)
+        expander._sections_built = False
+
+        def on_expanded(exp, pspec):
+            if exp._sections_built or not exp.get_expanded():
+                return
+            exp._sections_built = True
+            builder_fn(inner, service)
+
+        expander.connect("notify::expanded", on_expanded)
+        main_box.append(expander)
+
     def _add_mysql_sections(self, main_box, service):
         """Add MySQL-specific sections to detail page"""
-        
+
         # MySQL Status Information
-        mysql_info_group = Adw.PreferencesGroup()
-        mysql_info_group.set_title(_("MySQL Status"))
-        
-        try:
-            # Get MySQL info (sudo available from startup)
-            mysql_info = service.get_mysql_status_info()
-            
-            # Root access status
-            root_access_row = Adw.ActionRow()
-            root_access_row.set_title(_("Root Access"))
-            if mysql_info.get('root_access', False):
-                if mysql_info.get('auth_method') == 'Unix Socket (sudo mysql)':
-                    root_status_label = Gtk.Label(label="🔓 Unix Socket (sudo)")
-                    root_status_label.add_css_class("success")
-                else:
-                    root_status_label = Gtk.Label(label="🔐 Password Auth")
-                    root_status_label.add_css_class("success")
-            else:
-                root_status_label = Gtk.Label(label="🔒 Access Denied")
-                root_status_label.add_css_class("error")
-            
-            root_access_row.add_suffix(root_status_label)
-            mysql_info_group.add(root_access_row)
-            
-            # Root password/method display
-            auth_row = Adw.ActionRow()
-            auth_row.set_title(_("Authentication Method"))
-            auth_method = mysql_info.get('auth_method', 'Unknown')
-            auth_label = Gtk.Label(label=auth_method)
-            auth_label.add_css_class("monospace")
-            auth_row.add_suffix(auth_label)
-            mysql_info_group.add(auth_row)
-            
-            # Version row
-            version_row = Adw.ActionRow()
-            version_row.set_title(_("MySQL Version"))
-            version_label = Gtk.Label(label=mysql_info.get('version', 'Unknown'))
-            version_label.add_css_class("monospace")
-            version_row.add_suffix(version_label)
-            mysql_info_group.add(version_row)
-            
-            # Database count (clickable to show list)
-            db_count_row = Adw.ActionRow()
-            db_count_row.set_title(_("Databases"))
-            db_count_row.set_subtitle(_("Click to view database list"))
-            db_count_label = Gtk.Label(label=str(mysql_info.get('databases_count', 0)))
-            db_count_label.add_css_class("monospace")
-            db_count_row.add_suffix(db_count_label)
-            db_count_row.set_activatable(True)
-            db_count_row.connect("activated", lambda r: self._show_mysql_databases(service, mysql_info.get('databases', [])))
-            mysql_info_group.add(db_count_row)
-            
-            # Users count (clickable to show list)  
-            users_count_row = Adw.ActionRow()
-            users_count_row.set_title(_("Users"))
-            users_count_row.set_subtitle(_("Click to view user list"))
-            users_count_label = Gtk.Label(label=str(mysql_info.get('users_count', 0)))
-            users_count_label.add_css_class("monospace")
-            users_count_row.add_suffix(users_count_label)
-            users_count_row.set_activatable(True)
-            users_count_row.connect("activated", lambda r: self._show_mysql_users(service, mysql_info.get('users', [])))
-            mysql_info_group.add(users_count_row)
-            
-        except Exception as e:
-            logger.error(f"Error getting MySQL info: {e}")
-            error_row = Adw.ActionRow()
-            error_row.set_title(_("Status"))
-            error_label = Gtk.Label(label="❌ Error loading info")
-            error_label.add_css_class("error")
-            error_row.add_suffix(error_label)
-            mysql_info_group.add(error_row)
-        
+        # İskelet GtkBuilder şablonundan tek geçişte kurulur; bilgiler
+        # worker thread'de toplanıp GLib.idle_add ile doldurulur
+        builder = Gtk.Builder.new_from_string(_MYSQL_SECTION_UI, -1)
+        mysql_info_group = builder.get_object('mysql_info_group')
+
+        # Worker sonucu buraya yazılır; tıklama handler'ları liste
+        # verilerini bu holder üzerinden okur
+        info_holder = {}
+
+        db_count_row = builder.get_object('db_count_row')
+        db_count_row.connect("activated", lambda r: self._show_mysql_databases(service, info_holder.get('databases', [])))
+
+        users_count_row = builder.get_object('users_count_row')
+        users_count_row.connect("activated", lambda r: self._show_mysql_users(service, info_holder.get('users', [])))
+
+        labels = {
+            'root_status': builder.get_object('root_status_label'),
+            'root_status_icon': builder.get_object('root_status_icon'),
+            'auth': builder.get_object('auth_label'),
+            'version': builder.get_object('version_label'),
+            'db_count': builder.get_object('db_count_label'),
+            'users_count': builder.get_object('users_count_label'),
+        }
+
+        # Hedefli güncelleme için referansları sakla - MySQL handler'ları
+        # tam sayfa rebuild yerine sadece bu label'ları tazeler
+        self._mysql_labels = labels
+        self._mysql_info_holder = info_holder
+
+        generation = self._detail_generation
+        future = self._io_pool.submit(self._fetch_mysql_info, service)
+        future.add_done_callback(
+            lambda f: GLib.idle_add(self._populate_mysql_info, generation, labels, info_holder, f)
+        )
+
         main_box.append(mysql_info_group)
         
         # MySQL Management Actions
         mysql_management_group = Adw.PreferencesGroup()
-        mysql_management_group.set_title(_("MySQL Management"))
+        mysql_management_group.set_title(_S.MYSQL_MANAGEMENT)
         
         # Change Root Password
-        password_row = Adw.ActionRow()
-        password_row.set_title(_("Change Root Password"))
-        password_row.set_subtitle(_("Set or change MySQL root password"))
-        password_row.set_activatable(True)
-        password_row.connect("activated", lambda r: self._on_mysql_change_password(service))
-        password_icon = Gtk.Image.new_from_icon_name("dialog-password-symbolic")
-        password_row.add_prefix(password_icon)
-        mysql_management_group.add(password_row)
+        mysql_management_group.add(self._action_row(
+            _S.CHANGE_ROOT_PASSWORD, _S.CHANGE_ROOT_PASSWORD_SUBTITLE,
+            "dialog-password-symbolic", '_on_mysql_change_password', service))
         
         main_box.append(mysql_management_group)
-    
 
-    
+    def _fetch_mysql_info(self, service):
+        """Worker: MySQL bundle'ını çek ve UI'nin basacağı stringleri kur
+
+        Biçimlendirme de havuz thread'inde yapılır; idle callback'i
+        sadece hazır stringleri set_label ile basar. Cache ham bundle'ı
+        tutar, türetilmiş alanlar kopyaya eklenir.
+        """
+        bundle = self._cached_info(
+            service, 'mysql_status', 10, service.get_mysql_status_bundle
+        )
+        info = dict(bundle)
+        info['auth_str'] = bundle.get('auth_method', 'Unknown')
+        info['version_str'] = bundle.get('version', 'Unknown')
+        info['db_count_str'] = str(bundle.get('databases_count', 0))
+        info['users_count_str'] = str(bundle.get('users_count', 0))
+        return info
+
+    def _populate_mysql_info(self, generation, labels, info_holder, future):
+        """Worker'dan gelen MySQL bilgilerini detay satırlarına yaz (UI thread)"""
+        # Sayfa bu arada yeniden kurulduysa sonuç bayat - dokunma
+        if generation != self._detail_generation:
+            return False
+
+        # Emoji yerine sembolik ikon: Pango'nun renkli emoji fallback
+        # yolunu tetiklemez, GTK ikonları zaten cache'ler
+        root_status_icon = labels['root_status_icon']
+        root_status_label = labels['root_status']
+
+        def apply_root_css(css):
+            # Satır yerinde tekrar tekrar güncellenir; önceki sınıf
+            # sökülmezse error/success aynı anda birikir
+            prev = labels.get('root_status_css')
+            if prev and prev != css:
+                root_status_icon.remove_css_class(prev)
+                root_status_label.remove_css_class(prev)
+            if css and css != prev:
+                root_status_icon.add_css_class(css)
+                root_status_label.add_css_class(css)
+            labels['root_status_css'] = css
+
+        try:
+            mysql_info = future.result()
+        except Exception as e:
+            logger.error(f"Error getting MySQL info: {e}")
+            root_status_icon.set_from_icon_name("emblem-important-symbolic")
+            root_status_label.set_label(_("Error loading info"))
+            apply_root_css("error")
+            return False
+
+        info_holder.update(mysql_info)
+
+        icon_name, label_text, _emoji, css = _MYSQL_AUTH_MAP[_mysql_auth_key(mysql_info)]
+        root_status_icon.set_from_icon_name(icon_name)
+        root_status_label.set_label(label_text)
+        apply_root_css(css)
+
+        labels['auth'].set_label(mysql_info['auth_str'])
+        labels['version'].set_label(mysql_info['version_str'])
+        labels['db_count'].set_label(mysql_info['db_count_str'])
+        labels['users_count'].set_label(mysql_info['users_count_str'])
+        return False
+
+    def _update_mysql_labels(self, service):
+        """MySQL bilgi satırlarını yerinde tazele - tam sayfa rebuild yok
+
+        Widget ağacı olduğu gibi kalır; sadece durum bundle'ı yeniden
+        çekilir ve mevcut label'lara yazılır.
+        """
+        labels = getattr(self, '_mysql_labels', None)
+        if not labels:
+            self._request_refresh()
+            return
+
+        self._invalidate_info(service)
+        generation = self._detail_generation
+        info_holder = self._mysql_info_holder
+        future = self._io_pool.submit(self._fetch_mysql_info, service)
+        future.add_done_callback(
+            lambda f: GLib.idle_add(self._populate_mysql_info, generation, labels, info_holder, f)
+        )
+
     def _show_mysql_detailed_info(self, mysql_info_group, mysql_info, service):
         """Show detailed MySQL information"""
         # Root access status
         root_access_row = Adw.ActionRow()
         root_access_row.set_title(_("Root Access"))
-        if mysql_info.get('root_access', False):
-            if mysql_info.get('auth_method') == 'Unix Socket (sudo mysql)':
-                root_status_label = Gtk.Label(label="🔓 Unix Socket (sudo)")
-                root_status_label.add_css_class("success")
-            else:
-                root_status_label = Gtk.Label(label="🔐 Password Auth")
-                root_status_label.add_css_class("success")
-        else:
-            root_status_label = Gtk.Label(label="🔒 Access Denied")
-            root_status_label.add_css_class("error")
+        _icon_name, _label, emoji_text, css = _MYSQL_AUTH_MAP[_mysql_auth_key(mysql_info)]
+        root_status_label = Gtk.Label(label=emoji_text)
+        root_status_label.add_css_class(css)
         
         root_access_row.add_suffix(root_status_label)
         mysql_info_group.add(root_access_row)
         
         # Database count (clickable to show list)
-        db_count_row = Adw.ActionRow()
-        db_count_row.set_title(_("Databases"))
-        db_count_row.set_subtitle(_("Click to view database list"))
-        db_count_label = Gtk.Label(label=str(mysql_info.get('databases_count', 0)))
-        db_count_label.add_css_class("monospace")
-        db_count_row.add_suffix(db_count_label)
+        db_count_row = self._info_row(
+            _("Databases"), str(mysql_info.get('databases_count', 0)),
+            subtitle=_("Click to view database list"))
         db_count_row.set_activatable(True)
         db_count_row.connect("activated", lambda r: self._show_mysql_databases(service, mysql_info.get('databases', [])))
         mysql_info_group.add(db_count_row)
@@ -1060,9 +1997,11 @@ class MainWindow(Adw.ApplicationWindow):
     
     def _on_mysql_change_password(self, service):
         """MySQL root password change dialog"""
-        dialog = Adw.MessageDialog.new(self, _("Set MySQL Root Password"), None)
-        dialog.set_body(_("Set a new password for MySQL root user. Current password is not required."))
-        
+        dialog = self._make_dialog(
+            _("Set MySQL Root Password"),
+            _("Set a new password for MySQL root user. Current password is not required."),
+            _("Set Password"))
+
         # Create form
         form_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
         form_box.set_spacing(12)
@@ -1072,13 +2011,13 @@ class MainWindow(Adw.ApplicationWindow):
         new_label = Gtk.Label(label=_("New Password:"))
         new_label.set_halign(Gtk.Align.START)
         new_entry = Gtk.PasswordEntry()
-        new_entry.set_property("placeholder-text", "Enter new password")
+        new_entry.props.placeholder_text = "Enter new password"
         
         # Confirm password
         confirm_label = Gtk.Label(label=_("Confirm Password:"))
         confirm_label.set_halign(Gtk.Align.START)
         confirm_entry = Gtk.PasswordEntry()
-        confirm_entry.set_property("placeholder-text", "Confirm new password")
+        confirm_entry.props.placeholder_text = "Confirm new password"
         
         form_box.append(new_label)
         form_box.append(new_entry)
@@ -1086,93 +2025,122 @@ class MainWindow(Adw.ApplicationWindow):
         form_box.append(confirm_entry)
         
         dialog.set_extra_child(form_box)
-        dialog.add_response("cancel", _("Cancel"))
-        dialog.add_response("change", _("Set Password"))
-        dialog.set_response_appearance("change", Adw.ResponseAppearance.SUGGESTED)
-        
+
         def on_response(dialog, response):
-            if response == "change":
+            if response == "ok":
+                # Entry'ler bir kez okunur; ucuz kontrol önce gelir ki
+                # boş şifrede ikinci entry'ye hiç gidilmesin
                 new_password = new_entry.get_text()
-                confirm_password = confirm_entry.get_text()
-                
                 if not new_password:
                     self._show_toast(_("Password cannot be empty"))
                     return
-                
-                if new_password != confirm_password:
+
+                if new_password != confirm_entry.get_text():
                     self._show_toast(_("Passwords do not match"))
                     return
                 
-                # Reset password (no current password needed)
-                try:
-                    success, message = service.reset_root_password(new_password)
-                    if success:
-                        self._show_toast(_("MySQL root password set successfully!"))
-                        # Refresh detail page to show new auth method
-                        if self.current_service and self.current_service.name == service.name:
-                            GLib.timeout_add_seconds(1, self._refresh_detail_page)
-                    else:
-                        self._show_toast(_("Failed to set MySQL root password: {error}").format(error=message))
-                except Exception as e:
-                    logger.error(f"Error setting MySQL root password: {e}")
-                    self._show_toast(_("Error: {error}").format(error=str(e)))
-                
+                # Reset password worker'da koşar; yenileme körlemesine
+                # timer yerine işin gerçekten bittiği anda tetiklenir
                 dialog.close()
+                future = self._io_pool.submit(service.reset_root_password, new_password)
+                future.add_done_callback(
+                    lambda f: GLib.idle_add(self._on_password_reset_done, service, f))
         
         dialog.connect("response", on_response)
         dialog.present()
-    
+
+    def _on_mysql_op_done(self, service, future):
+        """Worker'daki MySQL mutasyonu bitti - toast + label tazele"""
+        try:
+            success, message = future.result()
+        except Exception as e:
+            logger.error(f"MySQL operation error: {e}")
+            self._show_toast(_("Error: {error}").format(error=str(e)))
+            return GLib.SOURCE_REMOVE
+
+        self._show_toast(message)
+        if success:
+            # Sadece sayaç label'ları değişiyor - rebuild gereksiz
+            if self.current_service and self.current_service.name == service.name:
+                self._update_mysql_labels(service)
+            else:
+                self._invalidate_info(service)
+        return GLib.SOURCE_REMOVE
+
+    def _on_password_reset_done(self, service, future):
+        """Root şifre sıfırlama worker'ı bitti - sonucu UI'ya yansıt"""
+        try:
+            success, message = future.result()
+        except Exception as e:
+            logger.error(f"Error setting MySQL root password: {e}")
+            self._show_toast(_("Error: {error}").format(error=str(e)))
+            return GLib.SOURCE_REMOVE
+
+        if success:
+            self._show_toast(_("MySQL root password set successfully!"))
+            self._invalidate_info(service)
+            # Refresh detail page to show new auth method
+            if self.current_service and self.current_service.name == service.name:
+                self._update_mysql_labels(service)
+        else:
+            self._show_toast(_("Failed to set MySQL root password: {error}").format(error=message))
+        return GLib.SOURCE_REMOVE
+
     def _on_mysql_secure_installation(self, service):
         """MySQL secure installation guide"""
         dialog = Adw.MessageDialog.new(self, _("MySQL Secure Installation"), None)
-        
-        success, message = service.run_mysql_secure_installation()
-        dialog.set_body(message)
-        
-        if success:
-            dialog.set_body(dialog.get_body() + "\n\n" + _("Open a terminal and run the command to secure your MySQL installation."))
-            dialog.add_response("terminal", _("Open Terminal"))
-            dialog.add_response("ok", _("OK"))
-            dialog.set_response_appearance("terminal", Adw.ResponseAppearance.SUGGESTED)
-        else:
-            dialog.add_response("ok", _("OK"))
-        
+
+        # Diyalog hemen açılır; komut hazırlığı worker'da koşar ve
+        # sonuç idle ile gövdeye yazılır - ana döngü hiç beklemez
+        dialog.set_body(_S.LOADING)
+        dialog.add_response("ok", _S.OK)
+
+        def apply_result(future):
+            try:
+                success, message = future.result()
+            except Exception as e:
+                logger.error(f"Error preparing mysql_secure_installation: {e}")
+                dialog.set_body(_("Error retrieving information"))
+                return GLib.SOURCE_REMOVE
+            if success:
+                message = message + "\n\n" + _("Open a terminal and run the command to secure your MySQL installation.")
+                dialog.add_response("terminal", _("Open Terminal"))
+                dialog.set_response_appearance("terminal", Adw.ResponseAppearance.SUGGESTED)
+            dialog.set_body(message)
+            return GLib.SOURCE_REMOVE
+
+        future = self._io_pool.submit(service.run_mysql_secure_installation)
+        future.add_done_callback(lambda f: GLib.idle_add(apply_result, f))
+
         def on_response(dialog, response):
             if response == "terminal":
-                # Open terminal with the command
-                import subprocess
-                try:
-                    subprocess.Popen(['gnome-terminal', '--', 'mysql_secure_installation'])
-                except:
-                    try:
-                        subprocess.Popen(['xterm', '-e', 'mysql_secure_installation'])
-                    except:
-                        self._show_toast(_("Could not open terminal. Run 'mysql_secure_installation' manually."))
-        
+                # Başlangıçta çözülen terminal ile komutu aç
+                if not self._spawn_terminal('mysql_secure_installation'):
+                    self._show_toast(_("Could not open terminal. Run 'mysql_secure_installation' manually."))
+
         dialog.connect("response", on_response)
         dialog.present()
     
     def _on_mysql_create_database(self, service):
         """MySQL create database dialog"""
-        dialog = Adw.MessageDialog.new(self, _("Create MySQL Database"), None)
-        dialog.set_body(_("Enter the name for the new database"))
-        
+        dialog = self._make_dialog(
+            _("Create MySQL Database"),
+            _("Enter the name for the new database"),
+            _S.CREATE)
+
         # Database name entry
         entry_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
         entry_box.set_spacing(8)
         entry_box.set_margin_top(12)
         
         entry = Gtk.Entry()
-        entry.set_property("placeholder-text", "Database name")
+        entry.set_placeholder_text("Database name")
         entry_box.append(entry)
         
         dialog.set_extra_child(entry_box)
-        dialog.add_response("cancel", _("Cancel"))
-        dialog.add_response("create", _("Create"))
-        dialog.set_response_appearance("create", Adw.ResponseAppearance.SUGGESTED)
-        
+
         def on_response(dialog, response):
-            if response == "create":
+            if response == "ok":
                 db_name = entry.get_text().strip()
                 if not db_name:
                     self._show_toast(_("Database name cannot be empty"))
@@ -1180,23 +2148,22 @@ class MainWindow(Adw.ApplicationWindow):
                 
                 dialog.close()
                 
-                # Create database (sudo already available from startup)
-                success, message = service.create_database(db_name)
-                self._show_toast(message)
-                
-                if success:
-                    # Refresh detail page
-                    if self.current_service and self.current_service.name == service.name:
-                        self._refresh_detail_page()
+                # Create database worker'da (sudo already available
+                # from startup); sonuç done-callback ile UI'ya döner
+                future = self._io_pool.submit(service.create_database, db_name)
+                future.add_done_callback(
+                    lambda f: GLib.idle_add(self._on_mysql_op_done, service, f))
         
         dialog.connect("response", on_response)
         dialog.present()
     
     def _on_mysql_create_user(self, service):
         """MySQL create user dialog"""
-        dialog = Adw.MessageDialog.new(self, _("Create MySQL User"), None)
-        dialog.set_body(_("Enter user details"))
-        
+        dialog = self._make_dialog(
+            _("Create MySQL User"),
+            _("Enter user details"),
+            _("Create User"))
+
         # Create form
         form_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
         form_box.set_spacing(12)
@@ -1206,19 +2173,19 @@ class MainWindow(Adw.ApplicationWindow):
         username_label = Gtk.Label(label=_("Username:"))
         username_label.set_halign(Gtk.Align.START)
         username_entry = Gtk.Entry()
-        username_entry.set_property("placeholder-text", "Username")
+        username_entry.set_placeholder_text("Username")
         
         # Password
         password_label = Gtk.Label(label=_("Password:"))
         password_label.set_halign(Gtk.Align.START)
         password_entry = Gtk.PasswordEntry()
-        password_entry.set_property("placeholder-text", "Password")
+        password_entry.props.placeholder_text = "Password"
         
         # Host
         host_label = Gtk.Label(label=_("Host (optional):"))
         host_label.set_halign(Gtk.Align.START)
         host_entry = Gtk.Entry()
-        host_entry.set_property("placeholder-text", "localhost")
+        host_entry.set_placeholder_text("localhost")
         host_entry.set_text("localhost")
         
         form_box.append(username_label)
@@ -1229,60 +2196,59 @@ class MainWindow(Adw.ApplicationWindow):
         form_box.append(host_entry)
         
         dialog.set_extra_child(form_box)
-        dialog.add_response("cancel", _("Cancel"))
-        dialog.add_response("create", _("Create User"))
-        dialog.set_response_appearance("create", Adw.ResponseAppearance.SUGGESTED)
-        
+
         def on_response(dialog, response):
-            if response == "create":
+            if response == "ok":
+                # En ucuz kontrol önce: boş alan varsa diğer entry'ler
+                # hiç okunmadan çıkılır
                 username = username_entry.get_text().strip()
+                if not username:
+                    self._show_toast(_("Username and password are required"))
+                    return
+
                 password = password_entry.get_text()
-                host = host_entry.get_text().strip() or "localhost"
-                
-                if not username or not password:
+                if not password:
                     self._show_toast(_("Username and password are required"))
                     return
-                
+
+                host = host_entry.get_text().strip() or "localhost"
+
                 dialog.close()
                 
-                # Check if we need sudo password
-                mysql_info = service.get_mysql_status_info()
+                # Check if we need sudo password - TTL cache'li bundle
+                # yeterli, auth yöntemi için ayrı mysql turu atılmaz
+                mysql_info = self._cached_info(
+                    service, 'mysql_status', 10, service.get_mysql_status_bundle
+                )
                 if mysql_info.get('auth_method') == 'Unix Socket (sudo mysql)':
                     # Need sudo password
                     def on_password_provided(sudo_password):
-                        success, message = service.create_user(username, password, host, sudo_password=sudo_password)
-                        self._show_toast(message)
-                        
-                        if success:
-                            # Refresh detail page
-                            if self.current_service and self.current_service.name == service.name:
-                                self._refresh_detail_page()
+                        future = self._io_pool.submit(
+                            service.create_user, username, password, host,
+                            sudo_password=sudo_password)
+                        future.add_done_callback(
+                            lambda f: GLib.idle_add(self._on_mysql_op_done, service, f))
                     
                     self._show_sudo_password_dialog(on_password_provided)
                 else:
                     # Use existing password
-                    success, message = service.create_user(username, password, host)
-                    self._show_toast(message)
-                    
-                    if success:
-                        # Refresh detail page
-                        if self.current_service and self.current_service.name == service.name:
-                            self._refresh_detail_page()
+                    future = self._io_pool.submit(
+                        service.create_user, username, password, host)
+                    future.add_done_callback(
+                        lambda f: GLib.idle_add(self._on_mysql_op_done, service, f))
         
         dialog.connect("response", on_response)
         dialog.present()
     
     def _on_mysql_setup_clients(self, service):
         """Setup MySQL for client applications"""
-        dialog = Adw.MessageDialog.new(self, _("Setup MySQL for Client Applications"), None)
-        dialog.set_body(_("This will configure MySQL to work with external client applications like Navicat, DBGate, and phpMyAdmin."))
-        
-        dialog.add_response("cancel", _("Cancel"))
-        dialog.add_response("setup", _("Setup"))
-        dialog.set_response_appearance("setup", Adw.ResponseAppearance.SUGGESTED)
-        
+        dialog = self._make_dialog(
+            _("Setup MySQL for Client Applications"),
+            _("This will configure MySQL to work with external client applications like Navicat, DBGate, and phpMyAdmin."),
+            _("Setup"))
+
         def on_response(dialog, response):
-            if response == "setup":
+            if response == "ok":
                 self._run_service_action_with_progress(
                     service, 
                     lambda: service.setup_for_clients(),
@@ -1297,321 +2263,419 @@ class MainWindow(Adw.ApplicationWindow):
     def _on_mysql_connection_info(self, service):
         """Show MySQL connection information"""
         dialog = Adw.MessageDialog.new(self, _("MySQL Connection Information"), None)
-        
-        try:
-            # Get connection info
-            connection_info = service.get_connection_info()
-            
-            info_text = ""
-            
+        dialog.set_body(_S.LOADING)
+        dialog.add_response("close", _S.CLOSE)
+        dialog.set_response_appearance("close", Adw.ResponseAppearance.SUGGESTED)
+        dialog.present()
+
+        def build_body():
+            # Worker: veri çekme + metin kurma burada; UI callback'i
+            # sadece hazır gövdeyi basar. (Kısa TTL cache - art arda
+            # açılışlar yeni subprocess turu ödemez)
+            connection_info = self._cached_info(
+                service, 'connection_info', 5, service.get_connection_info
+            )
+
             if connection_info.get('running', False):
-                # TCP Connection info
+                # Parça listesi + tek join: += zincirinin her adımda
+                # yaptığı kopya/yeniden tahsis turlarına girilmez
                 tcp_info = connection_info.get('tcp_connection', {})
-                info_text += f"🌐 **TCP Connection (for client apps):**\n"
-                info_text += f"   Host: {tcp_info.get('host', 'localhost')}\n"
-                info_text += f"   Port: {tcp_info.get('port', 3306)}\n"
-                info_text += f"   Username: {tcp_info.get('username', 'root')}\n"
-                
-                if tcp_info.get('password'):
-                    info_text += f"   Password: {tcp_info.get('password')}\n"
-                else:
-                    info_text += f"   Password: (Set password first)\n"
-                
-                info_text += f"\n🔌 **Socket Connection:**\n"
                 socket_info = connection_info.get('socket_connection', {})
-                info_text += f"   Socket: {socket_info.get('socket_path', '/var/run/mysqld/mysqld.sock')}\n"
-                info_text += f"   Legacy: {socket_info.get('legacy_socket', '/tmp/mysql.sock')}\n"
-                
-                info_text += f"\n📱 **Client Applications:**\n"
                 client_apps = connection_info.get('client_apps', {})
-                
-                # Navicat
                 navicat = client_apps.get('navicat', {})
-                info_text += f"   **Navicat:**\n"
-                info_text += f"   • Connection Type: {navicat.get('connection_type', 'MySQL')}\n"
-                info_text += f"   • Host: {navicat.get('host', 'localhost')}\n"
-                info_text += f"   • Port: {navicat.get('port', 3306)}\n"
-                info_text += f"   • Username: {navicat.get('username', 'root')}\n"
-                
-                # DBGate
                 dbgate = client_apps.get('dbgate', {})
-                info_text += f"\n   **DBGate:**\n"
-                info_text += f"   • Engine: {dbgate.get('engine', 'mysql@dbgate-plugin-mysql')}\n"
-                info_text += f"   • Server: {dbgate.get('server', 'localhost')}\n"
-                info_text += f"   • Port: {dbgate.get('port', 3306)}\n"
-                info_text += f"   • User: {dbgate.get('user', 'root')}\n"
+
+                parts = [
+                    "🌐 **TCP Connection (for client apps):**\n",
+                    f"   Host: {tcp_info.get('host', 'localhost')}\n",
+                    f"   Port: {tcp_info.get('port', 3306)}\n",
+                    f"   Username: {tcp_info.get('username', 'root')}\n",
+                    f"   Password: {tcp_info.get('password')}\n"
+                    if tcp_info.get('password')
+                    else "   Password: (Set password first)\n",
+                    "\n🔌 **Socket Connection:**\n",
+                    f"   Socket: {socket_info.get('socket_path', '/var/run/mysqld/mysqld.sock')}\n",
+                    f"   Legacy: {socket_info.get('legacy_socket', '/tmp/mysql.sock')}\n",
+                    "\n📱 **Client Applications:**\n",
+                    "   **Navicat:**\n",
+                    f"   • Connection Type: {navicat.get('connection_type', 'MySQL')}\n",
+                    f"   • Host: {navicat.get('host', 'localhost')}\n",
+                    f"   • Port: {navicat.get('port', 3306)}\n",
+                    f"   • Username: {navicat.get('username', 'root')}\n",
+                    "\n   **DBGate:**\n",
+                    f"   • Engine: {dbgate.get('engine', 'mysql@dbgate-plugin-mysql')}\n",
+                    f"   • Server: {dbgate.get('server', 'localhost')}\n",
+                    f"   • Port: {dbgate.get('port', 3306)}\n",
+                    f"   • User: {dbgate.get('user', 'root')}\n",
+                ]
+                info_text = "".join(parts)
             else:
                 info_text = "❌ MySQL service is not running.\nStart the service to view connection information."
-            
-            dialog.set_body(info_text)
-            
-        except Exception as e:
-            logger.error(f"Error getting connection info: {e}")
-            dialog.set_body(_("Error retrieving connection information"))
-        
-        dialog.add_response("close", _("Close"))
-        dialog.set_response_appearance("close", Adw.ResponseAppearance.SUGGESTED)
-        dialog.present()
+            return info_text
+
+        def apply_body(future):
+            try:
+                dialog.set_body(future.result())
+            except Exception as e:
+                logger.error(f"Error getting connection info: {e}")
+                dialog.set_body(_("Error retrieving connection information"))
+            return GLib.SOURCE_REMOVE
+
+        future = self._io_pool.submit(build_body)
+        future.add_done_callback(lambda f: GLib.idle_add(apply_body, f))
     
+    def _lazy_group(self, title, builder_fn, service, description=None):
+        """Başlığı hemen, satırları ilk map'te kuran PreferencesGroup
+
+        Grup ekranda görünür olana kadar builder_fn (ve onun servis
+        çağrıları) hiç koşmaz; bir kezlik guard tekrar map olmalarda
+        yeniden kurmayı önler.
+        """
+        group = Adw.PreferencesGroup()
+        group.set_title(title)
+        if description:
+            group.set_description(description)
+        group._built = False
+
+        def on_map(g):
+            if g._built:
+                return
+            g._built = True
+            builder_fn(g, service)
+
+        group.connect("map", on_map)
+        return group
+
+    def _group_error_row(self, group, e):
+        """Builder hatasını grup içinde görünür kıl"""
+        error_row = Adw.ActionRow()
+        error_row.set_title(_S.ERROR)
+        error_row.set_subtitle(str(e))
+        error_row.set_sensitive(False)
+        group.add(error_row)
+
+    def _async_group_rows(self, group, fetch_fn, populate_fn):
+        """Grup verisini worker'da çek, satırları idle callback'te kur
+
+        Beklerken grupta dönen bir spinner satırı durur; sonuç gelince
+        kaldırılır ve populate_fn gerçek satırları ekler. Ana döngü
+        hiçbir subprocess turunu beklemez; hata grup içinde gösterilir.
+        """
+        spinner_row = Adw.ActionRow()
+        spinner_row.set_title(_S.LOADING)
+        spinner_row.set_sensitive(False)
+        spinner = Gtk.Spinner()
+        spinner.start()
+        spinner_row.add_prefix(spinner)
+        group.add(spinner_row)
+
+        generation = self._detail_generation
+
+        def apply(future):
+            # Sayfa bu arada yeniden kurulduysa sonuç bayat - dokunma
+            if generation != self._detail_generation:
+                return GLib.SOURCE_REMOVE
+            spinner.stop()
+            group.remove(spinner_row)
+            try:
+                data = future.result()
+            except Exception as e:
+                logger.error(f"Error loading group data: {e}")
+                self._group_error_row(group, e)
+                return GLib.SOURCE_REMOVE
+            group.freeze_notify()
+            try:
+                populate_fn(group, data)
+            except Exception as e:
+                logger.error(f"Error building group rows: {e}")
+                self._group_error_row(group, e)
+            finally:
+                group.thaw_notify()
+            return GLib.SOURCE_REMOVE
+
+        future = self._io_pool.submit(fetch_fn)
+        future.add_done_callback(lambda f: GLib.idle_add(apply, f))
+
     def _add_php_sections(self, main_box, service):
-        """Add PHP-specific sections to detail page"""
-        
-        try:
-            # Get PHP information
-            php_info = service.get_php_info()
-            config_info = service.get_config_info()
-            
-            # PHP Version Management
-            version_group = Adw.PreferencesGroup()
-            version_group.set_title(_("PHP Version Management"))
-            
-            # Active version
-            active_version_row = Adw.ActionRow()
-            active_version_row.set_title(_("Active Version"))
+        """Add PHP-specific sections to detail page
+
+        Her grup başlığıyla hemen eklenir; satırlar ve arkalarındaki
+        servis sorguları grup ilk kez görünür olduğunda kurulur.
+        """
+        main_box.append(self._lazy_group(
+            _S.PHP_VERSION_MANAGEMENT, self._build_php_version_group, service))
+        main_box.append(self._lazy_group(
+            _S.VERSION_ACTIONS, self._build_php_version_actions_group, service))
+        main_box.append(self._lazy_group(
+            _S.EXTENSIONS, self._build_php_extensions_group, service))
+        main_box.append(self._lazy_group(
+            _S.CONFIGURATION, self._build_php_config_group, service))
+
+    def _build_php_version_group(self, group, service):
+        """PHP sürüm bilgisi satırları (lazy + async builder)"""
+        def fetch():
+            return self._cached_info(
+                service, 'php_info', 5, service.get_php_info)
+
+        def populate(group, php_info):
             active_version = php_info.get('active_version', 'Unknown')
-            version_label = Gtk.Label(label=f"PHP {active_version}")
-            version_label.add_css_class("monospace")
-            active_version_row.add_suffix(version_label)
-            version_group.add(active_version_row)
-            
-            # Installed versions
+            group.add(self._info_row(
+                _S.ACTIVE_VERSION, f"PHP {active_version}"))
+
             installed_versions = php_info.get('installed_versions', [])
             if len(installed_versions) > 1:
                 installed_row = Adw.ActionRow()
-                installed_row.set_title(_("Installed Versions"))
+                installed_row.set_title(_S.INSTALLED_VERSIONS)
                 installed_row.set_subtitle(", ".join(installed_versions))
-                version_group.add(installed_row)
-            
-            # Available versions
+                group.add(installed_row)
+
             available_versions = php_info.get('available_versions', [])
             available_row = Adw.ActionRow()
-            available_row.set_title(_("Available Versions"))
+            available_row.set_title(_S.AVAILABLE_VERSIONS)
             available_row.set_subtitle(", ".join(available_versions))
-            version_group.add(available_row)
-            
-            main_box.append(version_group)
-            
-            # Version Actions
-            version_actions_group = Adw.PreferencesGroup()
-            version_actions_group.set_title(_("Version Actions"))
-            
+            group.add(available_row)
+
+        self._async_group_rows(group, fetch, populate)
+
+    def _build_php_version_actions_group(self, group, service):
+        """PHP sürüm eylemleri satırları (lazy + async builder)"""
+        def fetch():
+            return self._cached_info(
+                service, 'php_info', 5, service.get_php_info)
+
+        def populate(group, php_info):
+            installed_versions = php_info.get('installed_versions', [])
+            available_versions = php_info.get('available_versions', [])
+
             # Install new version
             install_version_row = Adw.ActionRow()
-            install_version_row.set_title(_("Install New Version"))
-            install_version_row.set_subtitle(_("Install additional PHP version"))
+            install_version_row.set_title(_S.INSTALL_NEW_VERSION)
+            install_version_row.set_subtitle(_S.INSTALL_NEW_VERSION_SUBTITLE)
             install_version_row.set_activatable(True)
             install_version_row.connect("activated", lambda r: self._on_php_install_version(service, available_versions))
-            install_icon = Gtk.Image.new_from_icon_name("list-add-symbolic")
-            install_version_row.add_prefix(install_icon)
-            version_actions_group.add(install_version_row)
-            
+            install_version_row.add_prefix(_icon("list-add-symbolic"))
+            group.add(install_version_row)
+
             # Switch version (if multiple versions available)
             if len(installed_versions) > 1:
                 switch_version_row = Adw.ActionRow()
-                switch_version_row.set_title(_("Switch Version"))
-                switch_version_row.set_subtitle(_("Change active PHP version"))
+                switch_version_row.set_title(_S.SWITCH_VERSION)
+                switch_version_row.set_subtitle(_S.SWITCH_VERSION_SUBTITLE)
                 switch_version_row.set_activatable(True)
                 switch_version_row.connect("activated", lambda r: self._on_php_switch_version(service, installed_versions))
-                switch_icon = Gtk.Image.new_from_icon_name("emblem-synchronizing-symbolic")
-                switch_version_row.add_prefix(switch_icon)
-                version_actions_group.add(switch_version_row)
-            
+                switch_version_row.add_prefix(_icon("emblem-synchronizing-symbolic"))
+                group.add(switch_version_row)
+
             # Uninstall version (if multiple versions available)
             if len(installed_versions) > 1:
                 uninstall_version_row = Adw.ActionRow()
-                uninstall_version_row.set_title(_("Uninstall Version"))
-                uninstall_version_row.set_subtitle(_("Remove a PHP version"))
+                uninstall_version_row.set_title(_S.UNINSTALL_VERSION)
+                uninstall_version_row.set_subtitle(_S.UNINSTALL_VERSION_SUBTITLE)
                 uninstall_version_row.set_activatable(True)
                 uninstall_version_row.connect("activated", lambda r: self._on_php_uninstall_version(service, installed_versions))
-                uninstall_icon = Gtk.Image.new_from_icon_name("edit-delete-symbolic")
-                uninstall_version_row.add_prefix(uninstall_icon)
-                version_actions_group.add(uninstall_version_row)
-            
-            main_box.append(version_actions_group)
-            
-            # Extensions Management
-            extensions_group = Adw.PreferencesGroup()
-            extensions_group.set_title(_("Extensions"))
-            
-            # Get installed extensions
-            installed_extensions = service.get_installed_extensions()
-            popular_extensions = service.get_popular_extensions()
-            
-            # Extension count
-            ext_count_row = Adw.ActionRow()
-            ext_count_row.set_title(_("Installed Extensions"))
-            ext_count_label = Gtk.Label(label=str(len(installed_extensions)))
-            ext_count_label.add_css_class("monospace")
-            ext_count_row.add_suffix(ext_count_label)
-            extensions_group.add(ext_count_row)
-            
-            # Install extension
+                uninstall_version_row.add_prefix(_icon("edit-delete-symbolic"))
+                group.add(uninstall_version_row)
+
+        self._async_group_rows(group, fetch, populate)
+
+    def _build_php_extensions_group(self, group, service):
+        """PHP eklenti satırları (lazy + async builder)"""
+        def fetch():
+            installed = self._cached_info(
+                service, 'extensions', 30, service.get_installed_extensions)
+            # Popüler eklenti listesi statik - uzun TTL yeterli
+            popular = self._cached_info(
+                service, 'popular_extensions', 300,
+                service.get_popular_extensions)
+            return (installed, popular)
+
+        def populate(group, data):
+            installed_extensions, popular_extensions = data
+
+            group.add(self._info_row(
+                _S.INSTALLED_EXTENSIONS, str(len(installed_extensions))))
+
             install_ext_row = Adw.ActionRow()
-            install_ext_row.set_title(_("Install Extension"))
-            install_ext_row.set_subtitle(_("Install a PHP extension"))
+            install_ext_row.set_title(_S.INSTALL_EXTENSION)
+            install_ext_row.set_subtitle(_S.INSTALL_EXTENSION_SUBTITLE)
             install_ext_row.set_activatable(True)
             install_ext_row.connect("activated", lambda r: self._on_php_install_extension(service, popular_extensions, installed_extensions))
-            install_ext_icon = Gtk.Image.new_from_icon_name("list-add-symbolic")
-            install_ext_row.add_prefix(install_ext_icon)
-            extensions_group.add(install_ext_row)
-            
-            # Manage extensions
+            install_ext_row.add_prefix(_icon("list-add-symbolic"))
+            group.add(install_ext_row)
+
             manage_ext_row = Adw.ActionRow()
-            manage_ext_row.set_title(_("Manage Extensions"))
-            manage_ext_row.set_subtitle(_("View and uninstall extensions"))
+            manage_ext_row.set_title(_S.MANAGE_EXTENSIONS)
+            manage_ext_row.set_subtitle(_S.MANAGE_EXTENSIONS_SUBTITLE)
             manage_ext_row.set_activatable(True)
             manage_ext_row.connect("activated", lambda r: self._on_php_manage_extensions(service, installed_extensions))
-            manage_ext_icon = Gtk.Image.new_from_icon_name("preferences-system-symbolic")
-            manage_ext_row.add_prefix(manage_ext_icon)
-            extensions_group.add(manage_ext_row)
-            
-            main_box.append(extensions_group)
-            
-            # Configuration Information
-            config_group = Adw.PreferencesGroup()
-            config_group.set_title(_("Configuration"))
-            
-            # Config file location
+            manage_ext_row.add_prefix(_icon("preferences-system-symbolic"))
+            group.add(manage_ext_row)
+
+        self._async_group_rows(group, fetch, populate)
+
+    def _build_php_config_group(self, group, service):
+        """PHP yapılandırma satırları (lazy + async builder)"""
+        def fetch():
+            return self._cached_info(
+                service, 'config_info', 5, service.get_config_info)
+
+        def populate(group, config_info):
             if 'config_file' in config_info:
                 config_file_row = Adw.ActionRow()
-                config_file_row.set_title(_("Configuration File"))
+                config_file_row.set_title(_S.CONFIGURATION_FILE)
                 config_file_row.set_subtitle(config_info['config_file'])
-                config_group.add(config_file_row)
-            
-            # Memory limit
+                group.add(config_file_row)
+
             if 'memory_limit' in config_info:
-                memory_row = Adw.ActionRow()
-                memory_row.set_title(_("Memory Limit"))
-                memory_label = Gtk.Label(label=config_info['memory_limit'])
-                memory_label.add_css_class("monospace")
-                memory_row.add_suffix(memory_label)
-                config_group.add(memory_row)
-            
-            # Upload max size
+                group.add(self._info_row(
+                    _S.MEMORY_LIMIT, config_info['memory_limit']))
+
             if 'upload_max_size' in config_info:
-                upload_row = Adw.ActionRow()
-                upload_row.set_title(_("Upload Max Size"))
-                upload_label = Gtk.Label(label=config_info['upload_max_size'])
-                upload_label.add_css_class("monospace")
-                upload_row.add_suffix(upload_label)
-                config_group.add(upload_row)
-            
-            main_box.append(config_group)
-            
-        except Exception as e:
-            logger.error(f"Error adding PHP sections: {e}")
-            error_group = Adw.PreferencesGroup()
-            error_group.set_title(_("PHP Information"))
-            error_row = Adw.ActionRow()
-            error_row.set_title(_("Error"))
-            error_row.set_subtitle(str(e))
-            error_group.add(error_row)
-            main_box.append(error_group)
+                group.add(self._info_row(
+                    _S.UPLOAD_MAX_SIZE, config_info['upload_max_size']))
+
+        self._async_group_rows(group, fetch, populate)
     
+    def _add_module_status_suffix(self, row, enabled):
+        """Modül satırına ikon + metin durum suffix'i ekle
+
+        Emoji'li label yerine sembolik ikon: emoji font fallback'i
+        rebuild başına tekrar tekrar çalışmaz.
+        """
+        if enabled:
+            icon_name, text, css = "emblem-ok-symbolic", _S.ENABLED, "success"
+        else:
+            icon_name, text, css = "emblem-important-symbolic", _S.DISABLED, "error"
+
+        img = _icon(icon_name)
+        img.add_css_class(css)
+        row.add_suffix(img)
+
+        status_label = Gtk.Label(label=text)
+        status_label.add_css_class(css)
+        row.add_suffix(status_label)
+
+    def _vhost_item_setup(self, factory, list_item):
+        """ListView için tek vhost satırı şablonu oluştur (bir kez)"""
+        row = Adw.ActionRow()
+        arrow = _icon("go-next-symbolic")
+        arrow.set_valign(Gtk.Align.CENTER)
+        row.add_suffix(arrow)
+        list_item.set_child(row)
+
+    def _vhost_item_bind(self, factory, list_item):
+        """Geri dönüştürülen satıra modeldeki vhost verisini yaz"""
+        row = list_item.get_child()
+        item = list_item.get_item()
+        row.set_title(item.title)
+        row.set_subtitle(item.subtitle)
+
+    def _on_vhost_activated(self, list_view, position, service):
+        """ListView satırı aktive edildiğinde vhost detayını aç"""
+        item = list_view.get_model().get_item(position)
+        if item is not None:
+            self._show_vhost_detail(service, item.vhost)
+
     def _add_apache_sections(self, main_box, service):
-        """Add Apache-specific sections to detail page"""
-        
-        # Apache Modules Management
-        modules_group = Adw.PreferencesGroup()
-        modules_group.set_title(_("Apache Modules"))
-        modules_group.set_description(_("Manage Apache modules (enable/disable)"))
-        
-        try:
-            # Manage Modules button
-            manage_modules_row = Adw.ActionRow()
-            manage_modules_row.set_title(_("Manage Modules"))
-            manage_modules_row.set_subtitle(_("Enable or disable Apache modules"))
-            manage_modules_row.set_activatable(True)
-            manage_modules_row.connect("activated", lambda r: self._on_apache_manage_modules(service))
-            manage_icon = Gtk.Image.new_from_icon_name("preferences-system-symbolic")
-            manage_modules_row.add_prefix(manage_icon)
-            modules_group.add(manage_modules_row)
-            
-            # Show some key modules status
-            modules = service.list_modules()
-            
+        """Add Apache-specific sections to detail page
+
+        Gruplar başlıklarıyla hemen eklenir; satırlar ve arkalarındaki
+        apachectl/script sorguları grup ilk kez görünür olduğunda kurulur.
+        """
+        main_box.append(self._lazy_group(
+            _S.APACHE_MODULES, self._build_apache_modules_group, service,
+            description=_S.APACHE_MODULES_SUBTITLE))
+        main_box.append(self._lazy_group(
+            _S.PHP_MODULES, self._build_apache_php_modules_group, service,
+            description=_S.PHP_MODULES_SUBTITLE))
+        main_box.append(self._lazy_group(
+            _S.SSL_CERTIFICATES, self._build_apache_ssl_group, service))
+        main_box.append(self._lazy_group(
+            _S.VIRTUAL_HOSTS, self._build_apache_vhosts_group, service))
+
+    def _build_apache_modules_group(self, modules_group, service):
+        """Apache modül satırları (lazy + async builder)"""
+        # Manage Modules button - veri gerektirmez, hemen eklenir
+        manage_modules_row = Adw.ActionRow()
+        manage_modules_row.set_title(_S.MANAGE_MODULES)
+        manage_modules_row.set_subtitle(_S.MANAGE_MODULES_SUBTITLE)
+        manage_modules_row.set_activatable(True)
+        manage_modules_row.connect("activated", lambda r: self._on_apache_manage_modules(service))
+        manage_modules_row.add_prefix(_icon("preferences-system-symbolic"))
+        modules_group.add(manage_modules_row)
+
+        def populate(group, modules):
+            # Tek geçiş: ad indeksi ve etkin sayacı birlikte toplanır,
+            # liste üç kez yürünmez
+            by_name = {}
+            enabled_count = 0
+            for m in modules:
+                by_name[m['name']] = m
+                if m['enabled']:
+                    enabled_count += 1
+
             # Show SSL module
-            ssl_modules = [m for m in modules if m['name'] == 'ssl']
-            if ssl_modules:
-                ssl_mod = ssl_modules[0]
+            ssl_mod = by_name.get('ssl')
+            if ssl_mod:
                 ssl_row = Adw.ActionRow()
                 ssl_row.set_title("SSL Module")
-                if ssl_mod['enabled']:
-                    status_label = Gtk.Label(label="✅ " + _("Enabled"))
-                    status_label.add_css_class("success")
-                else:
-                    status_label = Gtk.Label(label="❌ " + _("Disabled"))
-                    status_label.add_css_class("error")
-                ssl_row.add_suffix(status_label)
-                modules_group.add(ssl_row)
-            
+                self._add_module_status_suffix(ssl_row, ssl_mod['enabled'])
+                group.add(ssl_row)
+
             # Show Rewrite module
-            rewrite_modules = [m for m in modules if m['name'] == 'rewrite']
-            if rewrite_modules:
-                rewrite_mod = rewrite_modules[0]
+            rewrite_mod = by_name.get('rewrite')
+            if rewrite_mod:
                 rewrite_row = Adw.ActionRow()
                 rewrite_row.set_title("Rewrite Module")
-                if rewrite_mod['enabled']:
-                    status_label = Gtk.Label(label="✅ " + _("Enabled"))
-                    status_label.add_css_class("success")
-                else:
-                    status_label = Gtk.Label(label="❌ " + _("Disabled"))
-                    status_label.add_css_class("error")
-                rewrite_row.add_suffix(status_label)
-                modules_group.add(rewrite_row)
-            
+                self._add_module_status_suffix(rewrite_row, rewrite_mod['enabled'])
+                group.add(rewrite_row)
+
             # Show module count
-            enabled_count = sum(1 for m in modules if m['enabled'])
             total_count = len(modules)
-            count_row = Adw.ActionRow()
-            count_row.set_title(_("Total Modules"))
-            count_label = Gtk.Label(label=f"{enabled_count}/{total_count} " + _("enabled"))
-            count_label.add_css_class("monospace")
-            count_row.add_suffix(count_label)
-            modules_group.add(count_row)
-        
-        except Exception as e:
-            logger.error(f"Error loading modules: {e}")
-            # Show error in UI
-            error_row = Adw.ActionRow()
-            error_row.set_title(_("Error"))
-            error_row.set_subtitle(str(e))
-            error_row.set_sensitive(False)
-            modules_group.add(error_row)
-        
-        main_box.append(modules_group)
-        
-        # PHP Modules Management (Apache-specific)
-        php_modules_group = Adw.PreferencesGroup()
-        php_modules_group.set_title(_("PHP Modules"))
-        php_modules_group.set_description(_("Manage PHP Apache modules (install/switch/remove)"))
-        
-        try:
-            php_module_installed = service.is_php_module_installed()
-            
+            group.add(self._info_row(
+                _S.TOTAL_MODULES,
+                f"{enabled_count}/{total_count} " + _S.ENABLED_LOWER))
+
+        def fetch():
+            # Sayfaya tekrar girişler ve Manage Modules diyaloğu aynı
+            # listeyi paylaşır; mutasyonlar cache'i düşürür
+            return self._cached_info(
+                service, 'modules', 30, service.list_modules)
+
+        self._async_group_rows(modules_group, fetch, populate)
+
+    def _build_apache_php_modules_group(self, php_modules_group, service):
+        """Apache'ye özgü PHP modül satırları (lazy + async builder)"""
+        def fetch():
+            def load():
+                php_module_installed = service.is_php_module_installed()
+                if not php_module_installed:
+                    return (False, [], None)
+                return (True,
+                        service.get_installed_php_modules(),
+                        service.get_active_php_module())
+
+            return self._cached_info(service, 'php_modules', 30, load)
+
+        def populate(php_modules_group, data):
+            php_module_installed, php_modules, active_php_module = data
+
             if php_module_installed:
-                # Get PHP module list
-                php_modules = service.get_installed_php_modules()
-                active_php_module = service.get_active_php_module()
-                
                 # Active PHP Apache module
-                active_module_row = Adw.ActionRow()
-                active_module_row.set_title(_("Active PHP Apache Module"))
                 if active_php_module:
-                    module_label = Gtk.Label(label=f"PHP {active_php_module}")
-                    module_label.add_css_class("monospace")
-                    module_label.add_css_class("success")
-                    active_module_row.add_suffix(module_label)
+                    active_module_row = self._info_row(
+                        _S.ACTIVE_PHP_MODULE, f"PHP {active_php_module}",
+                        css="success")
                 else:
-                    module_label = Gtk.Label(label=_("None"))
-                    module_label.add_css_class("dim-label")
-                    active_module_row.add_suffix(module_label)
+                    active_module_row = self._info_row(
+                        _S.ACTIVE_PHP_MODULE, _S.NONE, mono=False,
+                        css="dim-label")
                 php_modules_group.add(active_module_row)
                 
                 # List installed PHP modules
                 if php_modules and len(php_modules) > 0:
                     modules_row = Adw.ActionRow()
-                    modules_row.set_title(_("Installed PHP Modules"))
+                    modules_row.set_title(_S.INSTALLED_PHP_MODULES)
                     modules_info = []
                     for mod in php_modules:
                         status = "✅" if mod['enabled'] else "⚪"
@@ -1622,352 +2686,367 @@ class MainWindow(Adw.ApplicationWindow):
                 # Switch PHP module (if multiple available)
                 if php_modules and len(php_modules) > 1:
                     switch_module_row = Adw.ActionRow()
-                    switch_module_row.set_title(_("Switch PHP Module"))
-                    switch_module_row.set_subtitle(_("Change active PHP Apache module"))
+                    switch_module_row.set_title(_S.SWITCH_PHP_MODULE)
+                    switch_module_row.set_subtitle(_S.SWITCH_PHP_MODULE_SUBTITLE)
                     switch_module_row.set_activatable(True)
                     switch_module_row.connect("activated", lambda r: self._on_apache_switch_php_module(service, php_modules))
-                    switch_module_icon = Gtk.Image.new_from_icon_name("emblem-synchronizing-symbolic")
+                    switch_module_icon = _icon("emblem-synchronizing-symbolic")
                     switch_module_row.add_prefix(switch_module_icon)
                     php_modules_group.add(switch_module_row)
                 
                 # Install PHP module
                 install_php_module_row = Adw.ActionRow()
-                install_php_module_row.set_title(_("Install PHP Module"))
-                install_php_module_row.set_subtitle(_("Install PHP Apache module for a specific version"))
+                install_php_module_row.set_title(_S.INSTALL_PHP_MODULE)
+                install_php_module_row.set_subtitle(_S.INSTALL_PHP_MODULE_VERSION_SUBTITLE)
                 install_php_module_row.set_activatable(True)
                 install_php_module_row.connect("activated", lambda r: self._on_apache_install_php_module_dialog(service))
-                install_php_module_icon = Gtk.Image.new_from_icon_name("list-add-symbolic")
+                install_php_module_icon = _icon("list-add-symbolic")
                 install_php_module_row.add_prefix(install_php_module_icon)
                 php_modules_group.add(install_php_module_row)
                 
                 # Uninstall PHP module
                 if php_modules and len(php_modules) > 0:
                     uninstall_php_module_row = Adw.ActionRow()
-                    uninstall_php_module_row.set_title(_("Uninstall PHP Module"))
-                    uninstall_php_module_row.set_subtitle(_("Remove a PHP Apache module"))
+                    uninstall_php_module_row.set_title(_S.UNINSTALL_PHP_MODULE)
+                    uninstall_php_module_row.set_subtitle(_S.UNINSTALL_PHP_MODULE_SUBTITLE)
                     uninstall_php_module_row.set_activatable(True)
                     uninstall_php_module_row.connect("activated", lambda r: self._on_apache_uninstall_php_module_dialog(service, php_modules))
-                    uninstall_php_module_icon = Gtk.Image.new_from_icon_name("edit-delete-symbolic")
+                    uninstall_php_module_icon = _icon("edit-delete-symbolic")
                     uninstall_php_module_row.add_prefix(uninstall_php_module_icon)
                     php_modules_group.add(uninstall_php_module_row)
             else:
                 # Install PHP module button
                 install_php_module_row = Adw.ActionRow()
-                install_php_module_row.set_title(_("Install PHP Module"))
-                install_php_module_row.set_subtitle(_("Install PHP Apache module"))
+                install_php_module_row.set_title(_S.INSTALL_PHP_MODULE)
+                install_php_module_row.set_subtitle(_S.INSTALL_PHP_MODULE_SUBTITLE)
                 install_php_module_row.set_activatable(True)
                 install_php_module_row.connect("activated", lambda r: self._on_apache_install_php_module_dialog(service))
-                install_php_module_icon = Gtk.Image.new_from_icon_name("list-add-symbolic")
+                install_php_module_icon = _icon("list-add-symbolic")
                 install_php_module_row.add_prefix(install_php_module_icon)
-                php_modules_group.add(install_php_module_row)
-        
-        except Exception as e:
-            logger.error(f"Error loading PHP modules: {e}")
-            error_row = Adw.ActionRow()
-            error_row.set_title(_("Error"))
-            error_row.set_subtitle(str(e))
-            error_row.set_sensitive(False)
-            php_modules_group.add(error_row)
-        
-        main_box.append(php_modules_group)
-        
-        # SSL Certificate Management
-        ssl_cert_group = Adw.PreferencesGroup()
-        ssl_cert_group.set_title(_("SSL Certificates"))
-        
-        try:
-            # Create self-signed certificate button
-            create_cert_row = Adw.ActionRow()
-            create_cert_row.set_title(_("Create Self-Signed Certificate"))
-            create_cert_row.set_subtitle(_("Generate SSL certificate for a domain"))
-            create_cert_row.set_activatable(True)
-            create_cert_row.connect("activated", lambda r: self._on_apache_create_certificate(service))
-            create_cert_icon = Gtk.Image.new_from_icon_name("document-new-symbolic")
-            create_cert_row.add_prefix(create_cert_icon)
-            ssl_cert_group.add(create_cert_row)
-        
-        except Exception as e:
-            logger.error(f"Error with SSL certificates: {e}")
-        
-        main_box.append(ssl_cert_group)
-        
-        # Virtual Hosts Management
-        vhosts_group = Adw.PreferencesGroup()
-        vhosts_group.set_title(_("Virtual Hosts"))
-        
-        try:
-            vhosts = service.list_vhosts()
-            
-            # Create vhost button
-            create_vhost_row = Adw.ActionRow()
-            create_vhost_row.set_title(_("Create Virtual Host"))
-            create_vhost_row.set_subtitle(_("Add a new website configuration"))
-            create_vhost_row.set_activatable(True)
-            create_vhost_row.connect("activated", lambda r: self._on_apache_create_vhost(service))
-            create_vhost_icon = Gtk.Image.new_from_icon_name("list-add-symbolic")
-            create_vhost_row.add_prefix(create_vhost_icon)
-            vhosts_group.add(create_vhost_row)
-            
-            # List existing vhosts
-            if vhosts:
-                # Add separator
-                separator_row = Adw.ActionRow()
-                separator_row.set_title(_("Existing Virtual Hosts"))
-                separator_row.set_sensitive(False)
-                vhosts_group.add(separator_row)
-                
-                for vhost in vhosts:
-                    vhost_row = Adw.ActionRow()
-                    
-                    # Use server_name as title, fallback to filename
-                    title = vhost.get('server_name', vhost.get('filename', 'Unknown'))
-                    if not title or title == '':
-                        title = vhost.get('filename', 'Unknown')
-                    if title.endswith('.conf'):
-                        title = title[:-5]  # Remove .conf extension
-                    
-                    vhost_row.set_title(title)
-                    
-                    # Subtitle with status info
-                    subtitle_parts = []
-                    
-                    # Enabled status
-                    if vhost.get('enabled'):
-                        subtitle_parts.append("✅ Enabled")
-                    else:
-                        subtitle_parts.append("❌ Disabled")
-                    
-                    # SSL status
-                    if vhost.get('ssl'):
-                        subtitle_parts.append("🔒 SSL")
-                    
-                    # PHP version
-                    php_version = vhost.get('php_version', '')
-                    if php_version:
-                        subtitle_parts.append(f"🐘 PHP {php_version}")
-                    
-                    # Filename if different from title
-                    if vhost.get('filename') and vhost.get('filename') != title and not title.endswith('.conf'):
-                        subtitle_parts.append(vhost['filename'])
-                    
-                    vhost_row.set_subtitle(' • '.join(subtitle_parts))
-                    vhost_row.set_activatable(True)
-                    vhost_row.connect("activated", lambda r, s=service, v=vhost: self._show_vhost_detail(s, v))
-                    
-                    # Arrow icon to indicate clickable
-                    arrow = Gtk.Image.new_from_icon_name("go-next-symbolic")
-                    arrow.set_valign(Gtk.Align.CENTER)
-                    vhost_row.add_suffix(arrow)
-                    
-                    vhosts_group.add(vhost_row)
-        
-        except Exception as e:
-            logger.error(f"Error listing vhosts: {e}")
-        
-        main_box.append(vhosts_group)
-    
-    # ==================== APACHE HANDLERS ====================
-    
-    def _on_apache_switch_php_module(self, service, php_modules):
-        """Switch PHP Apache module dialog"""
-        dialog = Adw.MessageDialog.new(self, _("Switch PHP Module"), None)
-        dialog.set_body(_("Select the PHP Apache module to activate"))
-        
-        # Create module selector
-        list_box = Gtk.ListBox()
-        list_box.set_selection_mode(Gtk.SelectionMode.SINGLE)
-        list_box.add_css_class("boxed-list")
-        
-        active_module = service.get_active_php_module()
-        selected_version = [active_module]  # Use list to allow modification in closure
-        
-        for mod in php_modules:
-            row = Gtk.ListBoxRow()
-            box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL)
-            box.set_spacing(12)
-            box.set_margin_top(8)
-            box.set_margin_bottom(8)
-            box.set_margin_start(12)
-            box.set_margin_end(12)
-            
-            label = Gtk.Label(label=f"PHP {mod['version']}")
-            label.set_hexpand(True)
-            label.set_halign(Gtk.Align.START)
-            box.append(label)
-            
-            if mod['enabled']:
-                check = Gtk.Image.new_from_icon_name("emblem-ok-symbolic")
-                check.add_css_class("success")
-                box.append(check)
-            
-            row.set_child(box)
-            row.version = mod['version']
-            list_box.append(row)
-        
-        def on_row_activated(listbox, row):
-            selected_version[0] = row.version
-        
-        list_box.connect("row-activated", on_row_activated)
-        
-        scrolled = Gtk.ScrolledWindow()
-        scrolled.set_child(list_box)
-        scrolled.set_min_content_height(200)
-        scrolled.set_margin_top(12)
-        
-        dialog.set_extra_child(scrolled)
-        dialog.add_response("cancel", _("Cancel"))
-        dialog.add_response("switch", _("Switch"))
-        dialog.set_response_appearance("switch", Adw.ResponseAppearance.SUGGESTED)
-        
-        def on_response(dialog, response):
-            if response == "switch" and selected_version[0]:
-                dialog.close()
-                self._show_loading_dialog(_("Switching PHP module..."))
-                
-                # Run in thread
-                import threading
-                def switch_task():
-                    try:
-                        success, message = service.switch_php_module(selected_version[0])
-                        GLib.idle_add(self._on_operation_complete, success, message)
-                    except Exception as e:
-                        logger.error(f"Error switching PHP module: {e}")
-                        GLib.idle_add(self._on_operation_complete, False, str(e))
-                
-                thread = threading.Thread(target=switch_task, daemon=True)
-                thread.start()
-        
-        dialog.connect("response", on_response)
-        dialog.present()
-    
-    def _on_apache_install_php_module_dialog(self, service):
-        """Install PHP Apache module dialog"""
-        dialog = Adw.MessageDialog.new(self, _("Install PHP Module"), None)
-        dialog.set_body(_("Enter the PHP version to install Apache module for (e.g., 8.2, 7.4)"))
-        
-        # Version entry
-        entry_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
-        entry_box.set_spacing(8)
-        entry_box.set_margin_top(12)
-        
-        entry = Gtk.Entry()
-        entry.set_property("placeholder-text", "e.g., 8.2")
-        entry_box.append(entry)
-        
-        # Info label
-        info_label = Gtk.Label()
-        info_label.set_markup(f"<span size='small'>{_('Leave empty to auto-detect')}</span>")
-        info_label.add_css_class("dim-label")
-        info_label.set_halign(Gtk.Align.START)
-        entry_box.append(info_label)
-        
-        dialog.set_extra_child(entry_box)
-        dialog.add_response("cancel", _("Cancel"))
-        dialog.add_response("install", _("Install"))
-        dialog.set_response_appearance("install", Adw.ResponseAppearance.SUGGESTED)
+                php_modules_group.add(install_php_module_row)
+
+        self._async_group_rows(php_modules_group, fetch, populate)
+
+    def _build_apache_ssl_group(self, ssl_cert_group, service):
+        """SSL sertifika satırları (lazy builder)"""
+        try:
+            # Create self-signed certificate button
+            create_cert_row = Adw.ActionRow()
+            create_cert_row.set_title(_S.CREATE_CERTIFICATE)
+            create_cert_row.set_subtitle(_S.CREATE_CERTIFICATE_SUBTITLE)
+            create_cert_row.set_activatable(True)
+            create_cert_row.connect("activated", lambda r: self._on_apache_create_certificate(service))
+            create_cert_icon = _icon("document-new-symbolic")
+            create_cert_row.add_prefix(create_cert_icon)
+            ssl_cert_group.add(create_cert_row)
         
-        def on_response(dialog, response):
-            if response == "install":
-                version = entry.get_text().strip() or None
-                dialog.close()
-                
-                self._show_loading_dialog(_("Installing PHP module..."))
-                
-                # Run in thread
-                import threading
-                def install_task():
+        except Exception as e:
+            logger.error(f"Error with SSL certificates: {e}")
+
+    def _build_apache_vhosts_group(self, vhosts_group, service):
+        """Vhost satırları + model tabanlı liste (lazy builder)"""
+        vhosts_group.freeze_notify()
+
+        try:
+            # Create vhost button
+            create_vhost_row = Adw.ActionRow()
+            create_vhost_row.set_title(_S.CREATE_VHOST)
+            create_vhost_row.set_subtitle(_S.CREATE_VHOST_SUBTITLE)
+            create_vhost_row.set_activatable(True)
+            create_vhost_row.connect("activated", lambda r: self._on_apache_create_vhost(service))
+            create_vhost_icon = _icon("list-add-symbolic")
+            create_vhost_row.add_prefix(create_vhost_icon)
+            vhosts_group.add(create_vhost_row)
+
+            # Vhost yokken ayraç görünmez; ilk kayıt geldiğinde açılır
+            separator_row = Adw.ActionRow()
+            separator_row.set_title(_S.EXISTING_VHOSTS)
+            separator_row.set_sensitive(False)
+            separator_row.set_visible(False)
+            vhosts_group.add(separator_row)
+
+            # Satır başına ActionRow kurmak yerine model tabanlı
+            # ListView: widget'lar scroll sırasında geri dönüştürülür,
+            # sadece görünür satırlar realize/CSS maliyeti öder
+            store = Gio.ListStore.new(VhostItem)
+            self._vhost_store = store
+
+            factory = Gtk.SignalListItemFactory()
+            factory.connect("setup", self._vhost_item_setup)
+            factory.connect("bind", self._vhost_item_bind)
+
+            selection = Gtk.SingleSelection.new(store)
+            selection.set_autoselect(False)
+            vhost_list = Gtk.ListView.new(selection, factory)
+            vhost_list.set_single_click_activate(True)
+            vhost_list.connect("activate", self._on_vhost_activated, service)
+            vhosts_group.add(vhost_list)
+
+            # Taze cache varsa senkron doldur; yoksa tarama worker'da
+            # yürür ve kayıtlar geldikçe modele akar - sayfa script'in
+            # bitmesini beklemeden açılır
+            generation = self._detail_generation
+            cached = self._info_cache.get(service.name, {}).get('vhosts')
+            if cached and time.monotonic() - cached[0] < 10 and not isinstance(cached[1], Exception):
+                self._apply_vhost_items(generation, store, separator_row, cached[1])
+            else:
+                def scan():
                     try:
-                        success, message = service.install_php_module(version)
-                        GLib.idle_add(self._on_operation_complete, success, message)
+                        vhosts = list(service.iter_vhosts())
+                        # Tam liste sonraki rebuild'ler için cache'e yazılır
+                        entries = self._info_cache.setdefault(service.name, {})
+                        entries['vhosts'] = (time.monotonic(), vhosts)
+                        GLib.idle_add(self._apply_vhost_items,
+                                      generation, store, separator_row, vhosts)
                     except Exception as e:
-                        logger.error(f"Error installing PHP module: {e}")
-                        GLib.idle_add(self._on_operation_complete, False, str(e))
-                
-                thread = threading.Thread(target=install_task, daemon=True)
-                thread.start()
-        
-        dialog.connect("response", on_response)
-        dialog.present()
+                        logger.error(f"Error listing vhosts: {e}")
+
+                self._io_pool.submit(scan)
+
+        except Exception as e:
+            logger.error(f"Error listing vhosts: {e}")
+
+        vhosts_group.thaw_notify()
+
+    def _apply_vhost_items(self, generation, store, separator_row, vhosts):
+        """Vhost kayıtlarını modele tek hamlede ekle (UI thread)
+
+        Tek tek append yerine splice: model n kayıt için tek
+        items-changed sinyali yayar, ListView bir kez yeniden dizilir.
+        """
+        # Sayfa bu arada yeniden kurulduysa sonuç bayat - dokunma
+        if generation != self._detail_generation:
+            return GLib.SOURCE_REMOVE
+        if vhosts:
+            separator_row.set_visible(True)
+            store.splice(store.get_n_items(), 0,
+                         [VhostItem(vhost) for vhost in vhosts])
+        return GLib.SOURCE_REMOVE
     
-    def _on_apache_uninstall_php_module_dialog(self, service, php_modules):
-        """Uninstall PHP Apache module dialog"""
-        dialog = Adw.MessageDialog.new(self, _("Uninstall PHP Module"), None)
-        dialog.set_body(_("Select the PHP Apache module to uninstall"))
-        
-        # Create module selector
-        list_box = Gtk.ListBox()
-        list_box.set_selection_mode(Gtk.SelectionMode.SINGLE)
-        list_box.add_css_class("boxed-list")
-        
-        selected_version = [None]  # Use list to allow modification in closure
-        
-        for mod in php_modules:
-            row = Gtk.ListBoxRow()
+    # ==================== APACHE HANDLERS ====================
+
+    def _version_picker(self, entries, preselect=None):
+        """PHP sürüm seçici iskeletinin tek kopyası
+
+        entries: (version, badge) çiftleri; badge 'active' soluk
+        "(Active)" etiketi, 'check' yeşil onay ikonu gösterir. ListBox
+        yerine model tabanlı ListView: satır widget'ları scroll'da geri
+        dönüştürülür, widget sayısı O(görünür) kalır. Dönen selected_ref
+        tek elemanlı liste - aktivasyon seçimi oraya yazar.
+        """
+        store = Gio.ListStore.new(VersionItem)
+        for version, badge in entries:
+            store.append(VersionItem(version, badge))
+
+        factory = Gtk.SignalListItemFactory()
+
+        def setup(factory, list_item):
             box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL)
             box.set_spacing(12)
             box.set_margin_top(8)
             box.set_margin_bottom(8)
             box.set_margin_start(12)
             box.set_margin_end(12)
-            
-            label = Gtk.Label(label=f"PHP {mod['version']}")
+
+            label = Gtk.Label()
             label.set_hexpand(True)
             label.set_halign(Gtk.Align.START)
             box.append(label)
-            
-            if mod['enabled']:
-                status = Gtk.Label(label="(Active)")
-                status.add_css_class("dim-label")
-                box.append(status)
-            
-            row.set_child(box)
-            row.version = mod['version']
-            list_box.append(row)
-        
-        def on_row_activated(listbox, row):
-            selected_version[0] = row.version
-        
-        list_box.connect("row-activated", on_row_activated)
-        
+
+            status = Gtk.Label(label="(Active)")
+            status.add_css_class("dim-label")
+            status.set_visible(False)
+            box.append(status)
+
+            check = _icon("emblem-ok-symbolic")
+            check.add_css_class("success")
+            check.set_visible(False)
+            box.append(check)
+
+            box._label, box._status, box._check = label, status, check
+            list_item.set_child(box)
+
+        def bind(factory, list_item):
+            item = list_item.get_item()
+            box = list_item.get_child()
+            box._label.set_label(f"PHP {item.version}")
+            box._status.set_visible(item.badge == 'active')
+            box._check.set_visible(item.badge == 'check')
+
+        factory.connect("setup", setup)
+        factory.connect("bind", bind)
+
+        selection = Gtk.SingleSelection.new(store)
+        selection.set_autoselect(False)
+        if preselect is not None:
+            for i, (version, _badge) in enumerate(entries):
+                if version == preselect:
+                    selection.set_selected(i)
+                    break
+
+        list_view = Gtk.ListView.new(selection, factory)
+        list_view.set_single_click_activate(True)
+        list_view.add_css_class("boxed-list")
+
+        selected_ref = [preselect]
+
+        def on_activate(view, position):
+            selected_ref[0] = store.get_item(position).version
+
+        list_view.connect("activate", on_activate)
+
         scrolled = Gtk.ScrolledWindow()
-        scrolled.set_child(list_box)
+        scrolled.set_child(list_view)
         scrolled.set_min_content_height(200)
         scrolled.set_margin_top(12)
-        
-        dialog.set_extra_child(scrolled)
-        dialog.add_response("cancel", _("Cancel"))
-        dialog.add_response("uninstall", _("Uninstall"))
-        dialog.set_response_appearance("uninstall", Adw.ResponseAppearance.DESTRUCTIVE)
-        
+        return scrolled, selected_ref
+    
+    def _on_apache_switch_php_module(self, service, php_modules):
+        """Switch PHP Apache module dialog"""
+        dialog = self._make_dialog(
+            _("Switch PHP Module"),
+            _("Select the PHP Apache module to activate"),
+            _S.SWITCH)
+
+        # Tek widget'lık seçici: ListBox + satır başına Box/Label/Image
+        # yerine model tabanlı DropDown - CSS ağacı çok daha küçük
+        versions = [mod['version'] for mod in php_modules]
+        active_module = service.get_active_php_module()
+
+        dropdown = Gtk.DropDown.new_from_strings([f"PHP {v}" for v in versions])
+        if active_module in versions:
+            dropdown.set_selected(versions.index(active_module))
+        dropdown.set_margin_top(12)
+
+        dialog.set_extra_child(dropdown)
+
         def on_response(dialog, response):
-            if response == "uninstall" and selected_version[0]:
+            if response == "ok" and versions:
+                selected_version = versions[dropdown.get_selected()]
                 dialog.close()
-                self._show_loading_dialog(_("Uninstalling PHP module..."))
-                
+                self._show_loading_dialog(_("Switching PHP module..."))
+
                 # Run in thread
-                import threading
-                def uninstall_task():
+                def switch_task():
                     try:
-                        success, message = service.uninstall_php_module(selected_version[0])
+                        success, message = service.switch_php_module(selected_version)
                         GLib.idle_add(self._on_operation_complete, success, message)
                     except Exception as e:
-                        logger.error(f"Error uninstalling PHP module: {e}")
+                        logger.error(f"Error switching PHP module: {e}")
                         GLib.idle_add(self._on_operation_complete, False, str(e))
-                
-                thread = threading.Thread(target=uninstall_task, daemon=True)
-                thread.start()
+
+                self._service_executor.submit(switch_task)
         
         dialog.connect("response", on_response)
         dialog.present()
     
+    def _on_apache_install_php_module_dialog(self, service):
+        """Install PHP Apache module dialog"""
+        # İskelet ilk açılışta kurulur; sonraki açılışlar girdiyi
+        # sıfırlayıp yeniden gösterir (create-vhost kalıbı)
+        if self._install_php_module_dialog is None:
+            dialog = self._make_dialog(
+                _("Install PHP Module"),
+                _("Enter the PHP version to install Apache module for (e.g., 8.2, 7.4)"),
+                _S.INSTALL)
+            dialog.set_hide_on_close(True)
+
+            # Version entry
+            entry_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
+            entry_box.set_spacing(8)
+            entry_box.set_margin_top(12)
+
+            entry = Gtk.Entry()
+            entry.set_placeholder_text("e.g., 8.2")
+            entry_box.append(entry)
+
+            # Info label
+            info_label = Gtk.Label()
+            info_label.set_markup(f"<span size='small'>{_('Leave empty to auto-detect')}</span>")
+            info_label.add_css_class("dim-label")
+            info_label.set_halign(Gtk.Align.START)
+            entry_box.append(info_label)
+
+            dialog.set_extra_child(entry_box)
+
+            def on_response(dialog, response):
+                if response == "ok":
+                    version = entry.get_text().strip() or None
+                    target = self._install_php_module_service
+                    dialog.close()
+
+                    self._show_loading_dialog(_("Installing PHP module..."))
+
+                    # Run in thread
+                    def install_task():
+                        try:
+                            success, message = target.install_php_module(version)
+                            GLib.idle_add(self._on_operation_complete, success, message)
+                        except Exception as e:
+                            logger.error(f"Error installing PHP module: {e}")
+                            GLib.idle_add(self._on_operation_complete, False, str(e))
+
+                    self._service_executor.submit(install_task)
+
+            dialog.connect("response", on_response)
+            self._install_php_module_dialog = dialog
+            self._install_php_module_entry = entry
+
+        self._install_php_module_entry.set_text("")
+        self._install_php_module_service = service
+        self._install_php_module_dialog.present()
+    
+    def _on_apache_uninstall_php_module_dialog(self, service, php_modules):
+        """Uninstall PHP Apache module dialog"""
+        # İskelet bir kez kurulur; seçici modül listesine bağlı olduğundan
+        # her açılışta yeniden oluşturulup extra_child olarak takılır
+        if self._uninstall_php_module_dialog is None:
+            dialog = Adw.MessageDialog.new(self, _("Uninstall PHP Module"), None)
+            dialog.set_body(_("Select the PHP Apache module to uninstall"))
+            dialog.set_hide_on_close(True)
+            dialog.add_response("cancel", _S.CANCEL)
+            dialog.add_response("uninstall", _S.UNINSTALL)
+            dialog.set_response_appearance("uninstall", Adw.ResponseAppearance.DESTRUCTIVE)
+
+            def on_response(dialog, response):
+                selected_version = self._uninstall_php_module_selection
+                target = self._uninstall_php_module_service
+                if response == "uninstall" and selected_version[0]:
+                    dialog.close()
+                    self._show_loading_dialog(_("Uninstalling PHP module..."))
+
+                    # Run in thread
+                    def uninstall_task():
+                        try:
+                            success, message = target.uninstall_php_module(selected_version[0])
+                            GLib.idle_add(self._on_operation_complete, success, message)
+                        except Exception as e:
+                            logger.error(f"Error uninstalling PHP module: {e}")
+                            GLib.idle_add(self._on_operation_complete, False, str(e))
+
+                    self._service_executor.submit(uninstall_task)
+
+            dialog.connect("response", on_response)
+            self._uninstall_php_module_dialog = dialog
+
+        # Create module selector
+        scrolled, selected_version = self._version_picker(
+            [(mod['version'], 'active' if mod['enabled'] else None)
+             for mod in php_modules])
+
+        self._uninstall_php_module_dialog.set_extra_child(scrolled)
+        self._uninstall_php_module_selection = selected_version
+        self._uninstall_php_module_service = service
+        self._uninstall_php_module_dialog.present()
+    
     def _on_apache_install_php_module(self, service):
         """Install PHP module for Apache"""
         dialog = Adw.MessageDialog.new(self)
         dialog.set_heading(_("Install PHP Module?"))
         dialog.set_body(_("This will install PHP support for Apache. The server will be restarted."))
         
-        dialog.add_response("cancel", _("Cancel"))
-        dialog.add_response("install", _("Install"))
+        dialog.add_response("cancel", _S.CANCEL)
+        dialog.add_response("install", _S.INSTALL)
         dialog.set_response_appearance("install", Adw.ResponseAppearance.SUGGESTED)
         
         def on_response(dialog, response):
@@ -1976,7 +3055,6 @@ class MainWindow(Adw.ApplicationWindow):
                 self._show_loading_dialog(_("Installing PHP module..."))
                 
                 # Thread'de çalıştır
-                import threading
                 def install_task():
                     try:
                         success, message = service.install_php_module()
@@ -1985,8 +3063,7 @@ class MainWindow(Adw.ApplicationWindow):
                         logger.error(f"Error installing PHP module: {e}")
                         GLib.idle_add(self._on_operation_complete, False, str(e))
                 
-                thread = threading.Thread(target=install_task, daemon=True)
-                thread.start()
+                self._service_executor.submit(install_task)
         
         dialog.connect("response", on_response)
         dialog.present()
@@ -1997,8 +3074,8 @@ class MainWindow(Adw.ApplicationWindow):
         dialog.set_heading(_("Uninstall PHP Module?"))
         dialog.set_body(_("This will remove PHP support from Apache. The server will be restarted."))
         
-        dialog.add_response("cancel", _("Cancel"))
-        dialog.add_response("uninstall", _("Uninstall"))
+        dialog.add_response("cancel", _S.CANCEL)
+        dialog.add_response("uninstall", _S.UNINSTALL)
         dialog.set_response_appearance("uninstall", Adw.ResponseAppearance.DESTRUCTIVE)
         
         def on_response(dialog, response):
@@ -2007,7 +3084,6 @@ class MainWindow(Adw.ApplicationWindow):
                 self._show_loading_dialog(_("Uninstalling PHP module..."))
                 
                 # Thread'de çalıştır
-                import threading
                 def uninstall_task():
                     try:
                         success, message = service.uninstall_php_module()
@@ -2016,27 +3092,31 @@ class MainWindow(Adw.ApplicationWindow):
                         logger.error(f"Error uninstalling PHP module: {e}")
                         GLib.idle_add(self._on_operation_complete, False, str(e))
                 
-                thread = threading.Thread(target=uninstall_task, daemon=True)
-                thread.start()
+                self._service_executor.submit(uninstall_task)
         
         dialog.connect("response", on_response)
         dialog.present()
     
     def _on_apache_manage_modules(self, service):
         """Show Apache modules management dialog"""
-        # Create main dialog
-        dialog = Adw.Dialog()
-        dialog.set_title(_("Apache Modules"))
-        dialog.set_content_width(500)
-        dialog.set_content_height(600)
-        
-        # Main container
-        toolbar_view = Adw.ToolbarView()
-        
-        # Header bar
-        header_bar = Adw.HeaderBar()
-        toolbar_view.add_top_bar(header_bar)
-        
+        # Diyalog iskeleti bir kez kurulur (create-vhost kalıbı);
+        # her açılışta sadece içerik kutusu tazelenir
+        if self._modules_dialog is None:
+            dialog = Adw.Dialog()
+            dialog.set_title(_("Apache Modules"))
+            dialog.set_content_width(500)
+            dialog.set_content_height(600)
+
+            toolbar_view = Adw.ToolbarView()
+            toolbar_view.add_top_bar(Adw.HeaderBar())
+            dialog.set_child(toolbar_view)
+
+            self._modules_dialog = dialog
+            self._modules_toolbar_view = toolbar_view
+
+        dialog = self._modules_dialog
+        toolbar_view = self._modules_toolbar_view
+
         # Content box with loading state
         content_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
         content_box.set_margin_top(12)
@@ -2059,21 +3139,22 @@ class MainWindow(Adw.ApplicationWindow):
         loading_box.append(loading_label)
         
         content_box.append(loading_box)
+        # set_content önceki açılışın içeriğini değiştirir
         toolbar_view.set_content(content_box)
-        dialog.set_child(toolbar_view)
-        
+
         # Load modules in thread
-        import threading
         def load_modules_task():
             try:
-                modules = service.list_modules()
+                # Detay sayfasıyla paylaşılan TTL cache - sayfa az önce
+                # yüklendiyse diyalog sıfır gecikmeyle açılır
+                modules = self._cached_info(
+                    service, 'modules', 30, service.list_modules)
                 GLib.idle_add(self._populate_modules_dialog, content_box, loading_box, modules, service, dialog)
             except Exception as e:
                 logger.error(f"Error loading modules: {e}")
                 GLib.idle_add(self._populate_modules_dialog, content_box, loading_box, [], service, dialog, str(e))
         
-        thread = threading.Thread(target=load_modules_task, daemon=True)
-        thread.start()
+        self._service_executor.submit(load_modules_task)
         
         dialog.present(self)
     
@@ -2162,7 +3243,6 @@ class MainWindow(Adw.ApplicationWindow):
             self._show_loading_dialog(_("Disabling module..."))
         
         # Run in thread
-        import threading
         def toggle_task():
             try:
                 if enabled:
@@ -2174,43 +3254,42 @@ class MainWindow(Adw.ApplicationWindow):
                 logger.error(f"Error toggling module {module_name}: {e}")
                 GLib.idle_add(self._on_operation_complete, False, str(e))
         
-        thread = threading.Thread(target=toggle_task, daemon=True)
-        thread.start()
+        self._service_executor.submit(toggle_task)
     
     def _on_apache_enable_ssl(self, service):
         """Enable SSL module"""
-        dialog = Adw.MessageDialog.new(self)
-        dialog.set_heading(_("Enable SSL Module?"))
-        dialog.set_body(_("This will enable HTTPS support in Apache. The server will be restarted."))
-        
-        dialog.add_response("cancel", _("Cancel"))
-        dialog.add_response("enable", _("Enable SSL"))
-        dialog.set_response_appearance("enable", Adw.ResponseAppearance.SUGGESTED)
-        
+        dialog = self._make_dialog(
+            _("Enable SSL Module?"),
+            _("This will enable HTTPS support in Apache. The server will be restarted."),
+            _("Enable SSL"))
+
         def on_response(dialog, response):
-            if response == "enable":
+            if response == "ok":
                 success, message = service.enable_ssl_module()
                 self._show_toast(message)
                 if success:
                     dialog.close()
+                    self._invalidate_info(service)
                     if self.current_service and self.current_service.name == service.name:
-                        self._refresh_detail_page()
+                        self._request_refresh()
         
         dialog.connect("response", on_response)
         dialog.present()
     
     def _on_apache_create_certificate(self, service):
         """Create self-signed certificate dialog"""
-        dialog = Adw.MessageDialog.new(self, _("Create SSL Certificate"), None)
-        dialog.set_body(_("Enter the domain name for the certificate"))
-        
+        dialog = self._make_dialog(
+            _("Create SSL Certificate"),
+            _("Enter the domain name for the certificate"),
+            _("Create Certificate"))
+
         # Domain entry
         entry_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
         entry_box.set_spacing(8)
         entry_box.set_margin_top(12)
         
         entry = Gtk.Entry()
-        entry.set_property("placeholder-text", "example.com")
+        entry.set_placeholder_text("example.com")
         entry_box.append(entry)
         
         info_label = Gtk.Label()
@@ -2220,12 +3299,9 @@ class MainWindow(Adw.ApplicationWindow):
         entry_box.append(info_label)
         
         dialog.set_extra_child(entry_box)
-        dialog.add_response("cancel", _("Cancel"))
-        dialog.add_response("create", _("Create Certificate"))
-        dialog.set_response_appearance("create", Adw.ResponseAppearance.SUGGESTED)
-        
+
         def on_response(dialog, response):
-            if response == "create":
+            if response == "ok":
                 domain = entry.get_text().strip()
                 if not domain:
                     self._show_toast(_("Domain name cannot be empty"))
@@ -2245,7 +3321,7 @@ class MainWindow(Adw.ApplicationWindow):
                             key=cert_info.get('key_path', '')
                         )
                     )
-                    info_dialog.add_response("ok", _("OK"))
+                    info_dialog.add_response("ok", _S.OK)
                     info_dialog.present()
         
         dialog.connect("response", on_response)
@@ -2253,192 +3329,164 @@ class MainWindow(Adw.ApplicationWindow):
     
     def _on_apache_create_vhost(self, service):
         """Create virtual host dialog with comprehensive settings"""
-        # Create a full dialog with better layout
+        # Diyalog bir kez kurulur; sonraki açılışlarda sadece form
+        # sıfırlanır - widget kurulumu diyalog gecikmesinin çoğu
+        if self._create_vhost_dialog is None:
+            self._build_create_vhost_dialog()
+
+        # Reset form state
+        self._cv_servername_row.set_text("")
+        self._cv_docroot_entry.set_text("")
+        self._cv_ssl_row.set_active(False)
+
+        # PHP sürüm modeli her açılışta tazelenir (cache'li sorgu)
+        php_model = Gtk.StringList()
+        php_model.append(_("None"))
+        self._cv_php_versions = [None]
+        for version in self._get_php_versions_cached(service):
+            php_model.append(f"PHP {version}")
+            self._cv_php_versions.append(version)
+        self._cv_php_row.set_model(php_model)
+        self._cv_php_row.set_selected(0)
+
+        # Create handler servisi buradan okur
+        self._cv_service = service
+
+        self._create_vhost_dialog.present(self)
+
+    def _build_create_vhost_dialog(self):
+        """Create-vhost diyaloğunu kur (pencere başına bir kez)"""
         dialog = Adw.Dialog()
         dialog.set_title(_("Create Virtual Host"))
-        
+
         # Create toolbar view
         toolbar_view = Adw.ToolbarView()
-        
+
         # Header bar with cancel and create buttons
         header = Adw.HeaderBar()
-        
-        cancel_button = Gtk.Button(label=_("Cancel"))
+
+        cancel_button = Gtk.Button(label=_S.CANCEL)
         cancel_button.connect("clicked", lambda b: dialog.close())
         header.pack_start(cancel_button)
-        
-        create_button = Gtk.Button(label=_("Create"))
+
+        create_button = Gtk.Button(label=_S.CREATE)
         create_button.add_css_class("suggested-action")
         header.pack_end(create_button)
-        
+
         toolbar_view.add_top_bar(header)
-        
+
         # Main content
         scrolled = Gtk.ScrolledWindow()
         scrolled.set_vexpand(True)
         scrolled.set_hexpand(True)
         scrolled.set_min_content_width(500)
         scrolled.set_min_content_height(500)
-        
+
         content_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
         content_box.set_spacing(24)
         content_box.set_margin_top(24)
         content_box.set_margin_bottom(24)
         content_box.set_margin_start(24)
         content_box.set_margin_end(24)
-        
+
         # Basic Settings Group
         basic_group = Adw.PreferencesGroup()
         basic_group.set_title(_("Basic Settings"))
         basic_group.set_description(_("Configure domain name and document root"))
-        
+
         # Server name entry row
         servername_row = Adw.EntryRow()
         servername_row.set_title(_("Server Name (Domain)"))
         servername_row.set_text("")
         servername_row.set_show_apply_button(False)
         basic_group.add(servername_row)
-        
+
         # Document root with file chooser
         docroot_row = Adw.ActionRow()
         docroot_row.set_title(_("Document Root"))
         docroot_row.set_subtitle(_("Location of website files"))
-        
+
         docroot_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL)
         docroot_box.set_spacing(6)
         docroot_box.set_valign(Gtk.Align.CENTER)
-        
+
         docroot_entry = Gtk.Entry()
         docroot_entry.set_placeholder_text("/var/www/example.local")
         docroot_entry.set_hexpand(True)
         docroot_box.append(docroot_entry)
-        
+
         browse_button = Gtk.Button()
         browse_button.set_icon_name("document-open-symbolic")
         browse_button.set_tooltip_text(_("Browse"))
-        
+
         def on_browse_clicked(button):
             file_dialog = Gtk.FileDialog()
             file_dialog.set_title(_("Select Document Root"))
             file_dialog.select_folder(None, None, lambda d, res: self._on_folder_selected(d, res, docroot_entry))
-        
+
         browse_button.connect("clicked", on_browse_clicked)
         docroot_box.append(browse_button)
-        
+
         docroot_row.add_suffix(docroot_box)
         basic_group.add(docroot_row)
-        
+
         content_box.append(basic_group)
-        
+
         # PHP Settings Group
         php_group = Adw.PreferencesGroup()
         php_group.set_title(_("PHP Configuration"))
         php_group.set_description(_("Select PHP version for this virtual host"))
-        
-        # PHP version selector
-        php_versions = service.get_installed_php_versions()
+
+        # PHP version selector - model açılışta doldurulur
         php_row = Adw.ComboRow()
         php_row.set_title(_("PHP Version"))
         php_row.set_subtitle(_("Leave as 'None' if not using PHP"))
-        
-        php_model = Gtk.StringList()
-        php_model.append(_("None"))
-        php_versions_list = [None]
-        
-        for version in php_versions:
-            php_model.append(f"PHP {version}")
-            php_versions_list.append(version)
-        
-        php_row.set_model(php_model)
-        php_row.set_selected(0)
         php_group.add(php_row)
-        
+
         content_box.append(php_group)
-        
+
         # SSL/HTTPS Settings Group
         ssl_group = Adw.PreferencesGroup()
         ssl_group.set_title(_("SSL/HTTPS Configuration"))
         ssl_group.set_description(_("Enable HTTPS with automatic certificate generation"))
-        
+
         # SSL enable switch
         ssl_row = Adw.SwitchRow()
         ssl_row.set_title(_("Enable SSL/HTTPS"))
         ssl_row.set_subtitle(_("Listen on port 443 with automatic self-signed certificate"))
         ssl_row.set_active(False)
         ssl_group.add(ssl_row)
-        
+
         # SSL info when enabled
         ssl_info_row = Adw.ActionRow()
         ssl_info_row.set_title(_("Certificate Generation"))
         ssl_info_row.set_subtitle(_("A self-signed certificate will be automatically created and configured"))
-        ssl_info_icon = Gtk.Image.new_from_icon_name("dialog-information-symbolic")
-        ssl_info_row.add_prefix(ssl_info_icon)
+        ssl_info_row.add_prefix(_icon("dialog-information-symbolic"))
         ssl_info_row.set_visible(False)
         ssl_group.add(ssl_info_row)
-        
+
         def on_ssl_toggled(switch, *args):
             ssl_info_row.set_visible(switch.get_active())
-        
+
         ssl_row.connect("notify::active", on_ssl_toggled)
-        
-        content_box.append(ssl_group)
-        
-        scrolled.set_child(content_box)
-        toolbar_view.set_content(scrolled)
-        dialog.set_child(toolbar_view)
-        
-        # Create button handler
-        def on_create_clicked(button):
-            server_name = servername_row.get_text().strip()
-            document_root = docroot_entry.get_text().strip()
-            ssl_enabled = ssl_row.get_active()
-            php_selected = php_row.get_selected()
-            php_version = php_versions_list[php_selected] if php_selected > 0 else None
-            
-            # Debug logging
-            logger.info(f"Creating vhost - Server name: '{server_name}', Document root: '{document_root}'")
-            
-            # Validation
-            if not server_name:
-                self._show_toast(_("Server name cannot be empty"))
-                return
-            
-            # Auto-generate document root if empty
-            if not document_root:
-                document_root = f"/var/www/{server_name}"
-                docroot_entry.set_text(document_root)
-            
-            logger.info(f"Final values - Server name: '{server_name}', Document root: '{document_root}'")
-            
-            # Show progress
-            self._show_toast(_("Creating virtual host..."))
-            
-            # Create vhost with all settings
-            success, message = service.create_vhost(
-                server_name=server_name,
-                document_root=document_root,
-                ssl=ssl_enabled,
-                php_version=php_version
-            )
-            
-            self._show_toast(message)
-            
-            if success:
-                dialog.close()
-                if self.current_service and self.current_service.name == service.name:
-                    self._refresh_detail_page()
-        
-        create_button.connect("clicked", on_create_clicked)
-        
+
+        content_box.append(ssl_group)
+
+        scrolled.set_child(content_box)
+        toolbar_view.set_content(scrolled)
+        dialog.set_child(toolbar_view)
+
+        create_button.connect("clicked", self._on_create_vhost_clicked)
+
         # Auto-fill document root when server name changes (with debounce)
         auto_fill_timeout = [None]  # Use list to allow modification in closure
-        
+
         def on_servername_changed(entry):
             # Cancel previous timeout
             if auto_fill_timeout[0]:
                 GLib.source_remove(auto_fill_timeout[0])
                 auto_fill_timeout[0] = None
-            
+
             # Set new timeout (500ms delay)
             def do_auto_fill():
                 server_name = entry.get_text().strip()
@@ -2448,12 +3496,60 @@ class MainWindow(Adw.ApplicationWindow):
                     docroot_entry.set_text(new_path)
                 auto_fill_timeout[0] = None
                 return False  # Don't repeat
-            
+
             auto_fill_timeout[0] = GLib.timeout_add(500, do_auto_fill)
-        
+
         servername_row.connect("changed", on_servername_changed)
-        
-        dialog.present(self)
+
+        # Açılışta sıfırlanacak/okunacak referanslar
+        self._cv_servername_row = servername_row
+        self._cv_docroot_entry = docroot_entry
+        self._cv_php_row = php_row
+        self._cv_ssl_row = ssl_row
+        self._cv_php_versions = [None]
+        self._create_vhost_dialog = dialog
+
+    def _on_create_vhost_clicked(self, button):
+        """Create-vhost diyaloğunun onay handler'ı"""
+        service = self._cv_service
+        server_name = self._cv_servername_row.get_text().strip()
+        document_root = self._cv_docroot_entry.get_text().strip()
+        ssl_enabled = self._cv_ssl_row.get_active()
+        php_selected = self._cv_php_row.get_selected()
+        php_version = self._cv_php_versions[php_selected] if php_selected > 0 else None
+
+        # Debug logging
+        logger.info(f"Creating vhost - Server name: '{server_name}', Document root: '{document_root}'")
+
+        # Validation
+        if not server_name:
+            self._show_toast(_("Server name cannot be empty"))
+            return
+
+        # Auto-generate document root if empty
+        if not document_root:
+            document_root = f"/var/www/{server_name}"
+            self._cv_docroot_entry.set_text(document_root)
+
+        logger.info(f"Final values - Server name: '{server_name}', Document root: '{document_root}'")
+
+        # Show progress
+        self._show_toast(_("Creating virtual host..."))
+
+        # Create vhost with all settings
+        success, message = service.create_vhost(
+            server_name=server_name,
+            document_root=document_root,
+            ssl=ssl_enabled,
+            php_version=php_version
+        )
+
+        self._show_toast(message)
+
+        if success:
+            self._create_vhost_dialog.close()
+            self._invalidate_info(service)
+            self._maybe_refresh(service)
     
     def _on_folder_selected(self, file_dialog, result, entry):
         """Handle folder selection for document root"""
@@ -2466,18 +3562,6 @@ class MainWindow(Adw.ApplicationWindow):
         except Exception as e:
             logger.error(f"Error selecting folder: {e}")
     
-    def _on_apache_toggle_vhost(self, service, vhost, enabled):
-        """Toggle virtual host enabled state"""
-        if enabled:
-            success, message = service.enable_vhost(vhost['filename'])
-        else:
-            success, message = service.disable_vhost(vhost['filename'])
-        
-        self._show_toast(message)
-        if not success:
-            # Revert switch state if failed
-            self._show_service_detail(service)
-    
     def _on_apache_delete_vhost(self, service, vhost):
         """Delete virtual host"""
         dialog = Adw.MessageDialog.new(self)
@@ -2486,22 +3570,55 @@ class MainWindow(Adw.ApplicationWindow):
             name=vhost['server_name']
         ))
         
-        dialog.add_response("cancel", _("Cancel"))
-        dialog.add_response("delete", _("Delete"))
+        dialog.add_response("cancel", _S.CANCEL)
+        dialog.add_response("delete", _S.DELETE)
         dialog.set_response_appearance("delete", Adw.ResponseAppearance.DESTRUCTIVE)
-        
-        def on_response(dialog, response):
-            if response == "delete":
-                success, message = service.delete_vhost(vhost['filename'])
-                self._show_toast(message)
-                if success:
-                    dialog.close()
-                    if self.current_service and self.current_service.name == service.name:
-                        self._refresh_detail_page()
-        
-        dialog.connect("response", on_response)
+
+        # Closure yerine bağlı metot: bağlam diyalog üstünde taşınır,
+        # diyalog kapanınca referanslar da onunla birlikte gider
+        dialog._ctx = {'service': service, 'filename': vhost['filename']}
+        dialog.connect("response", self._on_delete_vhost_response)
         dialog.present()
+
+    def _on_delete_vhost_response(self, dialog, response):
+        """Vhost silme onayı - bağlam dialog._ctx üzerinden gelir"""
+        if response != "delete":
+            return
+        ctx = dialog._ctx
+        service = ctx['service']
+        success, message = service.delete_vhost(ctx['filename'])
+        self._show_toast(message)
+        if success:
+            dialog.close()
+            parent = ctx.get('parent_dialog')
+            if parent is not None:
+                parent.close()
+            self._invalidate_info(service)
+            self._maybe_refresh(service)
     
+    def _lazy_expander_group(self, title, build_rows):
+        """İçeriği ilk genişletmede kurulan kapalı ExpanderRow'lu grup
+
+        build_rows(expander) satırları expander.add_row ile ekler;
+        yalnızca ilk notify::expanded sinyalinde bir kez çağrılır.
+        """
+        group = Adw.PreferencesGroup()
+        expander = Adw.ExpanderRow()
+        expander.set_title(title)
+        expander._built = False
+
+        def on_expanded(row, pspec):
+            if row._built or not row.get_expanded():
+                return
+            row._built = True
+            build_rows(row)
+
+        expander.connect("notify::expanded", on_expanded)
+        group.add(expander)
+        # Çağıranlar duyarlılığı yönetebilsin diye referans saklanır
+        group._expander = expander
+        return group
+
     def _show_vhost_detail(self, service, vhost):
         """Show virtual host detail page"""
         # Always get full detailed information from script
@@ -2509,182 +3626,143 @@ class MainWindow(Adw.ApplicationWindow):
         if not filename:
             self._show_toast(_("Invalid virtual host data"))
             return
-        
-        details = service.get_vhost_details(filename)
-        if not details:
-            self._show_toast(_("Could not load virtual host details"))
-            return
-        
-        # Debug: Log details
-        logger.info(f"Vhost details for {filename}: {details}")
-        logger.info(f"Keys: {list(details.keys()) if isinstance(details, dict) else 'Not a dict'}")
-        
-        # Log each field separately for debugging
-        logger.info(f"  filename: {details.get('filename', 'MISSING')}")
-        logger.info(f"  server_name: {details.get('server_name', 'MISSING')}")
-        logger.info(f"  document_root: {details.get('document_root', 'MISSING')}")
-        logger.info(f"  ssl: {details.get('ssl', 'MISSING')}")
-        logger.info(f"  php_version: {details.get('php_version', 'MISSING')}")
-        logger.info(f"  enabled: {details.get('enabled', 'MISSING')}")
-        
-        # Create detail dialog
-        dialog = Adw.Dialog()
-        dialog.set_title(details.get('server_name', filename))
-        
-        # Main content
-        toolbar_view = Adw.ToolbarView()
-        
-        # Header bar
-        header = Adw.HeaderBar()
-        header.set_show_title(True)
-        toolbar_view.add_top_bar(header)
-        
-        # Scrolled content
-        scrolled = Gtk.ScrolledWindow()
-        scrolled.set_vexpand(True)
-        scrolled.set_hexpand(True)
-        scrolled.set_min_content_width(500)
-        scrolled.set_min_content_height(600)
-        
-        content_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
-        content_box.set_spacing(24)
-        content_box.set_margin_top(24)
-        content_box.set_margin_bottom(24)
-        content_box.set_margin_start(24)
-        content_box.set_margin_end(24)
-        
-        # Site Information
-        info_group = Adw.PreferencesGroup()
-        info_group.set_title(_("Site Information"))
-        
-        # Server name
-        name_row = Adw.ActionRow()
-        name_row.set_title(_("Server Name"))
-        server_name = details.get('server_name', 'N/A')
-        logger.info(f"Setting server_name: {server_name}")
-        name_row.set_subtitle(server_name)
-        info_group.add(name_row)
-        
-        # Document root
-        docroot_row = Adw.ActionRow()
-        docroot_row.set_title(_("Document Root"))
-        doc_root = details.get('document_root', 'N/A')
-        logger.info(f"Setting document_root: {doc_root}")
-        docroot_row.set_subtitle(doc_root or "N/A")
-        info_group.add(docroot_row)
-        
-        # SSL status
-        ssl_row = Adw.ActionRow()
-        ssl_row.set_title(_("SSL/HTTPS"))
-        if details.get('ssl', False) or details.get('ssl_enabled', False):
-            ssl_row.set_subtitle("✅ " + _("Enabled"))
-        else:
-            ssl_row.set_subtitle("❌ " + _("Disabled"))
-        info_group.add(ssl_row)
-        
-        # PHP version
-        php_row = Adw.ActionRow()
-        php_row.set_title(_("PHP Version"))
-        php_version = details.get('php_version', '')
-        if php_version:
-            php_row.set_subtitle(f"PHP {php_version}")
-        else:
-            php_row.set_subtitle(_("Not configured"))
-        info_group.add(php_row)
-        
-        content_box.append(info_group)
-        
-        # PHP Management
-        php_group = Adw.PreferencesGroup()
-        php_group.set_title(_("PHP Configuration"))
-        
-        php_versions = service.get_installed_php_versions()
-        if php_versions:
-            # Change PHP version
-            change_php_row = Adw.ActionRow()
-            change_php_row.set_title(_("Change PHP Version"))
-            change_php_row.set_subtitle(_("Switch to a different PHP version"))
-            change_php_row.set_activatable(True)
-            change_php_row.connect("activated", lambda r: self._on_vhost_change_php(service, details, php_versions, dialog))
-            change_php_icon = Gtk.Image.new_from_icon_name("emblem-synchronizing-symbolic")
-            change_php_row.add_prefix(change_php_icon)
-            php_group.add(change_php_row)
-        
-        content_box.append(php_group)
-        
+
+        # İskelet diyalog hemen açılır; vhost-details script'i worker'da
+        # koşar ve satırlar sonuç gelince dolar - present() bloklanmaz
+        details = {}
+
+        # Statik iskelet Builder şablonundan gelir; yalnızca dinamik
+        # kısımlar (başlık, subtitle'lar, lazy gruplar) Python'da kalır
+        builder = Gtk.Builder.new_from_string(_VHOST_DETAIL_UI, -1)
+        dialog = builder.get_object("dialog")
+        dialog.set_title(vhost.get('server_name') or filename)
+
+        content_box = builder.get_object("content_box")
+        name_row = builder.get_object("name_row")
+        docroot_row = builder.get_object("docroot_row")
+        ssl_row = builder.get_object("ssl_row")
+        php_row = builder.get_object("php_row")
+
+        # PHP Configuration - kullanıcı çoğu zaman sadece site bilgisine
+        # bakıp kapatıyor; ikincil grupların satırları ilk genişletmede
+        # kurulur, kapalı kaldıkça widget maliyeti hiç ödenmez
+        def build_php_rows(expander):
+            php_versions = self._get_php_versions_cached(service)
+            if php_versions:
+                change_php_row = Adw.ActionRow()
+                change_php_row.set_title(_("Change PHP Version"))
+                change_php_row.set_subtitle(_("Switch to a different PHP version"))
+                change_php_row.set_activatable(True)
+                change_php_row.connect("activated", lambda r: self._on_vhost_change_php(service, details, php_versions, dialog))
+                change_php_row.add_prefix(_icon("emblem-synchronizing-symbolic"))
+                expander.add_row(change_php_row)
+
+        php_expander_group = self._lazy_expander_group(_("PHP Configuration"), build_php_rows)
+        # Detaylar gelene kadar genişletilemesin
+        php_expander_group._expander.set_sensitive(False)
+        content_box.append(php_expander_group)
+
         # Actions
-        actions_group = Adw.PreferencesGroup()
-        actions_group.set_title(_("Actions"))
-        
-        # Trust SSL Certificate (only if SSL is enabled)
-        if details.get('ssl', False):
-            trust_ssl_row = Adw.ActionRow()
-            trust_ssl_row.set_title(_("Trust SSL Certificate"))
-            trust_ssl_row.set_subtitle(_("Add certificate to system trust store (fixes browser warnings)"))
-            trust_ssl_row.set_activatable(True)
-            trust_ssl_row.connect("activated", lambda r: self._on_vhost_trust_ssl(service, details, dialog))
-            trust_ssl_icon = Gtk.Image.new_from_icon_name("security-high-symbolic")
-            trust_ssl_row.add_prefix(trust_ssl_icon)
-            actions_group.add(trust_ssl_row)
-        
-        # Edit virtual host
-        edit_row = Adw.ActionRow()
-        edit_row.set_title(_("Edit Virtual Host"))
-        edit_row.set_subtitle(_("Modify domain, document root, PHP and SSL settings"))
-        edit_row.set_activatable(True)
-        edit_row.connect("activated", lambda r: self._on_vhost_edit(service, details, dialog))
-        edit_icon = Gtk.Image.new_from_icon_name("document-edit-symbolic")
-        edit_row.add_prefix(edit_icon)
-        actions_group.add(edit_row)
-        
-        # Enable/Disable
-        os_type = service.platform_manager.os_type.value
-        if os_type in ['ubuntu', 'debian']:
-            if details['enabled']:
-                disable_row = Adw.ActionRow()
-                disable_row.set_title(_("Disable Site"))
-                disable_row.set_subtitle(_("Temporarily disable this virtual host"))
-                disable_row.set_activatable(True)
-                disable_row.connect("activated", lambda r: self._on_vhost_disable(service, details, dialog))
-                disable_icon = Gtk.Image.new_from_icon_name("media-playback-pause-symbolic")
-                disable_row.add_prefix(disable_icon)
-                actions_group.add(disable_row)
-            else:
-                enable_row = Adw.ActionRow()
-                enable_row.set_title(_("Enable Site"))
-                enable_row.set_subtitle(_("Enable this virtual host"))
-                enable_row.set_activatable(True)
-                enable_row.connect("activated", lambda r: self._on_vhost_enable(service, details, dialog))
-                enable_icon = Gtk.Image.new_from_icon_name("media-playback-start-symbolic")
-                enable_row.add_prefix(enable_icon)
-                actions_group.add(enable_row)
-        
-        # Open in browser
-        browse_row = Adw.ActionRow()
-        browse_row.set_title(_("Open in Browser"))
-        browse_row.set_subtitle(f"http://{details.get('server_name', 'N/A')}/")
-        browse_row.set_activatable(True)
-        browse_row.connect("activated", lambda r: self._on_vhost_open_browser(details))
-        browse_icon = Gtk.Image.new_from_icon_name("web-browser-symbolic")
-        browse_row.add_prefix(browse_icon)
-        actions_group.add(browse_row)
-        
-        # Delete
-        delete_row = Adw.ActionRow()
-        delete_row.set_title(_("Delete Virtual Host"))
-        delete_row.set_subtitle(_("Permanently remove this site"))
-        delete_row.set_activatable(True)
-        delete_row.connect("activated", lambda r: self._on_vhost_delete_confirm(service, details, dialog))
-        delete_icon = Gtk.Image.new_from_icon_name("user-trash-symbolic")
-        delete_row.add_prefix(delete_icon)
-        actions_group.add(delete_row)
-        
-        content_box.append(actions_group)
-        
-        scrolled.set_child(content_box)
-        toolbar_view.set_content(scrolled)
-        dialog.set_child(toolbar_view)
+        def build_action_rows(expander):
+            # Trust SSL Certificate (only if SSL is enabled)
+            if details.get('ssl', False):
+                trust_ssl_row = Adw.ActionRow()
+                trust_ssl_row.set_title(_("Trust SSL Certificate"))
+                trust_ssl_row.set_subtitle(_("Add certificate to system trust store (fixes browser warnings)"))
+                trust_ssl_row.set_activatable(True)
+                trust_ssl_row.connect("activated", lambda r: self._on_vhost_trust_ssl(service, details, dialog))
+                trust_ssl_row.add_prefix(_icon("security-high-symbolic"))
+                expander.add_row(trust_ssl_row)
+
+            # Edit virtual host
+            edit_row = Adw.ActionRow()
+            edit_row.set_title(_("Edit Virtual Host"))
+            edit_row.set_subtitle(_("Modify domain, document root, PHP and SSL settings"))
+            edit_row.set_activatable(True)
+            edit_row.connect("activated", lambda r: self._on_vhost_edit(service, details, dialog))
+            edit_row.add_prefix(_icon("document-edit-symbolic"))
+            expander.add_row(edit_row)
+
+            # Enable/Disable
+            if _os_type_for(service) in _DEB_OSES:
+                if details.get('enabled'):
+                    disable_row = Adw.ActionRow()
+                    disable_row.set_title(_("Disable Site"))
+                    disable_row.set_subtitle(_("Temporarily disable this virtual host"))
+                    disable_row.set_activatable(True)
+                    disable_row.connect("activated", lambda r: self._on_vhost_disable(service, details, dialog))
+                    disable_row.add_prefix(_icon("media-playback-pause-symbolic"))
+                    expander.add_row(disable_row)
+                else:
+                    enable_row = Adw.ActionRow()
+                    enable_row.set_title(_("Enable Site"))
+                    enable_row.set_subtitle(_("Enable this virtual host"))
+                    enable_row.set_activatable(True)
+                    enable_row.connect("activated", lambda r: self._on_vhost_enable(service, details, dialog))
+                    enable_row.add_prefix(_icon("media-playback-start-symbolic"))
+                    expander.add_row(enable_row)
+
+            # Open in browser
+            browse_row = Adw.ActionRow()
+            browse_row.set_title(_("Open in Browser"))
+            browse_row.set_subtitle(f"http://{details.get('server_name', 'N/A')}/")
+            browse_row.set_activatable(True)
+            browse_row.connect("activated", lambda r: self._on_vhost_open_browser(details))
+            browse_row.add_prefix(_icon("web-browser-symbolic"))
+            expander.add_row(browse_row)
+
+            # Delete
+            delete_row = Adw.ActionRow()
+            delete_row.set_title(_("Delete Virtual Host"))
+            delete_row.set_subtitle(_("Permanently remove this site"))
+            delete_row.set_activatable(True)
+            delete_row.connect("activated", lambda r: self._on_vhost_delete_confirm(service, details, dialog))
+            delete_row.add_prefix(_icon("user-trash-symbolic"))
+            expander.add_row(delete_row)
+
+        actions_expander_group = self._lazy_expander_group(_("Actions"), build_action_rows)
+        actions_expander_group._expander.set_sensitive(False)
+        content_box.append(actions_expander_group)
+
         dialog.present(self)
+
+        # Detayları worker'da getir, UI thread'inde doldur
+        def apply_details(future):
+            try:
+                result = future.result()
+            except Exception as e:
+                logger.error(f"Error loading vhost details: {e}")
+                result = None
+
+            if not result:
+                name_row.set_subtitle(_("Could not load virtual host details"))
+                docroot_row.set_subtitle("N/A")
+                ssl_row.set_subtitle("N/A")
+                php_row.set_subtitle("N/A")
+                return GLib.SOURCE_REMOVE
+
+            # Expander builder'ları ve handler'lar aynı dict'i görür
+            details.update(result)
+
+            dialog.set_title(details.get('server_name', filename))
+            name_row.set_subtitle(details.get('server_name', 'N/A'))
+            docroot_row.set_subtitle(details.get('document_root', 'N/A') or "N/A")
+            if details.get('ssl', False) or details.get('ssl_enabled', False):
+                ssl_row.set_subtitle("✅ " + _S.ENABLED)
+            else:
+                ssl_row.set_subtitle("❌ " + _S.DISABLED)
+            php_version = details.get('php_version', '')
+            if php_version:
+                php_row.set_subtitle(f"PHP {php_version}")
+            else:
+                php_row.set_subtitle(_("Not configured"))
+
+            php_expander_group._expander.set_sensitive(True)
+            actions_expander_group._expander.set_sensitive(True)
+            return GLib.SOURCE_REMOVE
+
+        future = self._io_pool.submit(service.get_vhost_details, filename)
+        future.add_done_callback(lambda f: GLib.idle_add(apply_details, f))
     
     def _on_vhost_change_php(self, service, details, versions, parent_dialog):
         """Change PHP version for vhost"""
@@ -2692,58 +3770,64 @@ class MainWindow(Adw.ApplicationWindow):
         dialog.set_heading(_("Change PHP Version"))
         dialog.set_body(_("Select the PHP version for {name}").format(name=details.get('server_name', 'N/A')))
         
-        # Version selector
-        list_box = Gtk.ListBox()
-        list_box.set_selection_mode(Gtk.SelectionMode.NONE)
-        list_box.add_css_class("boxed-list")
-        
-        selected_version = [details.get('php_version', versions[0] if versions else '')]
-        check_buttons = []
-        
-        for version in versions:
-            row = Adw.ActionRow()
-            row.set_title(f"PHP {version}")
-            row.set_activatable(True)
-            
-            # Check button
-            check = Gtk.CheckButton()
-            check.set_active(version == selected_version[0])
-            check.set_valign(Gtk.Align.CENTER)
-            row.add_suffix(check)
-            row.set_activatable_widget(check)
-            
-            # Store version
-            check.version = version
-            check_buttons.append(check)
-            
-            # Make radio behavior (only one selected)
-            def on_check_toggled(check_btn):
-                if check_btn.get_active():
-                    selected_version[0] = check_btn.version
-                    # Uncheck others
-                    for other in check_buttons:
-                        if other != check_btn:
-                            other.set_active(False)
-            
-            check.connect("toggled", on_check_toggled)
-            
-            list_box.append(row)
-        
+        # Sürüm başına ListBoxRow+CheckButton kurmak yerine geri
+        # dönüşümlü ListView; seçim SingleSelection modelinde tutulur,
+        # elle radyo davranışı taklidi de ortadan kalkar
+        current_version = details.get('php_version', versions[0] if versions else '')
+
+        model = Gtk.StringList.new([f"PHP {v}" for v in versions])
+        selection = Gtk.SingleSelection.new(model)
+        if current_version in versions:
+            selection.set_selected(versions.index(current_version))
+
+        factory = Gtk.SignalListItemFactory()
+
+        def setup_item(f, list_item):
+            box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL)
+            box.set_spacing(12)
+            box.set_margin_top(8)
+            box.set_margin_bottom(8)
+            box.set_margin_start(12)
+            box.set_margin_end(12)
+            label = Gtk.Label()
+            label.set_hexpand(True)
+            label.set_halign(Gtk.Align.START)
+            box.append(label)
+            check = _icon("emblem-ok-symbolic")
+            check.add_css_class("success")
+            check.set_visible(False)
+            box.append(check)
+            box._label = label
+            box._check = check
+            list_item.set_child(box)
+
+        def bind_item(f, list_item):
+            box = list_item.get_child()
+            text = list_item.get_item().get_string()
+            box._label.set_label(text)
+            box._check.set_visible(text == f"PHP {current_version}")
+
+        factory.connect("setup", setup_item)
+        factory.connect("bind", bind_item)
+
+        list_view = Gtk.ListView.new(selection, factory)
+
         scrolled = Gtk.ScrolledWindow()
-        scrolled.set_child(list_box)
+        scrolled.set_child(list_view)
         scrolled.set_min_content_height(200)
         scrolled.set_margin_top(12)
-        
+
         dialog.set_extra_child(scrolled)
-        dialog.add_response("cancel", _("Cancel"))
+        dialog.add_response("cancel", _S.CANCEL)
         dialog.add_response("change", _("Change"))
         dialog.set_response_appearance("change", Adw.ResponseAppearance.SUGGESTED)
-        
+
         def on_response(dialog, response):
             if response == "change":
-                new_version = selected_version[0]
+                selected = selection.get_selected()
+                new_version = versions[selected] if selected < len(versions) else None
                 logger.info(f"Changing PHP version for {details['filename']} to {new_version}")
-                
+
                 if not new_version:
                     self._show_toast(_("Please select a PHP version"))
                     return
@@ -2755,37 +3839,37 @@ class MainWindow(Adw.ApplicationWindow):
                 if success:
                     dialog.close()
                     parent_dialog.close()
-                    if self.current_service and self.current_service.name == service.name:
-                        self._refresh_detail_page()
-        
+                    self._invalidate_info(service)
+                    self._maybe_refresh(service)
+
         dialog.connect("response", on_response)
         dialog.present()
-    
+
     def _on_vhost_enable(self, service, details, parent_dialog):
         """Enable virtual host"""
         success, message = service.enable_vhost(details['filename'])
         self._show_toast(message)
         if success:
             parent_dialog.close()
-            if self.current_service and self.current_service.name == service.name:
-                self._refresh_detail_page()
-    
+            self._invalidate_info(service)
+            self._maybe_refresh(service)
+
     def _on_vhost_disable(self, service, details, parent_dialog):
         """Disable virtual host"""
         success, message = service.disable_vhost(details['filename'])
         self._show_toast(message)
         if success:
             parent_dialog.close()
-            if self.current_service and self.current_service.name == service.name:
-                self._refresh_detail_page()
+            self._invalidate_info(service)
+            self._maybe_refresh(service)
     
     def _on_vhost_open_browser(self, details):
         """Open virtual host in browser"""
-        import subprocess
         url = f"http://{details.get('server_name', 'localhost')}/"
         try:
-            subprocess.Popen(['xdg-open', url])
-        except Exception as e:
+            launcher = Gtk.UriLauncher.new(url)
+            launcher.launch(self, None, None, None)
+        except GLib.Error as e:
             logger.error(f"Error opening browser: {e}")
             self._show_toast(_("Could not open browser"))
     
@@ -2809,7 +3893,7 @@ class MainWindow(Adw.ApplicationWindow):
         # Header bar with cancel and save buttons
         header = Adw.HeaderBar()
         
-        cancel_button = Gtk.Button(label=_("Cancel"))
+        cancel_button = Gtk.Button(label=_S.CANCEL)
         cancel_button.connect("clicked", lambda b: dialog.close())
         header.pack_start(cancel_button)
         
@@ -2866,7 +3950,7 @@ class MainWindow(Adw.ApplicationWindow):
         php_group.set_description(_("Change PHP version for this virtual host"))
         
         # PHP version selector
-        php_versions = service.get_installed_php_versions()
+        php_versions = self._get_php_versions_cached(service)
         php_row = Adw.ComboRow()
         php_row.set_title(_("PHP Version"))
         
@@ -2938,8 +4022,8 @@ class MainWindow(Adw.ApplicationWindow):
                 if success:
                     dialog.close()
                     parent_dialog.close()
-                    if self.current_service and self.current_service.name == service.name:
-                        self._refresh_detail_page()
+                    self._invalidate_info(service)
+                    self._maybe_refresh(service)
             else:
                 self._show_toast(_("No changes made"))
                 dialog.close()
@@ -2960,7 +4044,7 @@ class MainWindow(Adw.ApplicationWindow):
         dialog.set_heading(_("Trust SSL Certificate?"))
         dialog.set_body(_("This will add the self-signed certificate for {name} to your system's trusted certificate store.\n\nAfter this, Chrome and other browsers will accept the certificate without warnings.\n\nYou may need to restart your browser.").format(name=server_name))
         
-        dialog.add_response("cancel", _("Cancel"))
+        dialog.add_response("cancel", _S.CANCEL)
         dialog.add_response("trust", _("Trust Certificate"))
         dialog.set_response_appearance("trust", Adw.ResponseAppearance.SUGGESTED)
         
@@ -2970,7 +4054,6 @@ class MainWindow(Adw.ApplicationWindow):
                 self._show_toast(_("Adding certificate to trust store..."))
                 
                 # Run in thread
-                import threading
                 def trust_task():
                     try:
                         success, message = service.trust_ssl_certificate(server_name)
@@ -2978,15 +4061,13 @@ class MainWindow(Adw.ApplicationWindow):
                             self._show_toast(message)
                             if success:
                                 parent_dialog.close()
-                                if self.current_service and self.current_service.name == service.name:
-                                    self._refresh_detail_page()
+                                self._maybe_refresh(service)
                         GLib.idle_add(update_ui)
                     except Exception as e:
                         logger.error(f"Error trusting certificate: {e}")
                         GLib.idle_add(self._show_toast, _("Error: {error}").format(error=str(e)))
                 
-                thread = threading.Thread(target=trust_task, daemon=True)
-                thread.start()
+                self._service_executor.submit(trust_task)
         
         dialog.connect("response", on_response)
         dialog.present()
@@ -2997,25 +4078,22 @@ class MainWindow(Adw.ApplicationWindow):
         dialog.set_heading(_("Delete {name}?").format(name=details.get('server_name', 'N/A')))
         dialog.set_body(_("This will permanently delete the virtual host configuration. The document root files will not be deleted."))
         
-        dialog.add_response("cancel", _("Cancel"))
-        dialog.add_response("delete", _("Delete"))
+        dialog.add_response("cancel", _S.CANCEL)
+        dialog.add_response("delete", _S.DELETE)
         dialog.set_response_appearance("delete", Adw.ResponseAppearance.DESTRUCTIVE)
-        
-        def on_response(dialog, response):
-            if response == "delete":
-                success, message = service.delete_vhost(details['filename'])
-                self._show_toast(message)
-                if success:
-                    dialog.close()
-                    parent_dialog.close()
-                    if self.current_service and self.current_service.name == service.name:
-                        self._refresh_detail_page()
-        
-        dialog.connect("response", on_response)
+
+        dialog._ctx = {
+            'service': service,
+            'filename': details['filename'],
+            'parent_dialog': parent_dialog,
+        }
+        dialog.connect("response", self._on_delete_vhost_response)
         dialog.present()
     
     def _on_refresh_clicked(self, button):
         """Refresh button clicked"""
+        # Elle yenilemede cache'lenmiş introspeksiyon sonuçları da atılır
+        self._info_cache.clear()
         self._load_services()
     
     # ==================== PHP EVENT HANDLERS ====================
@@ -3023,7 +4101,7 @@ class MainWindow(Adw.ApplicationWindow):
     def _on_php_install_version(self, service, available_versions):
         """Install new PHP version dialog"""
         # Filter out already installed versions
-        php_info = service.get_php_info()
+        php_info = self._cached_info(service, 'php_info', 5, service.get_php_info)
         installed_versions = set(php_info.get('installed_versions', []))
         installable_versions = [v for v in available_versions if v not in installed_versions]
         
@@ -3070,8 +4148,8 @@ class MainWindow(Adw.ApplicationWindow):
         scrolled.set_margin_top(12)
         
         dialog.set_extra_child(scrolled)
-        dialog.add_response("cancel", _("Cancel"))
-        dialog.add_response("install", _("Install"))
+        dialog.add_response("cancel", _S.CANCEL)
+        dialog.add_response("install", _S.INSTALL)
         dialog.set_response_appearance("install", Adw.ResponseAppearance.SUGGESTED)
         
         def on_response(dialog, response):
@@ -3089,8 +4167,7 @@ class MainWindow(Adw.ApplicationWindow):
                     except Exception as e:
                         GLib.idle_add(self._on_operation_complete, False, str(e))
                 
-                import threading
-                threading.Thread(target=install_thread, daemon=True).start()
+                self._service_executor.submit(install_thread)
         
         dialog.connect("response", on_response)
         dialog.present()
@@ -3101,52 +4178,18 @@ class MainWindow(Adw.ApplicationWindow):
         dialog.set_body(_("Select the PHP version to activate"))
         
         # Get current active version
-        php_info = service.get_php_info()
+        php_info = self._cached_info(service, 'php_info', 5, service.get_php_info)
         current_version = php_info.get('active_version')
         
         # Version selector
-        list_box = Gtk.ListBox()
-        list_box.set_selection_mode(Gtk.SelectionMode.SINGLE)
-        list_box.add_css_class("boxed-list")
-        
-        selected_version = [current_version]
-        
-        for version in installed_versions:
-            row = Gtk.ListBoxRow()
-            box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL)
-            box.set_spacing(12)
-            box.set_margin_top(8)
-            box.set_margin_bottom(8)
-            box.set_margin_start(12)
-            box.set_margin_end(12)
-            
-            label = Gtk.Label(label=f"PHP {version}")
-            label.set_hexpand(True)
-            label.set_halign(Gtk.Align.START)
-            box.append(label)
-            
-            if version == current_version:
-                check = Gtk.Image.new_from_icon_name("emblem-ok-symbolic")
-                check.add_css_class("success")
-                box.append(check)
-            
-            row.set_child(box)
-            row.version = version
-            list_box.append(row)
-        
-        def on_row_activated(listbox, row):
-            selected_version[0] = row.version
-        
-        list_box.connect("row-activated", on_row_activated)
-        
-        scrolled = Gtk.ScrolledWindow()
-        scrolled.set_child(list_box)
-        scrolled.set_min_content_height(200)
-        scrolled.set_margin_top(12)
-        
+        scrolled, selected_version = self._version_picker(
+            [(v, 'check' if v == current_version else None)
+             for v in installed_versions],
+            preselect=current_version)
+
         dialog.set_extra_child(scrolled)
-        dialog.add_response("cancel", _("Cancel"))
-        dialog.add_response("switch", _("Switch"))
+        dialog.add_response("cancel", _S.CANCEL)
+        dialog.add_response("switch", _S.SWITCH)
         dialog.set_response_appearance("switch", Adw.ResponseAppearance.SUGGESTED)
         
         def on_response(dialog, response):
@@ -3168,8 +4211,7 @@ class MainWindow(Adw.ApplicationWindow):
                     except Exception as e:
                         GLib.idle_add(self._on_operation_complete, False, str(e))
                 
-                import threading
-                threading.Thread(target=switch_thread, daemon=True).start()
+                self._service_executor.submit(switch_thread)
         
         dialog.connect("response", on_response)
         dialog.present()
@@ -3177,7 +4219,7 @@ class MainWindow(Adw.ApplicationWindow):
     def _on_php_uninstall_version(self, service, installed_versions):
         """Uninstall PHP version dialog"""
         # Get current active version
-        php_info = service.get_php_info()
+        php_info = self._cached_info(service, 'php_info', 5, service.get_php_info)
         current_version = php_info.get('active_version')
         
         # Filter out active version (can't uninstall active version)
@@ -3191,43 +4233,12 @@ class MainWindow(Adw.ApplicationWindow):
         dialog.set_body(_("Select a PHP version to uninstall. The active version cannot be uninstalled."))
         
         # Version selector
-        list_box = Gtk.ListBox()
-        list_box.set_selection_mode(Gtk.SelectionMode.SINGLE)
-        list_box.add_css_class("boxed-list")
-        
-        selected_version = [None]
-        
-        for version in uninstallable_versions:
-            row = Gtk.ListBoxRow()
-            box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL)
-            box.set_spacing(12)
-            box.set_margin_top(8)
-            box.set_margin_bottom(8)
-            box.set_margin_start(12)
-            box.set_margin_end(12)
-            
-            label = Gtk.Label(label=f"PHP {version}")
-            label.set_hexpand(True)
-            label.set_halign(Gtk.Align.START)
-            box.append(label)
-            
-            row.set_child(box)
-            row.version = version
-            list_box.append(row)
-        
-        def on_row_activated(listbox, row):
-            selected_version[0] = row.version
-        
-        list_box.connect("row-activated", on_row_activated)
-        
-        scrolled = Gtk.ScrolledWindow()
-        scrolled.set_child(list_box)
-        scrolled.set_min_content_height(200)
-        scrolled.set_margin_top(12)
-        
+        scrolled, selected_version = self._version_picker(
+            [(v, None) for v in uninstallable_versions])
+
         dialog.set_extra_child(scrolled)
-        dialog.add_response("cancel", _("Cancel"))
-        dialog.add_response("uninstall", _("Uninstall"))
+        dialog.add_response("cancel", _S.CANCEL)
+        dialog.add_response("uninstall", _S.UNINSTALL)
         dialog.set_response_appearance("uninstall", Adw.ResponseAppearance.DESTRUCTIVE)
         
         def on_response(dialog, response):
@@ -3238,8 +4249,8 @@ class MainWindow(Adw.ApplicationWindow):
                 # Confirmation dialog
                 confirm_dialog = Adw.MessageDialog.new(self, _("Confirm Uninstall"), None)
                 confirm_dialog.set_body(_("Are you sure you want to uninstall PHP {version}? This action cannot be undone.").format(version=version))
-                confirm_dialog.add_response("cancel", _("Cancel"))
-                confirm_dialog.add_response("uninstall", _("Uninstall"))
+                confirm_dialog.add_response("cancel", _S.CANCEL)
+                confirm_dialog.add_response("uninstall", _S.UNINSTALL)
                 confirm_dialog.set_response_appearance("uninstall", Adw.ResponseAppearance.DESTRUCTIVE)
                 
                 def on_confirm_response(dialog, response):
@@ -3256,8 +4267,7 @@ class MainWindow(Adw.ApplicationWindow):
                             except Exception as e:
                                 GLib.idle_add(self._on_operation_complete, False, str(e))
                         
-                        import threading
-                        threading.Thread(target=uninstall_thread, daemon=True).start()
+                        self._service_executor.submit(uninstall_thread)
                 
                 confirm_dialog.connect("response", on_confirm_response)
                 confirm_dialog.present()
@@ -3306,8 +4316,8 @@ class MainWindow(Adw.ApplicationWindow):
             form_box.append(flow_box)
         
         dialog.set_extra_child(form_box)
-        dialog.add_response("cancel", _("Cancel"))
-        dialog.add_response("install", _("Install"))
+        dialog.add_response("cancel", _S.CANCEL)
+        dialog.add_response("install", _S.INSTALL)
         dialog.set_response_appearance("install", Adw.ResponseAppearance.SUGGESTED)
         
         def on_response(dialog, response):
@@ -3333,8 +4343,7 @@ class MainWindow(Adw.ApplicationWindow):
                     except Exception as e:
                         GLib.idle_add(self._on_operation_complete, False, str(e))
                 
-                import threading
-                threading.Thread(target=install_thread, daemon=True).start()
+                self._service_executor.submit(install_thread)
         
         dialog.connect("response", on_response)
         dialog.present()
@@ -3346,7 +4355,7 @@ class MainWindow(Adw.ApplicationWindow):
         
         if not installed_extensions:
             dialog.set_body(_("No extensions found"))
-            dialog.add_response("ok", _("OK"))
+            dialog.add_response("ok", _S.OK)
             dialog.present()
             return
         
@@ -3383,7 +4392,7 @@ class MainWindow(Adw.ApplicationWindow):
                 uninstall_btn = Gtk.Button()
                 uninstall_btn.set_icon_name("edit-delete-symbolic")
                 uninstall_btn.add_css_class("destructive-action")
-                uninstall_btn.set_tooltip_text(_("Uninstall"))
+                uninstall_btn.set_tooltip_text(_S.UNINSTALL)
                 uninstall_btn.connect("clicked", lambda btn, ext=extension: self._on_php_uninstall_extension(service, ext, dialog))
                 box.append(uninstall_btn)
             
@@ -3396,7 +4405,7 @@ class MainWindow(Adw.ApplicationWindow):
         scrolled.set_margin_top(12)
         
         dialog.set_extra_child(scrolled)
-        dialog.add_response("close", _("Close"))
+        dialog.add_response("close", _S.CLOSE)
         dialog.present()
     
     def _on_php_uninstall_extension(self, service, extension, parent_dialog):
@@ -3404,8 +4413,8 @@ class MainWindow(Adw.ApplicationWindow):
         dialog = Adw.MessageDialog.new(parent_dialog, _("Uninstall Extension"), None)
         dialog.set_body(_("Are you sure you want to uninstall the {extension} extension?").format(extension=extension))
         
-        dialog.add_response("cancel", _("Cancel"))
-        dialog.add_response("uninstall", _("Uninstall"))
+        dialog.add_response("cancel", _S.CANCEL)
+        dialog.add_response("uninstall", _S.UNINSTALL)
         dialog.set_response_appearance("uninstall", Adw.ResponseAppearance.DESTRUCTIVE)
         
         def on_response(dialog, response):
@@ -3423,8 +4432,7 @@ class MainWindow(Adw.ApplicationWindow):
                     except Exception as e:
                         GLib.idle_add(self._on_operation_complete, False, str(e))
                 
-                import threading
-                threading.Thread(target=uninstall_thread, daemon=True).start()
+                self._service_executor.submit(uninstall_thread)
         
         dialog.connect("response", on_response)
         dialog.present()
@@ -3435,7 +4443,7 @@ class MainWindow(Adw.ApplicationWindow):
         
         if not databases:
             dialog.set_body(_("No user databases found. You can create your first database now."))
-            dialog.add_response("close", _("Close"))
+            dialog.add_response("close", _S.CLOSE)
             dialog.add_response("create", _("Create Database"))
             dialog.set_response_appearance("create", Adw.ResponseAppearance.SUGGESTED)
             
@@ -3462,7 +4470,7 @@ class MainWindow(Adw.ApplicationWindow):
             row.set_title(db_name)
             
             # Add database icon
-            db_icon = Gtk.Image.new_from_icon_name("server-database-symbolic")
+            db_icon = _icon("server-database-symbolic")
             row.add_prefix(db_icon)
             
             # Add delete button
@@ -3491,7 +4499,7 @@ class MainWindow(Adw.ApplicationWindow):
         main_box.append(scrolled)
         
         dialog.set_extra_child(main_box)
-        dialog.add_response("close", _("Close"))
+        dialog.add_response("close", _S.CLOSE)
         dialog.add_response("create", _("Create New"))
         dialog.set_response_appearance("create", Adw.ResponseAppearance.SUGGESTED)
         
@@ -3509,7 +4517,7 @@ class MainWindow(Adw.ApplicationWindow):
         
         if not users:
             dialog.set_body(_("No users found. You can create your first user now."))
-            dialog.add_response("close", _("Close"))
+            dialog.add_response("close", _S.CLOSE)
             dialog.add_response("create", _("Create User"))
             dialog.set_response_appearance("create", Adw.ResponseAppearance.SUGGESTED)
             
@@ -3537,7 +4545,7 @@ class MainWindow(Adw.ApplicationWindow):
             row.set_subtitle(f"Host: {user.get('host', 'localhost')}")
             
             # Add user icon
-            user_icon = Gtk.Image.new_from_icon_name("system-users-symbolic")
+            user_icon = _icon("system-users-symbolic")
             row.add_prefix(user_icon)
             
             # Show if it's a system user
@@ -3564,7 +4572,7 @@ class MainWindow(Adw.ApplicationWindow):
         main_box.append(scrolled)
         
         dialog.set_extra_child(main_box)
-        dialog.add_response("close", _("Close"))
+        dialog.add_response("close", _S.CLOSE)
         dialog.add_response("create", _("Create New"))
         dialog.set_response_appearance("create", Adw.ResponseAppearance.SUGGESTED)
         
@@ -3581,8 +4589,8 @@ class MainWindow(Adw.ApplicationWindow):
         confirm_dialog = Adw.MessageDialog.new(self, _("Delete Database"), None)
         confirm_dialog.set_body(f"Are you sure you want to delete database '{db_name}'?\n\nThis action cannot be undone!")
         
-        confirm_dialog.add_response("cancel", _("Cancel"))
-        confirm_dialog.add_response("delete", _("Delete"))
+        confirm_dialog.add_response("cancel", _S.CANCEL)
+        confirm_dialog.add_response("delete", _S.DELETE)
         confirm_dialog.set_response_appearance("delete", Adw.ResponseAppearance.DESTRUCTIVE)
         
         def on_confirm(dialog, response):
@@ -3591,8 +4599,11 @@ class MainWindow(Adw.ApplicationWindow):
                 dialog.close()
                 parent_dialog.close()
                 
-                # Check if we need sudo password
-                mysql_info = service.get_mysql_status_info()
+                # Check if we need sudo password - TTL cache'li bundle
+                # yeterli, auth yöntemi için ayrı mysql turu atılmaz
+                mysql_info = self._cached_info(
+                    service, 'mysql_status', 10, service.get_mysql_status_bundle
+                )
                 if mysql_info.get('auth_method') == 'Unix Socket (sudo mysql)':
                     # Need sudo password
                     def on_password_provided(sudo_password):
@@ -3615,8 +4626,7 @@ class MainWindow(Adw.ApplicationWindow):
                                 
                                 GLib.idle_add(handle_error)
                         
-                        import threading
-                        threading.Thread(target=delete_thread, daemon=True).start()
+                        self._service_executor.submit(delete_thread)
                     
                     self._show_sudo_password_dialog(on_password_provided)
                 else:
@@ -3640,8 +4650,7 @@ class MainWindow(Adw.ApplicationWindow):
                             
                             GLib.idle_add(handle_error)
                     
-                    import threading
-                    threading.Thread(target=delete_thread, daemon=True).start()
+                    self._service_executor.submit(delete_thread)
         
         confirm_dialog.connect("response", on_confirm)
         confirm_dialog.present()